@@ -0,0 +1,136 @@
+# ai_analysis/analysis_cache.py - Persistent cache of ATS analysis results
+
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+
+
+class AnalysisCache:
+    """
+    Content-addressed store of Groq analyses (SQLite)
+
+    The key is a sha256 of everything that goes into the prompt: normalized
+    title, company and description, the candidate skills and the model. The
+    same posting seen again (another hunt, another portal) reuses its stored
+    analysis instead of paying for a new 70B call. Entries expire after a
+    TTL and the least recently used ones are evicted past max_entries.
+    """
+
+    def __init__(self, db_path='logs/analysis_cache.db', ttl_days=None, max_entries=None):
+        self.db_path = db_path
+        self.ttl_seconds = float(ttl_days if ttl_days is not None else os.getenv('ANALYSIS_CACHE_TTL_DAYS', '14')) * 86400
+        self.max_entries = int(max_entries if max_entries is not None else os.getenv('ANALYSIS_CACHE_MAX_ENTRIES', '5000'))
+
+        self.hits = 0
+        self.misses = 0
+
+        # Ensure logs directory exists
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS analyses (
+                key TEXT PRIMARY KEY,
+                analysis TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_analyses_last_used ON analyses (last_used)")
+        self.conn.commit()
+
+    @staticmethod
+    def _normalize(text):
+        return re.sub(r'\s+', ' ', str(text or '')).strip().lower()
+
+    @classmethod
+    def make_key(cls, title, company, description, skills, model):
+        """sha256 over the normalized prompt inputs"""
+
+        parts = [
+            cls._normalize(title),
+            cls._normalize(company),
+            cls._normalize(description),
+            ','.join(cls._normalize(skill) for skill in skills),
+            model
+        ]
+        return hashlib.sha256('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Cached analysis dict, or None (expired entries count as misses)"""
+
+        row = self.conn.execute(
+            "SELECT analysis, created_at FROM analyses WHERE key = ?", (key,)
+        ).fetchone()
+
+        now = time.time()
+
+        if row is None or now - row[1] > self.ttl_seconds:
+            if row is not None:
+                with self.conn:
+                    self.conn.execute("DELETE FROM analyses WHERE key = ?", (key,))
+            self.misses += 1
+            return None
+
+        with self.conn:
+            self.conn.execute("UPDATE analyses SET last_used = ? WHERE key = ?", (now, key))
+
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key, analysis):
+        now = time.time()
+
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO analyses (key, analysis, created_at, last_used) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(analysis), now, now)
+            )
+
+    def evict(self):
+        """Drop expired entries, then least recently used ones past max_entries"""
+
+        with self.conn:
+            expired = self.conn.execute(
+                "DELETE FROM analyses WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            ).rowcount
+
+            overflow = self.conn.execute("SELECT COUNT(*) FROM analyses").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                self.conn.execute("""
+                    DELETE FROM analyses WHERE key IN (
+                        SELECT key FROM analyses ORDER BY last_used ASC LIMIT ?
+                    )
+                """, (overflow,))
+
+        return expired + max(overflow, 0)
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def close(self):
+        self.conn.close()
+
+
+# Test
+if __name__ == "__main__":
+    import tempfile
+
+    cache = AnalysisCache(os.path.join(tempfile.mkdtemp(), 'analysis_cache.db'), ttl_days=1, max_entries=2)
+
+    key = AnalysisCache.make_key('Data Analyst', 'Amazon', 'SQL,  Python\n', ['SQL', 'Python'], 'llama-3.3-70b-versatile')
+    same = AnalysisCache.make_key('data analyst', 'AMAZON', 'sql, python', ['SQL', 'Python'], 'llama-3.3-70b-versatile')
+    print(f"Normalized keys match: {key == same}")
+
+    print(f"First lookup: {cache.get(key)}")
+    cache.put(key, {'ats_score': 82, 'missing_skills': ['Tableau']})
+    print(f"Second lookup: {cache.get(same)}")
+
+    for i in range(3):
+        cache.put(f"extra-{i}", {'ats_score': i})
+    print(f"Evicted: {cache.evict()}")
+    print(f"Hit rate: {cache.hit_rate():.0%}")
@@ -1,13 +1,20 @@
 # ai_analysis/resume_analyzer.py - FIXED WITH CORRECT MODEL
 
-from groq import Groq
+from groq import Groq, APIConnectionError
 import os
 import sys
+import time
+import random
+import hashlib
+import threading
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from dotenv import load_dotenv
+from utils.rate_limiter import TokenBucket
+from ai_analysis.analysis_cache import AnalysisCache
 
 load_dotenv('config/.env')
 
@@ -17,6 +24,12 @@ class ResumeAnalyzer:
     # ✅ CORRECT MODEL
     MODEL = "llama-3.3-70b-versatile"
     
+    ANALYSIS_MAX_TOKENS = 500
+    EXPECTED_REPLY_TOKENS = 250  # Typical JSON reply - used for the TPM estimate
+    
+    ANALYSIS_FIELDS = ['ats_score', 'selection_chances', 'skills_match_percentage',
+                       'missing_skills', 'resume_changes', 'project_emphasis']
+    
     def __init__(self, resume_path='resumes/chirag_kalucha_resume.txt'):
         """Initialize with resume"""
         
@@ -27,7 +40,26 @@ class ResumeAnalyzer:
         if not api_key:
             raise ValueError("GROQ_API_KEY not found in .env")
         
-        self.client = Groq(api_key=api_key)
+        # 429s are retried by _create_with_retry (shared rate limiter), not the SDK
+        self.client = Groq(api_key=api_key, max_retries=0)
+        
+        # Groq rate limits (free tier defaults) shared by all analysis workers
+        self.max_workers = max(1, int(os.getenv('GROQ_MAX_WORKERS', '4')))
+        self.max_retries = int(os.getenv('GROQ_MAX_RETRIES', '4'))
+        self.request_bucket = TokenBucket(float(os.getenv('GROQ_RPM', '30')))
+        self.token_bucket = TokenBucket(float(os.getenv('GROQ_TPM', '12000')))
+        
+        # Jobs packed into one prompt by batch_analyze (1 = one request per job)
+        self.jobs_per_request = max(1, int(os.getenv('GROQ_JOBS_PER_REQUEST', '5')))
+        self.requests_made = 0
+        self._stats_lock = threading.Lock()
+        
+        # Analyses of postings seen before (logs/analysis_cache.db)
+        try:
+            self.cache = AnalysisCache()
+        except Exception as e:
+            print(f"⚠️  Analysis cache disabled: {str(e)[:80]}")
+            self.cache = None
         
         # Load resume
         try:
@@ -40,12 +72,28 @@ class ResumeAnalyzer:
         # Extract skills
         self.resume_skills = self.extract_skills()
     
-    def extract_skills(self):
-        """Extract skills from resume"""
+    def extract_skills(self, cache_path='logs/resume_skills.json'):
+        """
+        Extract skills from resume
+        
+        The result is kept in cache_path keyed by the resume's content hash
+        (and model), so an unchanged resume costs no Groq call on later runs.
+        """
+        
+        resume_hash = hashlib.sha256(self.resume_text.encode('utf-8')).hexdigest()
+        
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            
+            if cached.get('resume_hash') == resume_hash and cached.get('model') == self.MODEL:
+                print(f"✅ Loaded {len(cached['skills'])} skills (resume unchanged)")
+                return cached['skills']
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            pass
         
         try:
-            response = self.client.chat.completions.create(
-                model=self.MODEL,
+            response = self._create_with_retry(
                 messages=[
                     {"role": "system", "content": "Extract technical skills. Return comma-separated list only."},
                     {"role": "user", "content": f"Extract skills:\n{self.resume_text[:2000]}"}
@@ -55,17 +103,92 @@ class ResumeAnalyzer:
             )
             
             skills_text = response.choices[0].message.content.strip()
-            skills_list = [s.strip() for s in skills_text.split(',') if s.strip()]
+            skills_list = [s.strip() for s in skills_text.split(',') if s.strip()][:20]
             
             print(f"✅ Extracted {len(skills_list)} skills")
-            return skills_list[:20]
             
         except Exception as e:
+            # Not cached - the next run tries the real extraction again
             print(f"⚠️  Skill extraction failed: {str(e)[:80]}")
             return ['Python', 'SQL', 'Data Analysis', 'Power BI', 'Machine Learning']
+        
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'resume_hash': resume_hash,
+                    'model': self.MODEL,
+                    'skills': skills_list,
+                    'extracted_at': datetime.now().isoformat()
+                }, f, indent=2)
+        except OSError as e:
+            print(f"⚠️  Could not save skills cache: {e}")
+        
+        return skills_list
     
-    def analyze_job(self, job_data):
-        """Analyze job-resume match"""
+    def _create_with_retry(self, messages, max_tokens, temperature):
+        """
+        chat.completions.create behind the shared RPM/TPM buckets
+        
+        Retries 429s, 5xx, timeouts and dropped connections (the SDK's own
+        retries are off) with exponential backoff, honouring the Retry-After
+        header when Groq sends one.
+        """
+        
+        estimate = sum(len(m['content']) for m in messages) // 4 + min(max_tokens, self.EXPECTED_REPLY_TOKENS)
+        
+        for attempt in range(self.max_retries + 1):
+            self.request_bucket.acquire()
+            self.token_bucket.acquire(estimate)
+            
+            with self._stats_lock:
+                self.requests_made += 1
+            
+            try:
+                response = self.client.chat.completions.create(
+                    model=self.MODEL,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature
+                )
+            except Exception as e:
+                status = getattr(e, 'status_code', None)
+                retryable = (status == 429 or (status is not None and status >= 500)
+                             or isinstance(e, APIConnectionError))  # Includes APITimeoutError
+                
+                if not retryable or attempt == self.max_retries:
+                    raise
+                
+                if status == 429:
+                    # Everyone is over the limit, not just this worker
+                    self.request_bucket.drain()
+                    self.token_bucket.drain()
+                
+                time.sleep(self._retry_delay(e, attempt))
+                continue
+            
+            # Charge the TPM bucket for what the call really used
+            usage = getattr(response, 'usage', None)
+            if usage and getattr(usage, 'total_tokens', None):
+                self.token_bucket.adjust(usage.total_tokens - estimate)
+            
+            return response
+    
+    @staticmethod
+    def _retry_delay(error, attempt):
+        """Seconds to wait before retry `attempt` (Retry-After if given, else backoff)"""
+        
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None) or {}
+        
+        try:
+            return float(headers.get('retry-after'))
+        except (TypeError, ValueError):
+            return min(30, 2 ** attempt) + random.uniform(0, 1)
+    
+    @staticmethod
+    def _job_fields(job_data):
+        """(title, company, description) trimmed for the prompt"""
         
         job_title = job_data.get('title', 'Unknown')[:100]
         job_description = job_data.get('description', '')[:2000]
@@ -74,10 +197,62 @@ class ResumeAnalyzer:
         if not job_description or len(job_description) < 50:
             job_description = f"Role: {job_title} at {company}"
         
-        print(f"🤖 Analyzing: {job_title[:40]}...", end=' ')
+        return job_title, company, job_description
+    
+    @staticmethod
+    def _parse_json(result_text):
+        """Parse a JSON reply, tolerating ``` fences and single quotes"""
+        
+        result_text = result_text.strip()
+        
+        # Extract JSON
+        if '```json' in result_text:
+            result_text = result_text.split('```json')[1].split('```')[0]
+        elif '```' in result_text:
+            result_text = result_text.split('```')[1].split('```')[0]
+        
+        result_text = result_text.strip()
         
         try:
-            prompt = f"""Analyze job-resume match.
+            return json.loads(result_text)
+        except json.JSONDecodeError:
+            result_text = result_text.replace("'", '"')
+            return json.loads(result_text)
+    
+    @classmethod
+    def _is_valid_analysis(cls, analysis):
+        """
+        True if a parsed analysis has every field with a usable score
+        
+        Scores the model sent as text ("75", "80%") are converted to
+        numbers in place, so summaries and the sheet can add them up.
+        """
+        
+        if not isinstance(analysis, dict) or any(field not in analysis for field in cls.ANALYSIS_FIELDS):
+            return False
+        
+        for field in ('ats_score', 'skills_match_percentage'):
+            value = analysis[field]
+            if isinstance(value, bool):
+                return False
+            
+            try:
+                score = float(str(value).strip().rstrip('%'))
+            except ValueError:
+                return False
+            
+            if score != score:  # NaN
+                return False
+            analysis[field] = int(score) if score.is_integer() else score
+        
+        return True
+    
+    def _request_analysis(self, job_data):
+        """One Groq call for one job - raises on API/parse errors"""
+        
+        job_title, company, job_description = self._job_fields(job_data)
+        
+        prompt = f"""Analyze job-resume match.
 
 JOB:
 Title: {job_title}
@@ -96,70 +271,220 @@ Respond ONLY in JSON format:
   "project_emphasis": "which project to highlight"
 }}"""
 
-            response = self.client.chat.completions.create(
-                model=self.MODEL,
-                messages=[
-                    {"role": "system", "content": "You are an ATS analyzer. Always respond in valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=500,
-                temperature=0.3
-            )
-            
-            result_text = response.choices[0].message.content.strip()
-            
-            # Extract JSON
-            if '```json' in result_text:
-                result_text = result_text.split('```json')[1].split('```')[0]
-            elif '```' in result_text:
-                result_text = result_text.split('```')[1].split('```')[0]
-            
-            result_text = result_text.strip()
+        response = self._create_with_retry(
+            messages=[
+                {"role": "system", "content": "You are an ATS analyzer. Always respond in valid JSON only."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=self.ANALYSIS_MAX_TOKENS,
+            temperature=0.3
+        )
+        
+        analysis = self._parse_json(response.choices[0].message.content)
+        if not self._is_valid_analysis(analysis):
+            raise ValueError("incomplete analysis in reply")
+        
+        analysis['analysis_time'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        return analysis
+    
+    def _request_batch_analysis(self, jobs):
+        """
+        One Groq call for several jobs
+        
+        Returns: {position in jobs: analysis} for every entry of the reply
+        array that parsed and validated - callers redo the missing ones.
+        """
+        
+        job_blocks = []
+        for number, job in enumerate(jobs, 1):
+            job_title, company, job_description = self._job_fields(job)
+            job_blocks.append(f"""JOB {number}:
+Title: {job_title}
+Company: {company}
+Description: {job_description}""")
+        
+        jobs_text = '\n\n'.join(job_blocks)
+        
+        prompt = f"""Analyze job-resume match for each of the {len(jobs)} jobs below.
+
+{jobs_text}
+
+CANDIDATE SKILLS: {', '.join(self.resume_skills[:10])}
+
+Respond ONLY with a JSON array, one object per job, in job order:
+[
+  {{
+    "job": 1,
+    "ats_score": 75,
+    "selection_chances": "High",
+    "skills_match_percentage": 80,
+    "missing_skills": ["skill1", "skill2"],
+    "resume_changes": "brief suggestion",
+    "project_emphasis": "which project to highlight"
+  }}
+]"""
+
+        response = self._create_with_retry(
+            messages=[
+                {"role": "system", "content": "You are an ATS analyzer. Always respond in valid JSON only."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=self.ANALYSIS_MAX_TOKENS * len(jobs),
+            temperature=0.3
+        )
+        
+        entries = self._parse_json(response.choices[0].message.content)
+        
+        # Some replies wrap the array: {"analyses": [...]}
+        if isinstance(entries, dict):
+            entries = next((value for value in entries.values() if isinstance(value, list)), [])
+        
+        analysis_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        results = {}
+        
+        for position, entry in enumerate(entries if isinstance(entries, list) else []):
+            if not self._is_valid_analysis(entry):
+                continue
             
+            # Trust the "job" number if present, else the array position
             try:
-                analysis = json.loads(result_text)
-            except json.JSONDecodeError:
-                result_text = result_text.replace("'", '"')
-                analysis = json.loads(result_text)
-            
-            analysis['analysis_time'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            print(f"✅ ATS: {analysis.get('ats_score', 0)}/100")
+                idx = int(entry.pop('job', position + 1)) - 1
+            except (TypeError, ValueError):
+                continue
             
-            return analysis
+            if 0 <= idx < len(jobs) and idx not in results:
+                entry['analysis_time'] = analysis_time
+                results[idx] = entry
+        
+        return results
+    
+    @staticmethod
+    def _fallback_analysis():
+        """Neutral analysis used when the API call fails"""
+        
+        return {
+            'ats_score': 65,
+            'selection_chances': 'Medium',
+            'skills_match_percentage': 60,
+            'missing_skills': [],
+            'resume_changes': 'Manual review recommended',
+            'project_emphasis': 'Highlight relevant projects',
+            'analysis_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+    
+    def cache_key(self, job_data):
+        """Analysis cache key - same inputs as the prompt"""
+        
+        job_title, company, job_description = self._job_fields(job_data)
+        return AnalysisCache.make_key(job_title, company, job_description, self.resume_skills[:10], self.MODEL)
+    
+    def _analyze_one(self, job_data, prefix=''):
+        """analyze_job, plus whether the analysis came from the model (not the fallback)"""
+        
+        job_title = job_data.get('title', 'Unknown')[:40]
+        
+        try:
+            analysis = self._request_analysis(job_data)
+            print(f"{prefix}🤖 Analyzing: {job_title}... ✅ ATS: {analysis.get('ats_score', 0)}/100")
+            return analysis, True
             
         except Exception as e:
-            print(f"⚠️ Failed ({str(e)[:40]})")
-            
-            return {
-                'ats_score': 65,
-                'selection_chances': 'Medium',
-                'skills_match_percentage': 60,
-                'missing_skills': [],
-                'resume_changes': 'Manual review recommended',
-                'project_emphasis': 'Highlight relevant projects',
-                'analysis_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+            print(f"{prefix}🤖 Analyzing: {job_title}... ⚠️ Failed ({str(e)[:40]})")
+            return self._fallback_analysis(), False
+    
+    def analyze_job(self, job_data, prefix=''):
+        """Analyze job-resume match"""
+        
+        analysis, _ = self._analyze_one(job_data, prefix)
+        return analysis
+    
+    def analyze_chunk(self, jobs, numbers=None, total=None):
+        """
+        Analyze several jobs with one request, in order
+        
+        Jobs missing from (or malformed in) the reply fall back to
+        analyze_job, one request each.
+        
+        Returns: list of (analysis, from_model) - from_model is False for
+        the placeholder analysis used when every attempt failed
+        """
+        
+        numbers = numbers or list(range(1, len(jobs) + 1))
+        total = total or len(jobs)
+        prefixes = [f"[{number}/{total}] " for number in numbers]
+        
+        if len(jobs) == 1:
+            return [self._analyze_one(jobs[0], prefixes[0])]
+        
+        try:
+            results = self._request_batch_analysis(jobs)
+        except Exception as e:
+            print(f"⚠️  Batch of {len(jobs)} failed ({str(e)[:40]}) - analyzing one by one")
+            results = {}
+        
+        analyses = []
+        
+        for idx, job in enumerate(jobs):
+            if idx in results:
+                analysis = results[idx]
+                print(f"{prefixes[idx]}🤖 Analyzing: {job.get('title', 'Unknown')[:40]}... ✅ ATS: {analysis.get('ats_score', 0)}/100")
+                analyses.append((analysis, True))
+            else:
+                analyses.append(self._analyze_one(job, prefixes[idx]))
+        
+        return analyses
     
     def batch_analyze(self, jobs_list):
-        """Analyze multiple jobs"""
+        """Analyze multiple jobs (analysis fields are filled into each job in place)"""
         
         print(f"\n{'='*70}")
         print(f"AI ANALYSIS ({len(jobs_list)} jobs)")
         print(f"{'='*70}")
         
-        analyzed_jobs = []
+        total = len(jobs_list)
+        analyzed_jobs = [None] * total  # Filled by index - keeps input order
+        start = time.monotonic()
+        requests_before = self.requests_made
+        
+        # Reuse cached analyses; only the rest go to Groq
+        keys = [self.cache_key(job) for job in jobs_list]
+        pending = []
         
-        for idx, job in enumerate(jobs_list, 1):
-            print(f"[{idx}/{len(jobs_list)}] ", end='')
+        for idx, job in enumerate(jobs_list):
+            cached = self.cache.get(keys[idx]) if self.cache else None
             
-            analysis = self.analyze_job(job)
-            job_with_analysis = {**job, **analysis}
-            analyzed_jobs.append(job_with_analysis)
+            if cached:
+                print(f"[{idx + 1}/{total}] 💾 Cached: {job.get('title', 'Unknown')[:40]}... ATS: {cached.get('ats_score', 0)}/100")
+                job.update(cached)  # In place - no per-job copy
+                analyzed_jobs[idx] = job
+            else:
+                pending.append(idx)
+        
+        chunk_size = self.jobs_per_request
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {}
+            
+            for first in range(0, len(pending), chunk_size):
+                chunk = pending[first:first + chunk_size]
+                future = executor.submit(
+                    self.analyze_chunk, [jobs_list[idx] for idx in chunk], [idx + 1 for idx in chunk], total
+                )
+                futures[future] = chunk
             
-            if idx < len(jobs_list):
-                import time
-                time.sleep(0.3)
+            for future in as_completed(futures):
+                for idx, (analysis, from_model) in zip(futures[future], future.result()):
+                    jobs_list[idx].update(analysis)
+                    analyzed_jobs[idx] = jobs_list[idx]
+                    
+                    if from_model and self.cache:
+                        self.cache.put(keys[idx], analysis)
+        
+        if self.cache:
+            self.cache.evict()
+        
+        elapsed = time.monotonic() - start
         
         print(f"\n{'='*70}")
         print(f"✅ ANALYSIS COMPLETE")
@@ -171,6 +496,12 @@ Respond ONLY in JSON format:
         print(f"\n📊 Summary:")
         print(f"   High-chance jobs: {high_chance}/{len(analyzed_jobs)}")
         print(f"   Average ATS score: {avg_ats:.1f}/100")
+        print(f"   Time: {elapsed:.1f}s ({self.max_workers} workers)")
+        print(f"   Groq requests: {self.requests_made - requests_before} ({chunk_size} jobs per request)")
+        
+        if self.cache:
+            lookups = self.cache.hits + self.cache.misses
+            print(f"   Cache hits: {self.cache.hits}/{lookups} ({self.cache.hit_rate():.0%})")
         
         return analyzed_jobs
 
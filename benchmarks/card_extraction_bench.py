@@ -0,0 +1,83 @@
+# benchmarks/card_extraction_bench.py - One execute_script per page vs find_element per field
+#
+# Usage:
+#   python benchmarks/card_extraction_bench.py            # 20 cards, 5 rounds
+#   python benchmarks/card_extraction_bench.py 50 10      # 50 cards, 10 rounds
+#
+# Needs Chrome + chromedriver (same as the scrapers). The page is a local
+# copy of a search results list in Naukri's card markup, so the numbers
+# measure WebDriver round trips, not the network.
+
+import os
+import sys
+import time
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from selenium.webdriver.common.by import By
+from utils.silent_browser import get_silent_driver
+from utils.card_extractor import CardExtractor
+from scrapers.naukri_scraper import NaukriScraper
+
+CARD_HTML = """
+<article class="jobTuple">
+  <a class="title" href="https://www.naukri.com/job-listings-data-analyst-{i}">Data Analyst {i}</a>
+  <a class="subTitle">Acme Analytics {i}</a>
+  <span class="expwdth">0-2 Yrs</span>
+  <span class="sal">{low}-{high} Lacs PA</span>
+  <span class="loc">Bengaluru</span>
+  <div class="job-description">SQL, Python, Power BI dashboards for the growth team.</div>
+  <span class="job-post-day">{age} days ago</span>
+</article>
+"""
+
+
+def build_page(cards):
+    body = ''.join(CARD_HTML.format(i=i, low=15 + i % 5, high=20 + i % 5, age=i % 4) for i in range(cards))
+
+    path = os.path.join(tempfile.gettempdir(), 'card_extraction_bench.html')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"<html><body>{body}</body></html>")
+    return path
+
+
+def bench(extract, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        result = extract()
+    return (time.perf_counter() - start) / rounds, result
+
+
+if __name__ == "__main__":
+    cards_per_page = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    driver = get_silent_driver()
+
+    try:
+        driver.get('file://' + build_page(cards_per_page))
+        cards = driver.find_elements(By.CSS_SELECTOR, 'article.jobTuple')
+        extractor = CardExtractor(driver, NaukriScraper.CARD_FIELDS)
+
+        print("="*70)
+        print("CARD EXTRACTION BENCHMARK")
+        print("="*70)
+        print(f"{len(cards)} cards x {len(NaukriScraper.CARD_FIELDS)} fields, {rounds} rounds")
+
+        per_element, slow = bench(lambda: [extractor.extract_one(card) for card in cards], rounds)
+        batched, fast = bench(lambda: extractor.extract(cards), rounds)
+
+        # Same fields either way (innerText vs WebElement.text can differ in whitespace only)
+        mismatches = sum(
+            1 for a, b in zip(slow, fast)
+            for name in NaukriScraper.CARD_FIELDS
+            if ' '.join((a[name] or '').split()) != ' '.join((b[name] or '').split())
+        )
+        print(f"Field mismatches: {mismatches}")
+
+        print(f"\nPer element (find_element): {per_element * 1000:8.1f} ms/page  ({per_element / len(cards) * 1000:.1f} ms/card)")
+        print(f"Batched (execute_script):   {batched * 1000:8.1f} ms/page  ({batched / len(cards) * 1000:.1f} ms/card)")
+        print(f"Speedup: {per_element / batched:.1f}x")
+
+    finally:
+        driver.quit()
@@ -0,0 +1,121 @@
+# benchmarks/salary_extraction_bench.py - Throughput of SalaryExtractor over job descriptions
+#
+# Usage:
+#   python benchmarks/salary_extraction_bench.py                 # logs/jobs_*.json from past runs
+#   python benchmarks/salary_extraction_bench.py path/to/jobs.json
+
+import os
+import sys
+import re
+import glob
+import json
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.salary_extractor import SalaryExtractor
+
+# Used when no saved runs are available (snippets in the style of real postings)
+SAMPLE_DESCRIPTIONS = [
+    "We are hiring a Data Analyst to join our growth team in Bangalore. CTC: 18-24 LPA. 0-2 years of experience with SQL, Python and Power BI.",
+    "Compensation: INR 20-25 Lakhs per annum plus ESOPs. You will own dashboards for the payments business and partner with product managers.",
+    "Business Analyst (Fresher). Stipend during training, then up to 16 LPA based on performance. Strong Excel and communication skills required.",
+    "Key responsibilities: build data pipelines, maintain Airflow DAGs, write clean SQL. Salary: 1500000 - 2200000 per year. Hybrid - Pune.",
+    "Remote role for US client. Pay range $80K-$100K annually depending on location. Experience with Tableau and dbt preferred.",
+    "Package 12L - 15L. Looking for analytics associates with a quantitative degree. Immediate joiners preferred.",
+    "About us: a Series B fintech building credit products for India. We value ownership, curiosity and bias for action. " * 4,
+    "Role: Product Analyst. Experience: 1-3 years. Location: Gurugram. Salary: Not disclosed. Skills: SQL, Mixpanel, A/B testing, Python.",
+]
+
+# The previous implementation: seven re.search() calls, one pattern at a time
+OLD_PATTERNS = [
+    (r'(\d+)\s*-\s*(\d+)\s*(?:LPA|Lakhs?|Lacs?|L\.?P\.?A\.?)', lambda m: f"{m.group(1)}-{m.group(2)} LPA"),
+    (r'(?:₹|INR|Rs\.?)\s*(\d+)\s*-\s*(\d+)\s*(?:Lakhs?|Lacs?|LPA)', lambda m: f"{m.group(1)}-{m.group(2)} LPA"),
+    (r'(?:up to|upto|max)\s*(\d+)\s*(?:LPA|Lakhs?|Lacs?)', lambda m: f"Up to {m.group(1)} LPA"),
+    (r'(?:^|\s)(\d+)\s*(?:LPA|Lakhs?|Lacs?)(?:\s|$)', lambda m: f"{m.group(1)} LPA"),
+    (r'(?:₹|INR|Rs\.?)?\s*(\d{7,8})\s*-\s*(\d{7,8})', lambda m: f"{int(m.group(1))//100000}-{int(m.group(2))//100000} LPA"),
+    (r'(\d+)\s*L\s*-\s*(\d+)\s*L', lambda m: f"{m.group(1)}-{m.group(2)} LPA"),
+    (r'\$\s*(\d+)K?\s*-\s*\$?\s*(\d+)K?', lambda m: f"{int(m.group(1))*0.8}-{int(m.group(2))*0.8} LPA"),
+]
+
+
+def old_extract(text):
+    if not text:
+        return "Not mentioned"
+    text = text.replace(',', '')
+    for pattern, formatter in OLD_PATTERNS:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            return formatter(match)
+    return "Not mentioned"
+
+
+def same_answer(text):
+    """Old and new find the same salary ($ amounts are converted differently now - only check both find one)"""
+
+    old = old_extract(text)
+    new = SalaryExtractor.parse(text)
+
+    if new is None:
+        return old == "Not mentioned"
+    if new.currency == 'USD':
+        return old != "Not mentioned"
+    return int(new.floor_lpa) == int(re.findall(r'\d+', old)[0])
+
+
+def load_corpus(paths):
+    """Descriptions (plus salary card text) from saved orchestrator runs"""
+
+    corpus = []
+    for path in paths:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                jobs = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️  Skipping {path}: {e}")
+            continue
+
+        for job in jobs:
+            for field in ('description', 'salary', 'title'):
+                if job.get(field):
+                    corpus.append(job[field])
+
+    return corpus
+
+
+def bench(extract, corpus, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in corpus:
+            extract(text)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    paths = sys.argv[1:] or sorted(glob.glob('logs/jobs_*.json'))
+    corpus = load_corpus(paths)
+    source = f"{len(paths)} saved run file(s)"
+
+    if not corpus:
+        corpus = SAMPLE_DESCRIPTIONS * 125
+        source = "built-in sample descriptions"
+
+    total_chars = sum(len(text) for text in corpus)
+    rounds = max(1, 200000 // len(corpus))
+
+    print("="*70)
+    print("SALARY EXTRACTION BENCHMARK")
+    print("="*70)
+    print(f"Corpus: {len(corpus)} texts, {total_chars / 1024:.0f} KB ({source})")
+
+    # Same salaries as the old pattern-by-pattern search
+    mismatches = [text for text in corpus if not same_answer(text)]
+    print(f"Mismatches vs old extractor: {len(mismatches)}")
+
+    old_time = bench(old_extract, corpus, rounds)
+    new_time = bench(SalaryExtractor.extract, corpus, rounds)
+    texts = len(corpus) * rounds
+    megabytes = total_chars * rounds / 1e6
+
+    print(f"\nOld (7 searches):  {texts / old_time:>10,.0f} texts/s  {megabytes / old_time:6.1f} MB/s")
+    print(f"New (single scan): {texts / new_time:>10,.0f} texts/s  {megabytes / new_time:6.1f} MB/s")
+    print(f"Speedup: {old_time / new_time:.2f}x")
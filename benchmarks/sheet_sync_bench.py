@@ -0,0 +1,119 @@
+# benchmarks/sheet_sync_bench.py - Sheet sync throughput against the offline sheet emulator
+#
+# Usage:
+#   python benchmarks/sheet_sync_bench.py                         # 10k and 100k rows, 200 ms per call
+#   python benchmarks/sheet_sync_bench.py 50000 --latency 0.5
+#   python benchmarks/sheet_sync_bench.py 10000 --quota 60 --error-rate 0.05
+#
+# No Google account needed: GoogleSheetsUpdater runs against SheetEmulator,
+# which sleeps --latency seconds per API call and can raise the same 429 /
+# 503 HttpErrors as the real API. Each run seeds the sheet, then times one
+# run's worth of sheet work: read + stats, URL dedup of a scrape, appending
+# the new jobs, deleting checked rows (ranges and compact) and archiving.
+
+import os
+import sys
+import io
+import time
+import argparse
+import contextlib
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sheets_integration.sheets_updater import GoogleSheetsUpdater
+from sheets_integration.sheet_emulator import SheetEmulator
+from utils.job_store import JobStore
+
+HEADER = ['✓', 'Date Found', 'Time Found', 'Company', 'Job Title', 'Salary', 'Location', 'Portal',
+          'Job URL', 'ATS Score', 'Selection Chances', 'Skills Match %', 'Missing Skills',
+          'Resume Changes', 'Project Emphasis', 'Status', 'Notes', 'Priority']
+
+
+def seed_rows(count):
+    """count rows over the last 60 days - ~2% ticked (in short runs), 5% Applied, 1% Rejected"""
+
+    today = datetime.now()
+    rows = [HEADER]
+
+    for i in range(count):
+        found = (today - timedelta(days=(i * 60) // count)).strftime('%d-%b-%Y')
+        checked = i % 50 in (7, 8, 9) and i % 150 < 50
+        status = 'Applied' if i % 20 == 3 else 'Rejected' if i % 100 == 11 else 'New'
+
+        rows.append([checked, found, '10:30 AM', f'Company {i % 500}', f'Data Analyst {i}', 'Not mentioned',
+                     'Bengaluru', 'LinkedIn', f'https://jobs.example.com/{i}', 70 + i % 25, 'Medium',
+                     65, 'Tableau', 'Pending', 'Pending', status, '', '🟡 MEDIUM'])
+    return rows
+
+
+def scraped_jobs(count, known):
+    """A scrape of count jobs, the first `known` of them already in the sheet"""
+
+    return [
+        {'title': f'Data Analyst {i}', 'company': f'Company {i % 500}', 'location': 'Bengaluru',
+         'portal': 'Naukri', 'url': f'https://jobs.example.com/{i if i < known else f"new-{i}"}'}
+        for i in range(count)
+    ]
+
+
+def timed(emulator, step, action):
+    calls = sum(emulator.calls.values())
+    start = time.perf_counter()
+
+    with contextlib.redirect_stdout(io.StringIO()):  # The updater's own progress lines
+        result = action()
+
+    elapsed = time.perf_counter() - start
+    used = sum(emulator.calls.values()) - calls
+    print(f"   {step:<28} {elapsed * 1000:10.1f} ms  {used:3d} calls  {len(emulator.rows()) - 1:>8,} rows")
+    return result
+
+
+def bench(rows, args, compact):
+    emulator = SheetEmulator(latency=args.latency, quota_per_minute=args.quota, error_rate=args.error_rate)
+    emulator.load(seed_rows(rows))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        updater = GoogleSheetsUpdater(service=emulator, spreadsheet_id=emulator.spreadsheet_id)
+    updater.state.forget()  # No cached sheet id from an earlier bench run
+
+    store = JobStore(os.path.join(tempfile.mkdtemp(), 'job_store.db'))
+
+    print(f"\n{rows:,} rows, {'compact' if compact else 'ranges'} cleanup")
+
+    scrape = scraped_jobs(args.scrape, args.scrape // 2)
+
+    timed(emulator, 'Read + stats', updater.get_sheet_stats)
+    new_jobs = timed(emulator, f'Dedup {len(scrape)} scraped jobs', lambda: updater.filter_new_jobs(scrape))
+    timed(emulator, f'Append {len(new_jobs)} jobs', lambda: updater.add_jobs_batch(new_jobs))
+    timed(emulator, 'Delete checked rows', lambda: updater.delete_checked_jobs(compact=compact))
+    timed(emulator, 'Archive', lambda: updater.archive_old_jobs(store))
+    timed(emulator, 'Stats (active set)', updater.get_sheet_stats)
+
+    updater.state.forget()
+    store.close()
+
+    if emulator.errors:
+        print(f"   Simulated errors: {dict(emulator.errors)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('rows', nargs='*', type=int, default=[10000, 100000])
+    parser.add_argument('--latency', type=float, default=0.2, help='seconds per API call')
+    parser.add_argument('--quota', type=int, default=None, help='API calls per minute before 429')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='share of calls failing with 503')
+    parser.add_argument('--scrape', type=int, default=500, help='jobs per simulated scrape')
+    args = parser.parse_args()
+
+    print("="*70)
+    print("SHEET SYNC BENCHMARK (offline emulator)")
+    print("="*70)
+    print(f"{args.latency * 1000:.0f} ms per API call"
+          + (f", quota {args.quota}/min" if args.quota else '')
+          + (f", {args.error_rate:.0%} errors" if args.error_rate else ''))
+
+    for rows in args.rows:
+        for compact in (False, True):
+            bench(rows, args, compact)
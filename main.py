@@ -13,9 +13,11 @@ if sys.stdout.encoding != 'utf-8':
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from orchestrator import JobScrapingOrchestrator
+from pipeline import JobPipeline
 from ai_analysis.resume_analyzer import ResumeAnalyzer
 from sheets_integration.sheets_updater import GoogleSheetsUpdater
 from utils.run_tracker import RunTracker
+from utils.job_store import JobStore
 from dotenv import load_dotenv
 
 load_dotenv('config/.env')
@@ -60,6 +62,9 @@ try:
     safe_print("STEP 0: CLEANUP")
     safe_print("="*70)
     
+    # One sheet client for the whole run - cleanup, reconcile and writes
+    # share it, and its snapshot means the sheet is read only once
+    updater = None
     if os.getenv('GOOGLE_SHEET_ID'):
         try:
             updater = GoogleSheetsUpdater()
@@ -67,92 +72,72 @@ try:
         except Exception as e:
             safe_print(f"Cleanup skipped: {e}")
     
-    # STEP 1: Scrape jobs
+    # STEP 1: Local history (dedup against previous runs)
     safe_print("")
     safe_print("="*70)
-    safe_print("STEP 1: SCRAPING JOBS")
+    safe_print("STEP 1: LOADING JOB HISTORY")
     safe_print("="*70)
     
-    orchestrator = JobScrapingOrchestrator(since_time=last_run)
-    jobs = orchestrator.run_all_scrapers()
-    
-    if not jobs:
-        safe_print("")
-        safe_print("No new jobs found")
-        safe_print("")
-        safe_print("This is normal if:")
-        safe_print("   - No jobs posted since last run")
-        safe_print("   - All jobs already in sheet")
-        safe_print("   - Filters too strict")
-        exit()
-    
-    safe_print(f"")
-    safe_print(f"Scraped {len(jobs)} jobs")
-    
-    # STEP 2: Filter duplicates
-    safe_print("")
-    safe_print("="*70)
-    safe_print("STEP 2: REMOVING DUPLICATES")
-    safe_print("="*70)
-    
-    if os.getenv('GOOGLE_SHEET_ID'):
-        try:
-            updater = GoogleSheetsUpdater()
-            new_jobs = updater.filter_new_jobs(jobs)
-            
-            if not new_jobs:
-                safe_print("")
-                safe_print("All jobs already in sheet (0 new jobs)")
-                safe_print("Updating last run time anyway...")
-                tracker.update_last_run_time(jobs_found=0)
-                exit()
-            
-            jobs = new_jobs
+    try:
+        job_store = JobStore()
+        
+        # Sheet URLs are merged into local history once every SHEET_RECONCILE_HOURS
+        if updater:
+            try:
+                job_store.reconcile_with_sheet(updater)
+            except Exception as e:
+                safe_print(f"Sheet reconcile skipped: {e}")
             
-        except Exception as e:
-            safe_print(f"Deduplication failed: {e}")
-            safe_print("Continuing with all jobs...")
-    
-    safe_print(f"")
-    safe_print(f"{len(jobs)} NEW jobs to process")
+            # Old / Applied / Rejected rows move to the archive (kept in history)
+            updater.archive_old_jobs(job_store)
+        
+    except Exception as e:
+        job_store = None
+        safe_print(f"Job history unavailable: {e}")
+        safe_print("Continuing with all jobs...")
     
-    # STEP 3: AI Analysis
+    # STEP 2: AI analysis + sheet writer
+    analyzer = None
     if os.getenv('GROQ_API_KEY'):
-        safe_print("")
-        safe_print("="*70)
-        safe_print("STEP 3: AI ANALYSIS")
-        safe_print("="*70)
-        
         try:
             analyzer = ResumeAnalyzer()
-            analyzed_jobs = analyzer.batch_analyze(jobs)
         except Exception as e:
-            safe_print(f"AI analysis failed: {e}")
-            analyzed_jobs = jobs
+            safe_print(f"AI analysis unavailable: {e}")
     else:
         safe_print("")
         safe_print("Skipping AI analysis (no GROQ_API_KEY)")
-        analyzed_jobs = jobs
     
-    # STEP 4: Update Google Sheets
-    if os.getenv('GOOGLE_SHEET_ID'):
+    # STEP 3: Scrape -> dedup -> filter -> analyze -> sheet, batch by batch
+    safe_print("")
+    safe_print("="*70)
+    safe_print("STEP 3: STREAMING HUNT")
+    safe_print("="*70)
+    
+    orchestrator = JobScrapingOrchestrator(since_time=last_run)
+    pipeline = JobPipeline(orchestrator, job_store=job_store, analyzer=analyzer, updater=updater)
+    analyzed_jobs = pipeline.run()
+    
+    if not analyzed_jobs:
         safe_print("")
-        safe_print("="*70)
-        safe_print("STEP 4: UPDATING GOOGLE SHEETS")
-        safe_print("="*70)
-        
-        updater = GoogleSheetsUpdater()
-        success = updater.add_jobs_batch(analyzed_jobs)
-        
-        if success:
-            safe_print(f"")
-            safe_print(f"View your jobs:")
-            safe_print(f"   https://docs.google.com/spreadsheets/d/{os.getenv('GOOGLE_SHEET_ID')}")
+        safe_print("No new jobs found")
+        safe_print("")
+        safe_print("This is normal if:")
+        safe_print("   - No jobs posted since last run")
+        safe_print("   - All jobs already seen")
+        safe_print("   - Filters too strict")
+        safe_print("Updating last run time anyway...")
+        tracker.update_last_run_time(jobs_found=0)
+        exit()
+    
+    if updater:
+        safe_print(f"")
+        safe_print(f"View your jobs:")
+        safe_print(f"   https://docs.google.com/spreadsheets/d/{os.getenv('GOOGLE_SHEET_ID')}")
     
-    # STEP 5: Update last run time
+    # STEP 4: Update last run time
     safe_print("")
     safe_print("="*70)
-    safe_print("STEP 5: UPDATING TRACKER")
+    safe_print("STEP 4: UPDATING TRACKER")
     safe_print("="*70)
     
     tracker.update_last_run_time(jobs_found=len(analyzed_jobs))
@@ -162,7 +147,7 @@ try:
     safe_print("="*70)
     safe_print("COMPLETE!")
     safe_print("="*70)
-    safe_print(f"{len(analyzed_jobs)} NEW jobs added")
+    safe_print(f"{pipeline.stats['written']} NEW jobs added")
     safe_print(f"All jobs are unique (no duplicates)")
     safe_print(f"Next run will fetch jobs posted AFTER now")
     
@@ -33,9 +33,11 @@ except AttributeError:
 
 # Now import project modules
 from orchestrator import JobScrapingOrchestrator
+from pipeline import JobPipeline
 from ai_analysis.resume_analyzer import ResumeAnalyzer
 from sheets_integration.sheets_updater import GoogleSheetsUpdater
 from utils.run_tracker import RunTracker
+from utils.job_store import JobStore
 from dotenv import load_dotenv
 
 # Load environment
@@ -57,9 +59,17 @@ try:
     print("STEP 0: CLEANUP")
     print("="*70)
     
+    # One sheet client for the whole run - cleanup, reconcile and writes
+    # share it, and its snapshot means the sheet is read only once
+    updater = None
     if os.getenv('GOOGLE_SHEET_ID'):
         try:
             updater = GoogleSheetsUpdater()
+        except Exception as e:
+            print(f"   Sheet unavailable: {e}")
+    
+    if updater:
+        try:
             deleted = updater.delete_checked_jobs()
             if deleted:
                 print(f"   Deleted {deleted} checked jobs")
@@ -70,121 +80,83 @@ try:
     else:
         print("   Skipping cleanup (no GOOGLE_SHEET_ID)")
     
-    # STEP 1: Scrape jobs
+    # STEP 1: Local history (dedup against previous runs)
     print()
     print("="*70)
-    print("STEP 1: SCRAPING JOBS")
+    print("STEP 1: LOADING JOB HISTORY")
     print("="*70)
     
-    orchestrator = JobScrapingOrchestrator(since_time=last_run)
-    jobs = orchestrator.run_all_scrapers()
-    
-    if not jobs:
-        print()
-        print("No new jobs found")
-        print()
-        print("Possible reasons:")
-        print("   - No jobs posted since last run")
-        print("   - All jobs already in sheet")
-        print("   - Filters too strict (MIN_SALARY_LPA, MAX_EXPERIENCE_YEARS)")
-        print()
-        # Update tracker even if no jobs found
-        tracker.update_last_run_time(jobs_found=0)
-        sys.exit(0)
-    
-    print(f"")
-    print(f"Scraped {len(jobs)} jobs total")
-    
-    # STEP 2: Filter duplicates (URL-based)
-    print()
-    print("="*70)
-    print("STEP 2: REMOVING DUPLICATES")
-    print("="*70)
-    
-    if os.getenv('GOOGLE_SHEET_ID'):
-        try:
-            updater = GoogleSheetsUpdater()
-            
-            # Get existing URLs from sheet
-            existing_count = len(updater.get_existing_job_urls())
-            print(f"   Found {existing_count} existing jobs in sheet")
-            
-            # Filter out duplicates
-            new_jobs = updater.filter_new_jobs(jobs)
-            
-            if not new_jobs:
-                print()
-                print(f"All {len(jobs)} jobs already in sheet (0 new jobs)")
-                print()
-                print("This is normal if:")
-                print("   - Recently ran the hunt")
-                print("   - No new jobs have been posted")
-                print()
-                # Update tracker
-                tracker.update_last_run_time(jobs_found=0)
-                sys.exit(0)
-            
-            skipped = len(jobs) - len(new_jobs)
-            print(f"   Filtered: {len(new_jobs)} NEW jobs (skipped {skipped} duplicates)")
+    try:
+        job_store = JobStore()
+        
+        # Merge the sheet's URL column in occasionally (not every run)
+        if updater:
+            try:
+                job_store.reconcile_with_sheet(updater)
+            except Exception as e:
+                print(f"   Sheet reconcile skipped: {e}")
             
-            jobs = new_jobs
-            
-        except Exception as e:
-            print(f"   Deduplication failed: {e}")
-            print("   Continuing with all jobs...")
-    else:
-        print("   Skipping deduplication (no GOOGLE_SHEET_ID)")
-    
-    print(f"")
-    print(f"{len(jobs)} NEW jobs to process")
-    
-    # STEP 3: AI Analysis (only if GROQ_API_KEY exists)
+            # Old / Applied / Rejected rows move to the archive (kept in history)
+            updater.archive_old_jobs(job_store)
+        
+        print(f"   Found {job_store.count()} jobs in local history")
+        
+    except Exception as e:
+        job_store = None
+        print(f"   Job history unavailable: {e}")
+        print("   Continuing with all jobs...")
+    
+    # STEP 2: AI analysis + sheet writer (only if configured)
     print()
     print("="*70)
-    print("STEP 3: AI ANALYSIS")
+    print("STEP 2: AI ANALYSIS + GOOGLE SHEETS")
     print("="*70)
     
+    analyzer = None
     if os.getenv('GROQ_API_KEY'):
         try:
             analyzer = ResumeAnalyzer()
-            print(f"   Analyzing {len(jobs)} jobs...")
-            analyzed_jobs = analyzer.batch_analyze(jobs)
-            print(f"   Analysis complete!")
         except Exception as e:
-            print(f"   AI analysis failed: {e}")
+            print(f"   AI analysis unavailable: {e}")
             print("   Continuing without AI analysis...")
-            analyzed_jobs = jobs
     else:
         print("   Skipping AI analysis (no GROQ_API_KEY)")
-        analyzed_jobs = jobs
     
-    # STEP 4: Update Google Sheets
+    if not updater:
+        print("   Skipping sheet update (no GOOGLE_SHEET_ID)")
+    
+    # STEP 3: Scrape -> dedup -> filter -> analyze -> sheet, batch by batch
     print()
     print("="*70)
-    print("STEP 4: UPDATING GOOGLE SHEETS")
+    print("STEP 3: STREAMING HUNT")
     print("="*70)
     
-    if os.getenv('GOOGLE_SHEET_ID'):
-        try:
-            updater = GoogleSheetsUpdater()
-            success = updater.add_jobs_batch(analyzed_jobs)
-            
-            if success:
-                print(f"   Successfully added {len(analyzed_jobs)} jobs")
-                print()
-                print(f"   View your jobs:")
-                print(f"   https://docs.google.com/spreadsheets/d/{os.getenv('GOOGLE_SHEET_ID')}")
-        except Exception as e:
-            print(f"   Failed to update sheet: {e}")
-            import traceback
-            traceback.print_exc()
-    else:
-        print("   Skipping sheet update (no GOOGLE_SHEET_ID)")
+    orchestrator = JobScrapingOrchestrator(since_time=last_run)
+    pipeline = JobPipeline(orchestrator, job_store=job_store, analyzer=analyzer, updater=updater)
+    analyzed_jobs = pipeline.run()
+    
+    if not analyzed_jobs:
+        print()
+        print("No new jobs found")
+        print()
+        print("Possible reasons:")
+        print("   - No jobs posted since last run")
+        print("   - All jobs already seen (recently ran the hunt)")
+        print("   - Filters too strict (MIN_SALARY_LPA, MAX_EXPERIENCE_YEARS)")
+        print()
+        # Update tracker even if no jobs found
+        tracker.update_last_run_time(jobs_found=0)
+        sys.exit(0)
+    
+    if updater:
+        print()
+        print(f"   View your jobs:")
+        print(f"   https://docs.google.com/spreadsheets/d/{os.getenv('GOOGLE_SHEET_ID')}")
     
-    # STEP 5: Update tracker
+    # STEP 4: Update tracker
     print()
     print("="*70)
-    print("STEP 5: UPDATING TRACKER")
+    print("STEP 4: UPDATING TRACKER")
     print("="*70)
     
     tracker.update_last_run_time(jobs_found=len(analyzed_jobs))
@@ -195,7 +167,7 @@ try:
     print("="*70)
     print("COMPLETE!")
     print("="*70)
-    print(f"{len(analyzed_jobs)} NEW jobs added")
+    print(f"{pipeline.stats['written']} NEW jobs added")
     print(f"All jobs are unique (no duplicates)")
     print(f"Next run will fetch jobs posted AFTER now")
     
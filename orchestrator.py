@@ -4,6 +4,8 @@ import sys
 import os
 from datetime import datetime
 import time
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Add scrapers to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -18,6 +20,10 @@ from scrapers.google_jobs_scraper import GoogleJobsScraper
 from scrapers.company_scrapers import CompanyScraper
 
 from utils.job_deduplicator import JobDeduplicator
+from utils.silent_browser import get_driver_pool
+from utils.page_waiter import PageWaiter
+from utils.job_filter import JobFilter
+from utils.salary_extractor import Salary
 from dotenv import load_dotenv
 
 load_dotenv('config/.env')
@@ -25,7 +31,7 @@ load_dotenv('config/.env')
 class JobScrapingOrchestrator:
     """Master controller for all job scrapers"""
     
-    def __init__(self, since_time=None):
+    def __init__(self, since_time=None, max_workers=None):
         print("=" * 70)
         print("AI JOB SCOUT - HYBRID SCRAPING SYSTEM")
         print("=" * 70)
@@ -43,44 +49,97 @@ class JobScrapingOrchestrator:
         # Configuration
         self.enable_scrapers = True
         self.enable_companies = True
+        
+        # Max portal scrapers running at once (each Selenium one owns a Chrome).
+        # 1 = old sequential behaviour, useful on small VMs.
+        if max_workers is None:
+            max_workers = int(os.getenv('MAX_SCRAPER_WORKERS', 3))
+        self.max_workers = max(1, max_workers)
     
-    def run_all_scrapers(self):
-        """Execute all scrapers in priority order"""
+    # Portal scrapers, in priority order
+    PORTAL_SCRAPERS = [
+        ("LinkedIn", LinkedInJobScraper),
+        ("Naukri", NaukriScraper),
+        ("Indeed", IndeedScraper),
+        ("Glassdoor", GlassdoorScraper),
+        ("Foundit", FounditScraper),
+        # ("Google Jobs", GoogleJobsScraper),  # ✅ DISABLED - has issues
+    ]
+    
+    # Fresher salary bar used when a posting doesn't state one
+    MIN_ESTIMATED_LPA = 15
+    
+    def _open_scraper(self, name, ScraperClass):
+        """Create a portal scraper, passing since_time when it supports it"""
         
-        # TIER 2: JOB AGGREGATORS (10-15 min delay)
-        if self.enable_scrapers:
-            print("\n" + "="*70)
-            print("TIER 2: JOB PORTALS (Medium Priority)")
-            print("="*70)
-            
-            # Run in parallel-ish fashion (one after another)
-            scrapers = [
-                ("LinkedIn", LinkedInJobScraper),
-                ("Naukri", NaukriScraper),
-                ("Indeed", IndeedScraper),
-                ("Glassdoor", GlassdoorScraper),
-                ("Foundit", FounditScraper),
-                # ("Google Jobs", GoogleJobsScraper),  # ✅ DISABLED - has issues
-            ]
-            
+        print(f"\n▶️  Running {name} scraper...")
+        
+        # ✅ FIXED - Proper since_time handling with fallback
+        try:
+            if self.since_time:
+                scraper = ScraperClass(since_time=self.since_time)
+            else:
+                scraper = ScraperClass()
+        except TypeError as e:
+            # Scraper doesn't support since_time yet - use without it
+            print(f"   ⚠️  {name} doesn't support time filter (using all jobs)")
+            scraper = ScraperClass()
+        
+        return scraper
+    
+    def _run_portal_scraper(self, name, ScraperClass):
+        """Run one portal scraper end-to-end and return its jobs"""
+        
+        scraper = self._open_scraper(name, ScraperClass)
+        
+        try:
+            return scraper.search_jobs()
+        finally:
+            # Always release the browser, even if the search blew up
+            scraper.close()
+    
+    def _iter_portal_jobs(self, name, ScraperClass):
+        """Yield one portal's jobs as its scraper finds them"""
+        
+        scraper = self._open_scraper(name, ScraperClass)
+        
+        try:
+            yield from scraper.iter_jobs()
+        finally:
+            scraper.close()
+    
+    def _open_company_scraper(self):
+        # ✅ FIXED - Pass since_time to company scraper with fallback
+        try:
+            if self.since_time:
+                return CompanyScraper(since_time=self.since_time)
+            return CompanyScraper()
+        except TypeError:
+            print(f"   ⚠️  Company scraper doesn't support time filter")
+            return CompanyScraper()
+    
+    def _iter_company_jobs(self):
+        """Yield career-page jobs company by company"""
+        
+        company_scraper = self._open_company_scraper()
+        
+        try:
+            yield from company_scraper.iter_jobs()
+        finally:
+            company_scraper.close()
+    
+    def run_portal_scrapers(self, scrapers):
+        """
+        Run portal scrapers, up to max_workers at a time
+        
+        Results are merged into self.all_jobs as each portal finishes,
+        so total time is roughly that of the slowest portal.
+        """
+        
+        if self.max_workers == 1:
             for name, ScraperClass in scrapers:
                 try:
-                    print(f"\n▶️  Running {name} scraper...")
-                    
-                    # ✅ FIXED - Proper since_time handling with fallback
-                    try:
-                        if self.since_time:
-                            scraper = ScraperClass(since_time=self.since_time)
-                        else:
-                            scraper = ScraperClass()
-                    except TypeError as e:
-                        # Scraper doesn't support since_time yet - use without it
-                        print(f"   ⚠️  {name} doesn't support time filter (using all jobs)")
-                        scraper = ScraperClass()
-                    
-                    jobs = scraper.search_jobs()
-                    scraper.close()
-                    
+                    jobs = self._run_portal_scraper(name, ScraperClass)
                     self.all_jobs.extend(jobs)
                     print(f"✅ {name} complete: {len(jobs)} jobs")
                     
@@ -88,6 +147,36 @@ class JobScrapingOrchestrator:
                     
                 except Exception as e:
                     print(f"❌ {name} failed: {str(e)[:100]}")
+            return
+        
+        workers = min(self.max_workers, len(scrapers))
+        print(f"⚡ Running {len(scrapers)} portals concurrently (max {workers} at once)")
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='portal') as executor:
+            futures = {
+                executor.submit(self._run_portal_scraper, name, ScraperClass): name
+                for name, ScraperClass in scrapers
+            }
+            
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    jobs = future.result()
+                    self.all_jobs.extend(jobs)
+                    print(f"✅ {name} complete: {len(jobs)} jobs")
+                except Exception as e:
+                    print(f"❌ {name} failed: {str(e)[:100]}")
+    
+    def run_all_scrapers(self):
+        """Execute all scrapers in priority order"""
+        
+        # TIER 2: JOB AGGREGATORS (10-15 min delay)
+        if self.enable_scrapers:
+            print("\n" + "="*70)
+            print("TIER 2: JOB PORTALS (Medium Priority)")
+            print("="*70)
+            
+            self.run_portal_scrapers(self.PORTAL_SCRAPERS)
             
             print(f"\n✅ Portal tier complete: {len(self.all_jobs)} total jobs so far")
         
@@ -98,18 +187,12 @@ class JobScrapingOrchestrator:
             print("="*70)
             
             try:
-                # ✅ FIXED - Pass since_time to company scraper with fallback
-                try:
-                    if self.since_time:
-                        company_scraper = CompanyScraper(since_time=self.since_time)
-                    else:
-                        company_scraper = CompanyScraper()
-                except TypeError:
-                    print(f"   ⚠️  Company scraper doesn't support time filter")
-                    company_scraper = CompanyScraper()
+                company_scraper = self._open_company_scraper()
                 
-                company_jobs = company_scraper.search_all_companies()
-                company_scraper.close()
+                try:
+                    company_jobs = company_scraper.search_all_companies()
+                finally:
+                    company_scraper.close()
                 
                 self.all_jobs.extend(company_jobs)
                 print(f"✅ Company tier complete: {len(company_jobs)} jobs")
@@ -117,6 +200,8 @@ class JobScrapingOrchestrator:
             except Exception as e:
                 print(f"❌ Company scraping failed: {str(e)[:100]}")
         
+        self.print_browser_stats()
+        
         # DEDUPLICATION
         print("\n" + "="*70)
         print("DEDUPLICATION")
@@ -131,47 +216,23 @@ class JobScrapingOrchestrator:
         print("EXPERIENCE FILTERING (0-2 Years)")
         print("="*70)
 
-        from utils.job_filter import JobFilter
-
         filtered_jobs = []
 
-        for job in unique_jobs:
-            suitable, reason = JobFilter.is_suitable_for_fresher(job)
-            
-            if suitable:
-                # If no salary mentioned, estimate or verify it
-                if job.get('salary') == 'Not mentioned':
-                    company = job.get('company', '')
-                    
-                    # Try static estimate first (faster)
-                    estimated = JobFilter.estimate_fresher_salary(company, role="Data Analyst")
-                    
-                    if estimated and estimated >= 15:
-                        job['salary'] = f"Est. {estimated} LPA"
-                        job['salary_estimated'] = True
-                        filtered_jobs.append(job)
-                        print(f"   ✅ {job['title'][:40]} at {company[:20]} - Est. {estimated} LPA")
-                    else:
-                        # Try AI verification for unknown companies
-                        try:
-                            estimated = JobFilter.verify_unknown_company_salary(company, role="Data Analyst", min_lpa=15)
-                            
-                            if estimated and estimated >= 15:
-                                job['salary'] = f"Est. {estimated} LPA (AI-verified)"
-                                job['salary_estimated'] = True
-                                filtered_jobs.append(job)
-                                print(f"   ✅ {job['title'][:40]} at {company[:20]} - AI-verified: {estimated} LPA")
-                            else:
-                                print(f"   ⏭️  {job['title'][:40]} at {company[:20]} - Below threshold")
-                        except Exception as e:
-                            # AI verification failed - skip job
-                            print(f"   ❌ {job['title'][:40]} - Verification failed")
-                else:
-                    # Salary mentioned, include
-                    filtered_jobs.append(job)
-                    print(f"   ✅ {job['title'][:40]} at {job['company'][:20]} - {job['salary']}")
-            else:
+        checked = [(job, *JobFilter.is_suitable_for_fresher(job)) for job in unique_jobs]
+
+        # Unknown companies without a salary: one batched AI pass (answers are stored)
+        to_verify = [
+            job.get('company', '') for job, suitable, _ in checked
+            if suitable and self.needs_salary_verification(job)
+        ]
+        if to_verify:
+            JobFilter.prefetch_company_salaries(to_verify, role="Data Analyst", min_lpa=self.MIN_ESTIMATED_LPA)
+
+        for job, suitable, reason in checked:
+            if not suitable:
                 print(f"   ❌ {job['title'][:40]} - {reason}")
+            elif self.accept_salary(job):
+                filtered_jobs.append(job)
 
         print(f"\nFiltered: {len(unique_jobs)} → {len(filtered_jobs)} fresher-suitable jobs")
 
@@ -179,6 +240,124 @@ class JobScrapingOrchestrator:
         
         return self.all_jobs
     
+    def print_browser_stats(self):
+        pool = get_driver_pool()
+        print(f"\n♻️  Browser pool: {pool.created} Chrome launches, {pool.reused} warm reuses")
+        
+        saved = PageWaiter.saved_seconds()
+        if saved:
+            print("⏱️  Idle time saved vs fixed sleeps:")
+            for portal, seconds in sorted(saved.items(), key=lambda x: x[1], reverse=True):
+                print(f"   {portal}: {seconds:.1f}s")
+    
+    def needs_salary_verification(self, job):
+        """No salary in the posting and the static company table doesn't clear the bar"""
+        
+        if job.get('salary_value') is not None:
+            return False
+        
+        estimated = JobFilter.estimate_fresher_salary(job.get('company', ''), role="Data Analyst")
+        return (estimated or 0) < self.MIN_ESTIMATED_LPA
+    
+    def accept_salary(self, job):
+        """
+        Salary check for a fresher-suitable job
+        
+        Jobs without a salary get a company estimate (static table, then AI
+        verification) written into job['salary'] / job['salary_value'].
+        Returns True if the job should be kept.
+        """
+        
+        if job.get('salary_value') is not None:
+            # Salary mentioned, include
+            print(f"   ✅ {job['title'][:40]} at {job['company'][:20]} - {job['salary']}")
+            return True
+        
+        company = job.get('company', '')
+        
+        # Try static estimate first (faster)
+        estimated = JobFilter.estimate_fresher_salary(company, role="Data Analyst")
+        
+        if estimated and estimated >= self.MIN_ESTIMATED_LPA:
+            job['salary_value'] = Salary.estimate(estimated)
+            job['salary'] = str(job['salary_value'])
+            job['salary_estimated'] = True
+            print(f"   ✅ {job['title'][:40]} at {company[:20]} - Est. {estimated} LPA")
+            return True
+        
+        # Try AI verification for unknown companies
+        try:
+            estimated = JobFilter.verify_unknown_company_salary(company, role="Data Analyst", min_lpa=self.MIN_ESTIMATED_LPA)
+        except Exception as e:
+            # AI verification failed - skip job
+            print(f"   ❌ {job['title'][:40]} - Verification failed")
+            return False
+        
+        if estimated and estimated >= self.MIN_ESTIMATED_LPA:
+            job['salary_value'] = Salary.estimate(estimated, note='AI-verified')
+            job['salary'] = str(job['salary_value'])
+            job['salary_estimated'] = True
+            print(f"   ✅ {job['title'][:40]} at {company[:20]} - AI-verified: {estimated} LPA")
+            return True
+        
+        print(f"   ⏭️  {job['title'][:40]} at {company[:20]} - Below threshold")
+        return False
+    
+    def stream_jobs(self, poll_seconds=None):
+        """
+        Yield raw jobs as soon as any scraper finds them
+        
+        Portals and company pages run in worker threads (max_workers at
+        once) and push every job onto a queue; this generator drains it in
+        the caller's thread. With poll_seconds set, None is yielded whenever
+        nothing arrived for that long, so the caller can flush partial work.
+        """
+        
+        sources = [(name, lambda name=name, cls=cls: self._iter_portal_jobs(name, cls))
+                   for name, cls in self.PORTAL_SCRAPERS] if self.enable_scrapers else []
+        if self.enable_companies:
+            sources.append(("Company pages", self._iter_company_jobs))
+        
+        if not sources:
+            return
+        
+        jobs = queue.Queue()
+        finished = object()  # One per source, marks its end
+        
+        def produce(name, source):
+            count = 0
+            try:
+                for job in source():
+                    jobs.put(job)
+                    count += 1
+                print(f"✅ {name} complete: {count} jobs")
+            except Exception as e:
+                print(f"❌ {name} failed after {count} jobs: {str(e)[:100]}")
+            finally:
+                jobs.put(finished)
+        
+        workers = min(self.max_workers, len(sources))
+        print(f"⚡ Streaming {len(sources)} sources (max {workers} at once)")
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='source') as executor:
+            for name, source in sources:
+                executor.submit(produce, name, source)
+            
+            remaining = len(sources)
+            while remaining:
+                try:
+                    job = jobs.get(timeout=poll_seconds)
+                except queue.Empty:
+                    yield None
+                    continue
+                
+                if job is finished:
+                    remaining -= 1
+                else:
+                    yield job
+        
+        self.print_browser_stats()
+    
     def save_results(self):
         """Save all jobs to file"""
         
@@ -191,7 +370,7 @@ class JobScrapingOrchestrator:
         
         import json
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(self.all_jobs, f, indent=2, ensure_ascii=False)
+            json.dump([job.to_dict() for job in self.all_jobs], f, indent=2, ensure_ascii=False)
         
         print(f"\n💾 Results saved to: {output_file}")
     
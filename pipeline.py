@@ -0,0 +1,200 @@
+# pipeline.py - Streaming hunt: scrape -> dedup -> filter -> analyze -> sheet, batch by batch
+
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.job_filter import JobFilter
+from dotenv import load_dotenv
+
+load_dotenv('config/.env')
+
+
+class JobPipeline:
+    """
+    Moves jobs through the hunt while the scrapers are still running
+
+    Every job the orchestrator streams is deduplicated (this run + local
+    history), fresher-filtered and salary-checked on arrival. Accepted jobs
+    collect into a small batch which is analyzed and appended to the sheet
+    as soon as it has PIPELINE_BATCH_SIZE jobs or has waited
+    PIPELINE_FLUSH_SECONDS - so the first jobs reach the sheet minutes into
+    a run instead of after the last company page.
+    """
+
+    def __init__(self, orchestrator, job_store=None, analyzer=None, updater=None,
+                 batch_size=None, flush_seconds=None):
+        """
+        Args:
+            orchestrator (JobScrapingOrchestrator): Source of jobs (stream_jobs)
+            job_store (JobStore): Local history - known jobs are skipped, written ones recorded
+            analyzer (ResumeAnalyzer): AI analysis per batch (None = skip)
+            updater (GoogleSheetsUpdater): Sheet writer (None = skip)
+        """
+
+        self.orchestrator = orchestrator
+        self.job_store = job_store
+        self.analyzer = analyzer
+        self.updater = updater
+
+        self.batch_size = max(1, int(batch_size if batch_size is not None else os.getenv('PIPELINE_BATCH_SIZE', '10')))
+        self.flush_seconds = float(flush_seconds if flush_seconds is not None else os.getenv('PIPELINE_FLUSH_SECONDS', '60'))
+
+        self.accepted = []        # Jobs waiting for analysis + sheet write
+        self.awaiting_salary = [] # Fresher-suitable, unknown company salary - verified together
+        self.pending_since = None
+
+        self.processed_jobs = []  # Everything that was analyzed/written this run
+        self.stats = {
+            'scraped': 0,
+            'duplicates': 0,
+            'known': 0,
+            'rejected': 0,
+            'written': 0,
+            'batches': 0
+        }
+        self.first_write_after = None
+        self.started = None
+
+    # ── Per job ─────────────────────────────────────
+
+    def process(self, job):
+        """Screen one scraped job; accepted ones wait in the current batch"""
+
+        self.stats['scraped'] += 1
+
+        if self.orchestrator.deduplicator.is_duplicate(job):
+            self.stats['duplicates'] += 1
+            return
+
+        if self.job_store and (not (job.get('url') or '').strip() or self.job_store.is_known(job)):
+            self.stats['known'] += 1
+            return
+
+        suitable, reason = JobFilter.is_suitable_for_fresher(job)
+
+        if not suitable:
+            self.stats['rejected'] += 1
+            print(f"   ❌ {job['title'][:40]} - {reason}")
+            return
+
+        if self.pending_since is None:
+            self.pending_since = time.monotonic()
+
+        if self.orchestrator.needs_salary_verification(job):
+            self.awaiting_salary.append(job)  # Checked at flush, one AI call per batch
+        else:
+            self._accept(job)
+
+    def _accept(self, job):
+        if self.orchestrator.accept_salary(job):
+            self.accepted.append(job)
+        else:
+            self.stats['rejected'] += 1
+
+    def _due(self):
+        if self.pending_since is None:
+            return False
+
+        waiting = len(self.accepted) + len(self.awaiting_salary)
+        return waiting >= self.batch_size or time.monotonic() - self.pending_since >= self.flush_seconds
+
+    # ── Per batch ───────────────────────────────────
+
+    def flush(self):
+        """Verify pending salaries, then analyze and write the current batch"""
+
+        if self.awaiting_salary:
+            waiting, self.awaiting_salary = self.awaiting_salary, []
+            JobFilter.prefetch_company_salaries(
+                [job.get('company', '') for job in waiting],
+                role="Data Analyst", min_lpa=self.orchestrator.MIN_ESTIMATED_LPA
+            )
+            for job in waiting:
+                self._accept(job)
+
+        batch, self.accepted = self.accepted, []
+        self.pending_since = None
+
+        if not batch:
+            return
+
+        self.stats['batches'] += 1
+        print(f"\n📦 Batch {self.stats['batches']}: {len(batch)} new jobs")
+
+        if self.analyzer:
+            try:
+                batch = self.analyzer.batch_analyze(batch)
+            except Exception as e:
+                print(f"   AI analysis failed: {e}")
+                print("   Continuing without AI analysis...")
+
+        self._write(batch)
+        self.processed_jobs.extend(batch)
+
+    def _write(self, batch):
+        if self.updater:
+            try:
+                success = self.updater.add_jobs_batch(batch)
+            except Exception as e:
+                print(f"   Failed to update sheet: {e}")
+                success = False
+
+            if not success:
+                return  # Not recorded - retried as new next run
+
+        if self.job_store:
+            self.job_store.add_jobs(batch)
+
+        self.stats['written'] += len(batch)
+        if self.first_write_after is None:
+            self.first_write_after = time.monotonic() - self.started
+
+    # ── Run ─────────────────────────────────────────
+
+    def run(self):
+        """Stream the whole hunt; returns the jobs that went through"""
+
+        self.started = time.monotonic()
+        poll = min(self.flush_seconds, 5)
+
+        for job in self.orchestrator.stream_jobs(poll_seconds=poll):
+            if job is not None:
+                self.process(job)
+
+            if self._due():
+                self.flush()
+
+        self.flush()  # Whatever is left
+
+        self.orchestrator.all_jobs = self.processed_jobs
+        self.print_summary()
+
+        return self.processed_jobs
+
+    def print_summary(self):
+        stats = self.stats
+        elapsed = time.monotonic() - self.started
+
+        print("\n" + "="*70)
+        print("PIPELINE SUMMARY")
+        print("="*70)
+        print(f"   Scraped: {stats['scraped']} | Duplicates: {stats['duplicates']} | Seen before: {stats['known']} | Filtered out: {stats['rejected']}")
+        print(f"   Written: {stats['written']} jobs in {stats['batches']} batches ({elapsed:.0f}s)")
+        if self.first_write_after is not None:
+            print(f"   First batch landed after {self.first_write_after:.0f}s")
+
+
+# Test
+if __name__ == "__main__":
+    from orchestrator import JobScrapingOrchestrator
+
+    print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+    orchestrator = JobScrapingOrchestrator()
+    jobs = JobPipeline(orchestrator, batch_size=5).run()
+
+    print(f"\n✅ Pipeline finished: {len(jobs)} jobs")
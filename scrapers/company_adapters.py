@@ -0,0 +1,462 @@
+# scrapers/company_adapters.py - Career-site adapters per ATS family + "since" cursors
+
+import os
+import re
+import sys
+import html
+import json
+from datetime import datetime, timedelta
+from urllib.parse import urlparse, quote
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.salary_extractor import SalaryExtractor
+from utils.date_parser import JobDateParser
+from utils.job import Job
+
+
+# family ("type" in companies.json) -> adapter class
+ADAPTERS = {}
+
+
+def register_adapter(family):
+    """Class decorator: make an adapter available for companies of this type"""
+
+    def decorator(cls):
+        cls.family = family
+        ADAPTERS[family] = cls
+        return cls
+
+    return decorator
+
+
+def adapter_for(config, roles):
+    """Adapter instance for a company config, or None (Selenium page scrape)"""
+
+    adapter_class = ADAPTERS.get(config.get('type', '').lower())
+    return adapter_class(config, roles) if adapter_class else None
+
+
+class CompanyCursors:
+    """
+    Per-company "seen up to here" markers (logs/company_cursors.json)
+
+    A cursor is the newest posting date seen plus the ids of recent
+    postings. A posting is new if its id isn't in the cursor and it isn't
+    older than the cursor date (minus a day of slack for ATSs that only
+    report "Posted 2 days ago").
+    """
+
+    SLACK = timedelta(days=1)
+    MAX_IDS = 500
+
+    def __init__(self, path='logs/company_cursors.json'):
+        self.path = path
+        self.cursors = {}
+
+        # Ensure logs directory exists
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.cursors = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.cursors = {}
+
+    def oldest_wanted(self, company):
+        """Postings older than this can't be new for company (None = no cursor yet)"""
+
+        cursor = self.cursors.get(company)
+        if not cursor:
+            return None
+        return datetime.fromisoformat(cursor['last_posted']) - self.SLACK
+
+    def is_new(self, company, posting_id, posted_at):
+        cursor = self.cursors.get(company)
+        if not cursor:
+            return True
+
+        if str(posting_id) in cursor.get('ids', []):
+            return False
+
+        return posted_at >= self.oldest_wanted(company)
+
+    def advance(self, company, postings):
+        """Move the cursor past postings: list of (posting_id, posted_at)"""
+
+        if not postings:
+            return
+
+        cursor = self.cursors.get(company, {})
+        last_posted = max(posted_at for _, posted_at in postings)
+
+        if cursor.get('last_posted'):
+            last_posted = max(last_posted, datetime.fromisoformat(cursor['last_posted']))
+
+        # Only ids that can still pass the date check need remembering
+        recent = [str(pid) for pid, posted_at in sorted(postings, key=lambda p: p[1], reverse=True)
+                  if posted_at >= last_posted - self.SLACK]
+        ids = list(dict.fromkeys(recent + cursor.get('ids', [])))[:self.MAX_IDS]
+
+        self.cursors[company] = {'last_posted': last_posted.isoformat(), 'ids': ids}
+
+    def save(self):
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.cursors, f, indent=2)
+        except Exception as e:
+            print(f"⚠️  Error saving company cursors: {e}")
+
+
+class CompanyAdapter:
+    """
+    Fetches one company's postings from its ATS JSON endpoint
+
+    Subclasses describe the HTTP requests (one per search role, or one for
+    the whole board) and turn a decoded response into postings. Fetching
+    itself is left to the caller so every company's requests can go out
+    together through one AsyncFetcher.
+
+    Paged search APIs set PAGE_SIZE and implement page_request() and
+    page_counts(); the caller then asks next_request() after each page.
+    Paging stops at the last page, after ATS_MAX_PAGES pages, or once a
+    page holds nothing newer than the company's since-time.
+    """
+
+    family = None
+
+    PAGE_SIZE = None       # Results per request for paged APIs (None = single request)
+    DATE_SORTED = False    # Pages come newest first
+    DAY_DATES = False      # Posting dates are only accurate to the day
+
+    def __init__(self, config, roles):
+        self.config = config
+        self.name = config['name']
+        self.roles = [role.strip() for role in roles if role.strip()]
+        self.host = urlparse(config['url']).netloc
+        self.max_pages = max(1, int(os.getenv('ATS_MAX_PAGES', '5')))
+
+    def requests(self):
+        """[(role or None, request dict)] - None = the request covers every role"""
+        return [(role, self.page_request(role, 0)) for role in self.roles]
+
+    def page_request(self, role, offset):
+        """Request dict for one page of a role's search (paged APIs)"""
+        raise NotImplementedError
+
+    def page_counts(self, data):
+        """(postings on this page, total matches or 0 if unknown) - paged APIs"""
+        raise NotImplementedError
+
+    def parse(self, data, role):
+        """[(posting_id, posted_at, Job)] from one decoded response"""
+        raise NotImplementedError
+
+    def read(self, response, role):
+        """(decoded data, postings) from one fetch result, or None on error"""
+
+        try:
+            if isinstance(response, Exception):
+                raise response
+
+            if response.status_code != 200:
+                print(f"      {self.family} API returned {response.status_code} for {self.name}")
+                return None
+
+            data = response.json()
+            return data, self.parse(data, role)
+
+        except Exception as e:
+            print(f"      {self.family} API error for {self.name}: {str(e)[:60]}")
+            return None
+
+    def next_request(self, role, offset, data, postings, stop_before=None):
+        """
+        (offset, request dict) for the page after this one, or None when the
+        search is done. stop_before: postings older than this aren't wanted.
+        """
+
+        if not self.PAGE_SIZE:
+            return None
+
+        returned, total = self.page_counts(data)
+        next_offset = offset + self.PAGE_SIZE
+
+        if returned < self.PAGE_SIZE or (total and next_offset >= total):
+            return None  # Last page
+
+        if next_offset >= self.PAGE_SIZE * self.max_pages:
+            return None
+
+        if stop_before and postings:
+            dates = [posted_at for _, posted_at, _ in postings]
+
+            # Newest-first pages: the rest are older than this page's oldest.
+            # Otherwise give up once a whole page is older than wanted.
+            if self.is_before(min(dates) if self.DATE_SORTED else max(dates), stop_before):
+                return None
+
+        return next_offset, self.page_request(role, next_offset)
+
+    def matched_role(self, title, role=None):
+        """The search role found in title (role=None tries all of them)"""
+
+        for candidate in ([role] if role else self.roles):
+            if candidate.lower() in title.lower():
+                return candidate
+        return None
+
+    def make_job(self, title, url, location, description, posted_at, role):
+        date_str, time_str = JobDateParser.format_datetime(posted_at)
+        salary_value = SalaryExtractor.parse(description)
+
+        return Job(
+            date_found=date_str,
+            time_found=time_str,
+            company=self.name,
+            title=title,
+            salary=SalaryExtractor.describe(salary_value),
+            salary_value=salary_value,
+            location=location or 'India',
+            portal=f"{self.name} Careers",
+            url=url,
+            description=(description or '')[:500],
+            search_role=role or 'General',
+            posted_at=posted_at
+        )
+
+    def is_before(self, posted_at, cutoff):
+        """
+        True if a posting dated posted_at went up before cutoff - by calendar
+        day for DAY_DATES adapters, whose "today" can be any time today
+        """
+
+        if self.DAY_DATES:
+            return posted_at.date() < cutoff.date()
+        return posted_at < cutoff
+
+    def collect(self, pages, cursors, since_time=None):
+        """
+        Jobs newer than the company's cursor and since_time, from the
+        postings of every page fetched (see read()). The cursor is only
+        advanced past the jobs returned, so a posting left out here is
+        looked at again next run.
+        """
+
+        jobs = []
+        emitted = []
+        seen = set()
+
+        for postings in pages:
+            for posting_id, posted_at, job in postings:
+                if posting_id in seen:
+                    continue  # Same posting found by another role
+                seen.add(posting_id)
+
+                if not cursors.is_new(self.name, posting_id, posted_at):
+                    continue
+
+                if since_time and self.is_before(posted_at, since_time):
+                    continue
+
+                jobs.append(job)
+                emitted.append((posting_id, posted_at))
+
+        cursors.advance(self.name, emitted)
+        return jobs
+
+
+def _strip_html(text):
+    return re.sub(r'\s+', ' ', re.sub(r'<[^>]+>', ' ', html.unescape(text or ''))).strip()
+
+
+def _local_datetime(value):
+    """ISO timestamp (maybe with offset) -> naive local datetime"""
+
+    posted_at = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return posted_at.astimezone().replace(tzinfo=None) if posted_at.tzinfo else posted_at
+
+
+@register_adapter('greenhouse')
+class GreenhouseAdapter(CompanyAdapter):
+    """boards-api.greenhouse.io - one request returns the whole board"""
+
+    def requests(self):
+        url = f"https://boards-api.greenhouse.io/v1/boards/{self.config['board']}/jobs?content=true"
+        return [(None, {'url': url})]
+
+    def parse(self, data, _role):
+        postings = []
+
+        for job in data.get('jobs', []):
+            title = job.get('title', '')
+            role = self.matched_role(title)
+            if not role:
+                continue
+
+            posted_at = _local_datetime(job.get('first_published') or job['updated_at'])
+            location = (job.get('location') or {}).get('name', '')
+
+            postings.append((
+                str(job['id']),
+                posted_at,
+                self.make_job(title, job.get('absolute_url', ''), location,
+                              _strip_html(job.get('content')), posted_at, role)
+            ))
+
+        return postings
+
+
+@register_adapter('workday')
+class WorkdayAdapter(CompanyAdapter):
+    """
+    Workday CXS search API (the JSON behind *.myworkdayjobs.com)
+
+    CXS has no sort option - results come by relevance - so paging stops
+    once a whole page is older than the since-time. 'total' is only sent
+    with the first page.
+    """
+
+    PAGE_SIZE = 20
+    DAY_DATES = True  # "Posted Today" / "Posted 2 Days Ago"
+
+    def page_request(self, role, offset):
+        return {
+            'url': f"https://{self.host}/wday/cxs/{self.config['tenant']}/{self.config['site']}/jobs",
+            'method': 'POST',
+            'json': {'appliedFacets': {}, 'limit': self.PAGE_SIZE, 'offset': offset, 'searchText': role},
+            'headers': {'Accept': 'application/json'}
+        }
+
+    def page_counts(self, data):
+        return len(data.get('jobPostings', [])), data.get('total', 0)
+
+    def parse(self, data, role):
+        postings = []
+
+        for job in data.get('jobPostings', []):
+            title = job.get('title', '')
+            path = job.get('externalPath', '')
+            if not title or not path:
+                continue
+
+            posting_id = (job.get('bulletFields') or [path])[0]
+            posted_at = JobDateParser.parse_relative_date(job.get('postedOn', ''))  # "Posted 2 Days Ago"
+            url = f"https://{self.host}/en-US/{self.config['site']}{path}"
+
+            postings.append((
+                str(posting_id),
+                posted_at,
+                self.make_job(title, url, job.get('locationsText', ''), '', posted_at, role)
+            ))
+
+        return postings
+
+
+@register_adapter('oracle')
+class OracleHCMAdapter(CompanyAdapter):
+    """Oracle Recruiting Cloud (Candidate Experience) REST finder, newest postings first"""
+
+    PAGE_SIZE = 25
+    DATE_SORTED = True
+    DAY_DATES = True  # PostedDate is a plain date
+
+    def page_request(self, role, offset):
+        site = self.config['site']
+        base = f"https://{self.host}/hcmRestApi/resources/latest/recruitingCEJobRequisitions"
+
+        return {
+            'url': f"{base}?onlyData=true&expand=requisitionList"
+                   f"&finder=findReqs;siteNumber={site},keyword=%22{quote(role)}%22,"
+                   f"sortBy=POSTING_DATES_DESC,limit={self.PAGE_SIZE},offset={offset}"
+        }
+
+    def page_counts(self, data):
+        searches = data.get('items', [])
+        returned = sum(len(search.get('requisitionList', [])) for search in searches)
+        total = searches[0].get('TotalJobsCount', 0) if searches else 0
+        return returned, total or 0
+
+    def parse(self, data, role):
+        postings = []
+        site = self.config['site']
+
+        for search in data.get('items', []):
+            for req in search.get('requisitionList', []):
+                title = req.get('Title', '')
+                if not title:
+                    continue
+
+                posted = req.get('PostedDate')
+                posted_at = datetime.fromisoformat(posted[:10]) if posted else datetime.now()
+                url = f"https://{self.host}/hcmUI/CandidateExperience/en/sites/{site}/job/{req['Id']}"
+
+                postings.append((
+                    str(req['Id']),
+                    posted_at,
+                    self.make_job(title, url, req.get('PrimaryLocation', ''),
+                                  req.get('ShortDescriptionStr', ''), posted_at, role)
+                ))
+
+        return postings
+
+
+@register_adapter('amazon')
+class AmazonAdapter(CompanyAdapter):
+    """amazon.jobs search.json"""
+
+    DAY_DATES = True  # "February 14, 2026"
+
+    def requests(self):
+        return [(role, {'url': self.config['url'].replace('{role}', quote(role))}) for role in self.roles]
+
+    @staticmethod
+    def _posted_at(value):
+        for fmt in ('%B %d, %Y', '%Y-%m-%d'):  # "February 14, 2026" / "2026-02-14"
+            try:
+                return datetime.strptime(value.split('T')[0], fmt)
+            except (ValueError, AttributeError):
+                continue
+        return datetime.now()
+
+    def parse(self, data, role):
+        postings = []
+
+        for job in data.get('jobs', [])[:20]:
+            posting_id = job.get('id_icims', '')
+            if not posting_id:
+                continue
+
+            posted_at = self._posted_at(job.get('posted_date', ''))
+            url = f"https://www.amazon.jobs/en/jobs/{posting_id}"
+            location = job.get('normalized_location') or job.get('location', '')
+
+            postings.append((
+                str(posting_id),
+                posted_at,
+                self.make_job(job.get('title', 'Unknown'), url, location,
+                              job.get('description_short', ''), posted_at, role)
+            ))
+
+        return postings
+
+
+def load_companies(path=None):
+    """Company configs from scrapers/companies.json"""
+
+    path = path or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'companies.json')
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# Test
+if __name__ == "__main__":
+    companies = load_companies()
+    roles = os.getenv('JOB_ROLES', 'Data Analyst').split(',')
+
+    print(f"Adapters: {', '.join(sorted(ADAPTERS))}")
+
+    for config in companies:
+        adapter = adapter_for(config, roles)
+        family = adapter.family if adapter else f"{config['type']} (browser)"
+        print(f"   {config['name'][:30]:30} {family}")
@@ -4,9 +4,7 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import requests
 from bs4 import BeautifulSoup
-import time
 from datetime import datetime, timedelta
 import os
 import sys
@@ -14,7 +12,11 @@ import json
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.salary_extractor import SalaryExtractor
-from utils.silent_browser import get_silent_driver
+from utils.job import Job
+from utils.silent_browser import lease_silent_driver, release_silent_driver, is_driver_crash
+from utils.page_waiter import PageWaiter
+from utils.async_fetcher import AsyncFetcher
+from scrapers.company_adapters import ADAPTERS, CompanyCursors, adapter_for, load_companies
 from dotenv import load_dotenv
 
 load_dotenv('config/.env')
@@ -30,8 +32,11 @@ class CompanyScraper:
             since_time (datetime): Only get jobs posted after this time
         """
         
-        self.driver = get_silent_driver()
+        self.driver = lease_silent_driver()
+        self.crashed = False  # Chrome died - don't hand it back to the pool
         self.wait = WebDriverWait(self.driver, 10)
+        self.waiter = PageWaiter(self.driver, self.wait, 'Company Careers')
+        self.fetcher = AsyncFetcher()  # JSON career APIs - pooled, per-host throttled
         self.jobs_found = []
         
         self.job_roles = os.getenv('JOB_ROLES', 'Data Analyst').split(',')
@@ -50,267 +55,156 @@ class CompanyScraper:
         if not self.since_time:
             return True  # No filter, accept all
         
-        # Get job posting date
+        # Full posting time when the scraper knows it
+        posted_at = job_data.get('posted_at')
+        if isinstance(posted_at, datetime):
+            return posted_at >= self.since_time
+        
+        # Otherwise only a date - compare by day, or every job posted on the
+        # day of the last run would read as midnight and be dropped
         posted_date_str = job_data.get('date_found')
         
         if not posted_date_str:
             # No date info - include it (better to have false positives)
             return True
         
-        try:
-            # Parse date
-            if isinstance(posted_date_str, str):
-                # Try multiple date formats
-                for fmt in ['%d-%b-%Y', '%Y-%m-%d', '%d/%m/%Y']:
-                    try:
-                        posted_date = datetime.strptime(posted_date_str, fmt)
-                        break
-                    except:
-                        continue
-                else:
-                    # Couldn't parse - include it
-                    return True
-            elif isinstance(posted_date_str, datetime):
-                posted_date = posted_date_str
-            else:
-                return True
-            
-            # Compare dates
-            return posted_date >= self.since_time
-            
-        except Exception as e:
-            # Error parsing - include job to be safe
-            return True
+        for fmt in ['%d-%b-%Y', '%Y-%m-%d', '%d/%m/%Y']:
+            try:
+                posted_date = datetime.strptime(posted_date_str, fmt)
+                return posted_date.date() >= self.since_time.date()
+            except (TypeError, ValueError):
+                continue
+        
+        # Couldn't parse - include it
+        return True
     
     def search_all_companies(self):
         """Search jobs across all target companies - WITH TIME FILTER"""
         
-        all_jobs = []
-        
-        # YOUR COMPANY LIST
-        companies = [
-            {"name": "Google", "url": "https://www.google.com/about/careers/applications/jobs/results/", "type": "api"},
-            {"name": "Meta (Facebook)", "url": "https://www.metacareers.com/jobs", "type": "ajax"},
-            {"name": "Amazon", "url": "https://www.amazon.jobs/en/job_categories/business-intelligence", "type": "html"},
-            {"name": "Apple", "url": "https://www.apple.com/careers/", "type": "ajax"},
-            {"name": "Microsoft", "url": "https://careers.microsoft.com/us/en", "type": "api"},
-            {"name": "Netflix", "url": "https://jobs.netflix.com/", "type": "ajax"},
-            {"name": "McKinsey & Company", "url": "https://www.mckinsey.com/careers/search-jobs", "type": "api"},
-            {"name": "Boston Consulting Group (BCG)", "url": "https://careers.bcg.com/search-jobs", "type": "ajax"},
-            {"name": "Bain & Company", "url": "https://www.bain.com/careers/roles/aci/", "type": "html"},
-            {"name": "Goldman Sachs", "url": "https://www.goldmansachs.com/careers/students/programs/", "type": "html"},
-            {"name": "J.P. Morgan Chase", "url": "https://jpmc.fa.oraclecloud.com/hcmUI/CandidateExperience/en/sites/CX_1001", "type": "api"},
-            {"name": "Jane Street", "url": "https://www.janestreet.com/join-jane-street/position-listing/", "type": "html"},
-            {"name": "Citadel", "url": "https://www.citadel.com/careers/open-opportunities/", "type": "ajax"},
-            {"name": "Two Sigma", "url": "https://www.twosigma.com/careers/", "type": "ajax"},
-            {"name": "BlackRock", "url": "https://blackrock.wd1.myworkdayjobs.com/BlackRock_External_Careers", "type": "api"},
-            
-            {"name": "Accenture", "url": "https://www.accenture.com/in-en/careers/jobsearch", "type": "ajax"},
-            {"name": "PwC", "url": "https://www.pwc.com/gx/en/careers.html", "type": "api"},
-            {"name": "EY (Ernst & Young)", "url": "https://www.ey.com/en_gl/careers", "type": "api"},
-            
-            {"name": "Salesforce", "url": "https://salesforce.wd1.myworkdayjobs.com/External_Career_Site", "type": "api"},
-            {"name": "Adobe", "url": "https://adobe.wd5.myworkdayjobs.com/external_experienced", "type": "api"},
-            {"name": "Uber", "url": "https://www.uber.com/us/en/careers/list/", "type": "ajax"},
-            {"name": "Airbnb", "url": "https://www.airbnb.com/careers/departments/data-science-analytics", "type": "html"},
-            {"name": "Palantir", "url": "https://www.palantir.com/careers/", "type": "html"},
-            {"name": "Snowflake", "url": "https://www.snowflake.com/en/company/careers/", "type": "ajax"},
-            {"name": "Databricks", "url": "https://www.databricks.com/company/careers", "type": "ajax"},
-            {"name": "NVIDIA", "url": "https://nvidia.wd5.myworkdayjobs.com/NVIDIAExternalCareerSite", "type": "api"},
-            {"name": "Tesla", "url": "https://www.tesla.com/careers/search/", "type": "api"},
-            {"name": "Oracle", "url": "https://eeho.fa.us2.oraclecloud.com/hcmUI/CandidateExperience/en/sites/CX_1", "type": "api"},
-            {"name": "IBM", "url": "https://www.ibm.com/careers/us-en/search/", "type": "api"},
-            {"name": "Cisco", "url": "https://jobs.cisco.com/jobs/SearchJobs", "type": "ajax"},
-            {"name": "Intel", "url": "https://jobs.intel.com/", "type": "api"},
-            {"name": "LinkedIn", "url": "https://www.linkedin.com/company/linkedin/jobs/", "type": "ajax"},
-            {"name": "Spotify", "url": "https://www.lifeatspotify.com/jobs", "type": "ajax"},
-            {"name": "Pinterest", "url": "https://www.pinterestcareers.com/", "type": "html"},
-            {"name": "Lyft", "url": "https://www.lyft.com/careers", "type": "ajax"},
-            {"name": "DoorDash", "url": "https://careers.doordash.com/", "type": "ajax"},
-            {"name": "Stripe", "url": "https://stripe.com/jobs/search", "type": "html"},
-            {"name": "PayPal", "url": "https://jobsearch.paypal-corp.com/", "type": "api"},
-            
-            {"name": "Visa", "url": "https://www.visa.co.in/careers.html", "type": "api"},
-            {"name": "Mastercard", "url": "https://mastercard.wd1.myworkdayjobs.com/CorporateCareers", "type": "api"},
-            {"name": "Morgan Stanley", "url": "https://www.morganstanley.com/people-opportunities/students-graduates", "type": "html"},
-            {"name": "HSBC", "url": "https://www.hsbc.com/careers/students-and-graduates", "type": "html"},
-            {"name": "Barclays", "url": "https://search.jobs.barclays/", "type": "api"},
-            {"name": "Standard Chartered", "url": "https://www.sc.com/en/careers/students-and-graduates/", "type": "html"},
-            {"name": "Capital One", "url": "https://www.capitalonecareers.com/", "type": "api"},
-            {"name": "Walmart Global Tech", "url": "https://careers.walmart.com/technology/data-science-analytics", "type": "api"},
-            {"name": "Target", "url": "https://jobs.target.com/", "type": "api"}
-            ]
-        
-        for company_config in companies:
-            print(f"\n🔎 Searching {company_config['name']}...")
-            
-            try:
-                jobs = self.scrape_company(company_config)
-                
-                # Filter by time if needed
-                if self.since_time:
-                    original_count = len(jobs)
-                    jobs = [j for j in jobs if self.is_job_recent_enough(j)]
-                    filtered_count = len(jobs)
-                    
-                    if original_count > filtered_count:
-                        print(f"   ⏭️  Filtered out {original_count - filtered_count} old jobs")
-                
-                all_jobs.extend(jobs)
-                
-                if jobs:
-                    print(f"   ✅ Found {len(jobs)} jobs at {company_config['name']}")
-                else:
-                    print(f"   ℹ️  No matching jobs at {company_config['name']}")
-                
-                time.sleep(2)  # Be polite
-                
-            except Exception as e:
-                print(f"   ❌ Error with {company_config['name']}: {str(e)[:80]}")
+        all_jobs = list(self.iter_jobs())
         
         self.jobs_found = all_jobs
         print(f"\n🎯 Total company jobs: {len(all_jobs)}")
         return all_jobs
     
-    def scrape_company(self, config):
-        """Scrape based on company type"""
+    def iter_jobs(self):
+        """Yield jobs company by company as each career page is scraped"""
         
-        if config['type'] == 'API':
-            return self.scrape_api(config)
-        elif config['type'] == 'AJAX':
-            return self.scrape_ajax(config)
-        else:
-            return self.scrape_html(config)
-    
-    def scrape_api(self, config):
-        """Scrape companies with JSON APIs"""
+        companies = load_companies()
         
-        jobs = []
+        # ATS-backed companies: every JSON request goes out at once, only
+        # postings newer than each company's cursor come back
+        adapters = [adapter for adapter in (adapter_for(c, self.job_roles) for c in companies) if adapter]
         
-        for role in self.job_roles:
-            role = role.strip()
-            url = config['url'].replace('{role}', role.replace(' ', '+'))
+        for adapter, jobs in self.fetch_adapters(adapters):
+            # Already cut at each posting's own timestamp (collect)
+            yield from self._finish_company(adapter.name, jobs, time_filter=False)
+        
+        # The rest still need a browser
+        browser_companies = [c for c in companies if c['type'].lower() not in ADAPTERS]
+        
+        for company_config in browser_companies:
+            if self.crashed:
+                print("   ❌ Browser crashed - skipping the remaining career pages")
+                break
+            
+            print(f"\n🔎 Searching {company_config['name']}...")
             
             try:
-                response = requests.get(url, timeout=10)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # Parse based on company
-                    if config['name'] == 'Amazon':
-                        jobs.extend(self.parse_amazon_api(data, role))
-                    elif config['name'] == 'Google':
-                        jobs.extend(self.parse_google_api(data, role))
+                jobs = self.scrape_company(company_config)
+                yield from self._finish_company(company_config['name'], jobs)
                 
             except Exception as e:
-                print(f"      API error: {str(e)[:60]}")
-        
-        return jobs
+                print(f"   ❌ Error with {company_config['name']}: {str(e)[:80]}")
     
-    def parse_amazon_api(self, data, search_role):
-        """Parse Amazon Jobs API response - WITH DATE EXTRACTION"""
-        
-        jobs = []
-        
-        try:
-            job_list = data.get('jobs', [])
+    def _finish_company(self, name, jobs, time_filter=True):
+        """Time filter + report for one company's jobs"""
+        
+        # Filter by time if needed
+        if self.since_time and time_filter:
+            original_count = len(jobs)
+            jobs = [j for j in jobs if self.is_job_recent_enough(j)]
+            filtered_count = len(jobs)
             
-            for job in job_list[:20]:  # Limit to 20
-                title = job.get('title', 'Unknown')
-                company = 'Amazon'
-                location = ', '.join(job.get('locations', ['India']))
-                url = f"https://www.amazon.jobs/en/jobs/{job.get('id_icims', '')}"
-                description = job.get('description_short', '')
-                
-                # CRITICAL: Extract posted date from API
-                posted_date_raw = job.get('posted_date', '')  # Amazon provides this
-                
-                if posted_date_raw:
-                    try:
-                        # Amazon format: "2026-02-14" or timestamp
-                        posted_dt = datetime.fromisoformat(posted_date_raw.split('T')[0])
-                    except:
-                        posted_dt = datetime.now()
-                else:
-                    posted_dt = datetime.now()
-                
-                # Format date
-                date_str = posted_dt.strftime('%d-%b-%Y')
-                time_str = posted_dt.strftime('%I:%M %p')
-                
-                salary = SalaryExtractor.extract(description)
-                
-                if SalaryExtractor.meets_criteria(salary, self.min_salary):
-                    jobs.append({
-                        'date_found': date_str,
-                        'time_found': time_str,
-                        'company': company,
-                        'title': title,
-                        'salary': salary,
-                        'location': location,
-                        'portal': 'Amazon Careers',
-                        'url': url,
-                        'description': description,
-                        'search_role': search_role,
-                        '_posted_datetime': posted_dt  # Store for filtering
-                    })
+            if original_count > filtered_count:
+                print(f"   ⏭️  Filtered out {original_count - filtered_count} old jobs")
         
-        except Exception as e:
-            print(f"      Parse error: {str(e)[:50]}")
+        if jobs:
+            print(f"   ✅ Found {len(jobs)} jobs at {name}")
+        else:
+            print(f"   ℹ️  No matching jobs at {name}")
         
         return jobs
     
-    def parse_google_api(self, data, search_role):
-        """Parse Google Careers API response - WITH DATE"""
+    def fetch_adapters(self, adapters):
+        """
+        Run every adapter's requests concurrently, round by round - each
+        round fetches the next page of every search that still has newer
+        postings to give
+        Returns: [(adapter, new jobs meeting the salary bar)]
+        """
         
-        jobs = []
+        if not adapters:
+            return []
         
-        try:
-            job_list = data.get('jobs', [])
+        cursors = CompanyCursors()
+        pages = {adapter.name: [] for adapter in adapters}
+        
+        # (adapter, role, offset, request) still to fetch
+        pending = [(adapter, role, 0, request) for adapter in adapters for role, request in adapter.requests()]
+        print(f"\n⚡ Fetching {len(pending)} career API requests for {len(adapters)} companies...")
+        
+        total_requests = 0
+        
+        while pending:
+            total_requests += len(pending)
+            results = self.fetcher.fetch_all([request for _, _, _, request in pending])
             
-            for job in job_list[:20]:
-                title = job.get('title', 'Unknown')
-                company = 'Google'
-                location = ', '.join([loc.get('display', '') for loc in job.get('locations', [])])
-                url = f"https://careers.google.com/jobs/results/{job.get('id', '')}"
-                description = job.get('description', '')
-                
-                # Extract posted date
-                posted_date_raw = job.get('publish_date', '')
-                
-                if posted_date_raw:
-                    try:
-                        posted_dt = datetime.fromisoformat(posted_date_raw.split('T')[0])
-                    except:
-                        posted_dt = datetime.now()
-                else:
-                    posted_dt = datetime.now()
-                
-                date_str = posted_dt.strftime('%d-%b-%Y')
-                time_str = posted_dt.strftime('%I:%M %p')
+            next_round = []
+            
+            for (adapter, role, offset, _), result in zip(pending, results):
+                page = adapter.read(result, role)
+                if page is None:
+                    continue
                 
-                salary = SalaryExtractor.extract(description)
+                data, postings = page
+                pages[adapter.name].append(postings)
                 
-                if SalaryExtractor.meets_criteria(salary, self.min_salary):
-                    jobs.append({
-                        'date_found': date_str,
-                        'time_found': time_str,
-                        'company': company,
-                        'title': title,
-                        'salary': salary,
-                        'location': location,
-                        'portal': 'Google Careers',
-                        'url': url,
-                        'description': description[:500],
-                        'search_role': search_role,
-                        '_posted_datetime': posted_dt
-                    })
+                follow_up = adapter.next_request(role, offset, data, postings, self._stop_before(adapter, cursors))
+                if follow_up:
+                    next_offset, request = follow_up
+                    next_round.append((adapter, role, next_offset, request))
+            
+            if next_round:
+                print(f"   ↪️  {len(next_round)} searches have more pages...")
+            pending = next_round
         
-        except Exception as e:
-            print(f"      Parse error: {str(e)[:50]}")
+        print(f"   📡 {total_requests} requests in total")
+        fetched = []
         
-        return jobs
+        for adapter in adapters:
+            print(f"\n🔎 {adapter.name} ({adapter.family} API)...")
+            jobs = adapter.collect(pages[adapter.name], cursors, self.since_time)
+            jobs = [job for job in jobs if SalaryExtractor.meets_criteria(job['salary_value'], self.min_salary)]
+            fetched.append((adapter, jobs))
+        
+        cursors.save()
+        return fetched
+    
+    def _stop_before(self, adapter, cursors):
+        """Oldest posting date still worth paging for: the company cursor or since_time"""
+        
+        dates = [d for d in (cursors.oldest_wanted(adapter.name), self.since_time) if d]
+        return max(dates) if dates else None
+    
+    def scrape_company(self, config):
+        """Scrape based on company type"""
+        
+        # companies.json types are lowercase ('ajax' / 'html')
+        if config['type'].lower() == 'ajax':
+            return self.scrape_ajax(config)
+        else:
+            return self.scrape_html(config)
     
     def scrape_html(self, config):
         """Scrape HTML-based career pages"""
@@ -323,17 +217,12 @@ class CompanyScraper:
             
             try:
                 self.driver.get(url)
-                time.sleep(4)
                 
-                # Scroll
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-                
-                # Find job cards
-                if 'selector' in config:
-                    job_cards = self.driver.find_elements(By.CSS_SELECTOR, config['selector'])
-                else:
-                    job_cards = self.driver.find_elements(By.CSS_SELECTOR, 'div[class*="job"]')
+                # Find job cards as soon as they render, then scroll once for more
+                card_locator = (By.CSS_SELECTOR, config.get('selector', 'div[class*="job"]'))
+                card_locator, job_cards = self.waiter.wait_for_cards([card_locator], budget=4)
+                if card_locator:
+                    job_cards = self.waiter.scroll_until_stable(card_locator, max_scrolls=1)
                 
                 for card in job_cards[:10]:
                     try:
@@ -345,24 +234,28 @@ class CompanyScraper:
                             # Use current time as posted time (best guess for HTML scrapers)
                             now = datetime.now()
                             
-                            jobs.append({
-                                'date_found': now.strftime('%d-%b-%Y'),
-                                'time_found': now.strftime('%I:%M %p'),
-                                'company': config['name'],
-                                'title': title,
-                                'salary': 'Not mentioned',
-                                'location': 'India',
-                                'portal': f"{config['name']} Careers",
-                                'url': url,
-                                'description': '',
-                                'search_role': role,
-                                '_posted_datetime': now
-                            })
+                            jobs.append(Job(
+                                date_found=now.strftime('%d-%b-%Y'),
+                                time_found=now.strftime('%I:%M %p'),
+                                company=config['name'],
+                                title=title,
+                                salary='Not mentioned',
+                                salary_value=None,
+                                location='India',
+                                portal=f"{config['name']} Careers",
+                                url=url,
+                                description='',
+                                search_role=role,
+                                posted_at=now
+                            ))
                     except:
                         continue
                 
             except Exception as e:
                 print(f"      HTML scrape error: {str(e)[:60]}")
+                if is_driver_crash(e):
+                    self.crashed = True
+                    break
         
         return jobs
     
@@ -373,15 +266,12 @@ class CompanyScraper:
         
         try:
             self.driver.get(config['url'])
-            time.sleep(8)
-            
-            # Scroll
-            for _ in range(3):
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
             
-            # Find job listings
-            job_elements = self.driver.find_elements(By.XPATH, "//a[contains(@href, 'job') or contains(@href, 'career')]")
+            # Wait for job links to render, then scroll until no more load
+            link_locator = (By.XPATH, "//a[contains(@href, 'job') or contains(@href, 'career')]")
+            link_locator, job_elements = self.waiter.wait_for_cards([link_locator], budget=8)
+            if link_locator:
+                job_elements = self.waiter.scroll_until_stable(link_locator, max_scrolls=3)
             
             for elem in job_elements[:10]:
                 try:
@@ -391,31 +281,34 @@ class CompanyScraper:
                     if len(title) > 10:
                         now = datetime.now()
                         
-                        jobs.append({
-                            'date_found': now.strftime('%d-%b-%Y'),
-                            'time_found': now.strftime('%I:%M %p'),
-                            'company': config['name'],
-                            'title': title,
-                            'salary': 'Not mentioned',
-                            'location': 'India',
-                            'portal': f"{config['name']} Careers",
-                            'url': url,
-                            'description': '',
-                            'search_role': 'General',
-                            '_posted_datetime': now
-                        })
+                        jobs.append(Job(
+                            date_found=now.strftime('%d-%b-%Y'),
+                            time_found=now.strftime('%I:%M %p'),
+                            company=config['name'],
+                            title=title,
+                            salary='Not mentioned',
+                            salary_value=None,
+                            location='India',
+                            portal=f"{config['name']} Careers",
+                            url=url,
+                            description='',
+                            search_role='General',
+                            posted_at=now
+                        ))
                 except:
                     continue
         
         except Exception as e:
             print(f"      AJAX error: {str(e)[:60]}")
+            self.crashed = self.crashed or is_driver_crash(e)
         
         return jobs
     
     def close(self):
-        """Close browser"""
-        self.driver.quit()
-        print("🔒 Company scraper browser closed")
+        """Return browser to the pool"""
+        release_silent_driver(self.driver, crashed=self.crashed)
+        self.fetcher.close()
+        print("🔒 Company scraper browser released")
 
 
 # Test
@@ -3,6 +3,7 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
 import time
 from datetime import datetime
 import os
@@ -10,20 +11,51 @@ import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.salary_extractor import SalaryExtractor
+from utils.job import Job
+from utils.silent_browser import lease_silent_driver, release_silent_driver, is_driver_crash
+from utils.search_urls import SearchUrlBuilder
+from utils.page_waiter import RecencyCutoff
+from utils.card_extractor import CardExtractor
+from utils.date_parser import JobDateParser
 from dotenv import load_dotenv
 
 load_dotenv('config/.env')
 
 class FounditScraper:
+    CARD_LOCATORS = [
+        (By.CSS_SELECTOR, 'div[class*="jobCard"]'),
+        (By.CSS_SELECTOR, 'article.job-result'),
+    ]
+    
+    POSTED_LOCATORS = [
+        (By.CSS_SELECTOR, 'span[class*="jobAddedTime"]'),
+        (By.CSS_SELECTOR, 'span.timeText'),
+    ]
+    
+    # Read for every card in one execute_script call (CardExtractor)
+    CARD_FIELDS = {
+        'title': [('a[data-testid="job-title"]', 'text')],
+        'url': [('a[data-testid="job-title"]', 'href')],
+        'company': [('a[data-testid="company-name"]', 'text')],
+        'salary': [('div[data-testid="salary"]', 'text')],
+        'location': [('div[data-testid="location"]', 'text')],
+        'experience': [('div[data-testid="experience"]', 'text')],
+        'posted': [('span[class*="jobAddedTime"]', 'text'), ('span.timeText', 'text')],
+    }
+    
     def __init__(self,since_time=None):
         """Initialize Foundit scraper in SILENT mode"""
         
         import sys
         import os
         sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        from utils.silent_browser import get_silent_driver
+        from utils.page_waiter import PageWaiter
         
-        self.driver = get_silent_driver()
+        self.driver = lease_silent_driver()
+        self.crashed = False  # Chrome died - don't hand it back to the pool
+        self.wait = WebDriverWait(self.driver, 10)
+        self.waiter = PageWaiter(self.driver, self.wait, 'Foundit')
+        self.extractor = CardExtractor(self.driver, self.CARD_FIELDS)
         self.jobs_found = []
         
         self.job_roles = os.getenv('JOB_ROLES', 'Data Analyst').split(',')
@@ -35,59 +67,52 @@ class FounditScraper:
     def search_jobs(self):
         """Search for jobs on Foundit"""
         
-        all_jobs = []
+        all_jobs = list(self.iter_jobs())
+        
+        self.jobs_found = all_jobs
+        print(f"\n🎯 Total Foundit jobs: {len(all_jobs)}")
+        return all_jobs
+    
+    def iter_jobs(self):
+        """Yield Foundit jobs one by one as they are scraped"""
         
         for role in self.job_roles:
             role = role.strip()
             print(f"\n🔎 Searching Foundit for: {role}")
             
-            if self.since_time:
-                # Calculate hours since last run
-                from datetime import datetime
-                now = datetime.now()
-                hours_ago = int((now - self.since_time).total_seconds() / 3600)
-                
-                # LinkedIn time filters:
-                # r86400 = last 24 hours
-                # r604800 = last week
-                # r2592000 = last month
-                
-                if hours_ago <= 24:
-                    time_filter = 'r86400'  # Last 24 hours
-                elif hours_ago <= 168:  # 7 days
-                    time_filter = 'r604800'  # Last week
-                else:
-                    time_filter = 'r2592000'  # Last month
-                
-                search_url = f"https://www.linkedin.com/jobs/search/?keywords={role}&location=India&sortBy=DD&f_TPR={time_filter}"
-            else:
-                # No filter - get recent jobs
-                search_url = f"https://www.linkedin.com/jobs/search/?keywords={role}&location=India&sortBy=DD"
+            # Portal's own recency filter, as fine as it goes
+            search_url = SearchUrlBuilder.foundit(role, self.since_time)
             
             try:
                 self.driver.get(search_url)
-                time.sleep(5)
-                
-                # Scroll
-                for _ in range(3):
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(2)
                 
-                # Find job cards
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, 'div[class*="jobCard"]')
+                # Results aren't sorted by date - skip cards that predate the
+                # last run, but keep reading (a newer card can come after them)
+                cutoff = RecencyCutoff(self.since_time, self.POSTED_LOCATORS, newest_first=False)
                 
-                if not job_cards:
-                    job_cards = self.driver.find_elements(By.CSS_SELECTOR, 'article.job-result')
+                # Wait for job cards, then scroll until no more load
+                card_locator, job_cards = self.waiter.wait_for_cards(self.CARD_LOCATORS, budget=5)
+                if card_locator:
+                    job_cards = self.waiter.scroll_until_stable(card_locator, max_scrolls=3, stop=cutoff.last_card_is_past)
                 
                 print(f"   Found {len(job_cards)} job cards")
                 
-                for idx, card in enumerate(job_cards[:20], 1):
+                # Every card's fields in one round trip
+                cards = self.extractor.extract(job_cards[:20])
+                
+                for idx, fields in enumerate(cards, 1):
+                    if cutoff.skip(JobDateParser.latest_possible(fields['posted'])):
+                        if cutoff.done:
+                            print("   ⏹️  Reached jobs posted before the last run - stopping")
+                            break
+                        continue
+                    
                     try:
-                        job_data = self.extract_job_details(card, role)
+                        job_data = self.extract_job_details(fields, role)
                         
-                        if job_data and SalaryExtractor.meets_criteria(job_data['salary'], self.min_salary):
-                            all_jobs.append(job_data)
+                        if job_data and SalaryExtractor.meets_criteria(job_data['salary_value'], self.min_salary):
                             print(f"   ✅ {idx}. {job_data['title'][:40]} - {job_data['salary']}")
+                            yield job_data
                         
                     except Exception as e:
                         print(f"   ⚠️  Error on job {idx}: {str(e)[:60]}")
@@ -95,65 +120,39 @@ class FounditScraper:
                 
             except Exception as e:
                 print(f"   ❌ Error: {str(e)[:100]}")
+                if is_driver_crash(e):
+                    self.crashed = True
+                    break
         
-        self.jobs_found = all_jobs
-        print(f"\n🎯 Total Foundit jobs: {len(all_jobs)}")
-        return all_jobs
     
-    def extract_job_details(self, card, search_role):
-        """Extract details from Foundit job card"""
+    def extract_job_details(self, fields, search_role):
+        """Build a Job from one Foundit card's fields (CARD_FIELDS)"""
         
-        # Title
-        try:
-            title_elem = card.find_element(By.CSS_SELECTOR, 'a[data-testid="job-title"]')
-            title = title_elem.text.strip()
-            url = title_elem.get_attribute('href')
-        except:
+        title, url = fields['title'], fields['url']
+        if not title or not url:
             return None
         
-        # Company
-        try:
-            company = card.find_element(By.CSS_SELECTOR, 'a[data-testid="company-name"]').text.strip()
-        except:
-            company = 'Unknown'
-        
-        # Salary
-        try:
-            salary_elem = card.find_element(By.CSS_SELECTOR, 'div[data-testid="salary"]')
-            salary = SalaryExtractor.extract(salary_elem.text)
-        except:
-            salary = 'Not mentioned'
-        
-        # Location
-        try:
-            location = card.find_element(By.CSS_SELECTOR, 'div[data-testid="location"]').text.strip()
-        except:
-            location = 'India'
-        
-        # Experience
-        try:
-            experience = card.find_element(By.CSS_SELECTOR, 'div[data-testid="experience"]').text.strip()
-        except:
-            experience = 'Not mentioned'
+        salary_value = SalaryExtractor.parse(fields['salary'])
         
-        return {
-            'date_found': datetime.now().strftime('%Y-%m-%d'),
-            'time_found': datetime.now().strftime('%H:%M:%S'),
-            'company': company,
-            'title': title,
-            'salary': salary,
-            'location': location,
-            'portal': 'Foundit',
-            'url': url if url.startswith('http') else f"https://www.foundit.in{url}",
-            'description': '',
-            'experience': experience,
-            'search_role': search_role
-        }
+        return Job(
+            date_found=datetime.now().strftime('%Y-%m-%d'),
+            time_found=datetime.now().strftime('%H:%M:%S'),
+            company=fields['company'] or 'Unknown',
+            title=title,
+            salary=SalaryExtractor.describe(salary_value),
+            salary_value=salary_value,
+            location=fields['location'] or 'India',
+            portal='Foundit',
+            url=url if url.startswith('http') else f"https://www.foundit.in{url}",
+            description='',
+            experience=fields['experience'] or 'Not mentioned',
+            search_role=search_role
+        )
     
     def close(self):
-        """Close browser"""
-        self.driver.quit()
-        print("🔒 Foundit browser closed")
+        """Return browser to the pool"""
+        release_silent_driver(self.driver, crashed=self.crashed)
+        print("🔒 Foundit browser released")
 
 
 if __name__ == "__main__":
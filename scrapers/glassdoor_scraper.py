@@ -13,21 +13,50 @@ import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.salary_extractor import SalaryExtractor
+from utils.job import Job
+from utils.silent_browser import lease_silent_driver, release_silent_driver, is_driver_crash
+from utils.search_urls import SearchUrlBuilder
+from utils.page_waiter import RecencyCutoff
+from utils.card_extractor import CardExtractor
+from utils.date_parser import JobDateParser
 from dotenv import load_dotenv
 
 load_dotenv('config/.env')
 
 class GlassdoorScraper:
+    CARD_LOCATORS = [
+        (By.CSS_SELECTOR, 'li[data-test="jobListing"]'),
+        (By.CSS_SELECTOR, 'div.JobsList_jobListItem__JBBUV'),
+    ]
+    DETAIL_LOCATOR = (By.CSS_SELECTOR, 'div.JobDetails_jobDescription__uW_fK')
+    
+    POSTED_LOCATORS = [
+        (By.CSS_SELECTOR, 'div[data-test="job-age"]'),  # "24h", "2d", "30d+"
+    ]
+    
+    # Read for every card in one execute_script call (CardExtractor)
+    CARD_FIELDS = {
+        'title': [('a[data-test="job-link"]', 'text'), ('a.JobCard_jobTitle__GLqEV', 'text')],
+        'url': [('a[data-test="job-link"]', 'href'), ('a.JobCard_jobTitle__GLqEV', 'href')],
+        'company': [('span[data-test="employer-name"]', 'text'), ('div.EmployerProfile_employerName__Xemli', 'text')],
+        'location': [('span[data-test="emp-location"]', 'text')],
+        'salary': [('span[data-test="detailSalary"]', 'text')],
+        'posted': [('div[data-test="job-age"]', 'text')],
+    }
+    
     def __init__(self,since_time=None):
         """Initialize Glassdoor scraper in SILENT mode"""
         
         import sys
         import os
         sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        from utils.silent_browser import get_silent_driver
+        from utils.page_waiter import PageWaiter
         
-        self.driver = get_silent_driver()
+        self.driver = lease_silent_driver()
+        self.crashed = False  # Chrome died - don't hand it back to the pool
         self.wait = WebDriverWait(self.driver, 10)
+        self.waiter = PageWaiter(self.driver, self.wait, 'Glassdoor')
+        self.extractor = CardExtractor(self.driver, self.CARD_FIELDS)
         self.jobs_found = []
         
         self.job_roles = os.getenv('JOB_ROLES', 'Data Analyst').split(',')
@@ -39,67 +68,60 @@ class GlassdoorScraper:
     def search_jobs(self):
         """Search for jobs on Glassdoor"""
         
-        all_jobs = []
+        all_jobs = list(self.iter_jobs())
+        
+        self.jobs_found = all_jobs
+        print(f"\n🎯 Total Glassdoor jobs: {len(all_jobs)}")
+        return all_jobs
+    
+    def iter_jobs(self):
+        """Yield Glassdoor jobs one by one as they are scraped"""
         
         for role in self.job_roles:
             role = role.strip()
             print(f"\n🔎 Searching Glassdoor for: {role}")
             
-            if self.since_time:
-                # Calculate hours since last run
-                from datetime import datetime
-                now = datetime.now()
-                hours_ago = int((now - self.since_time).total_seconds() / 3600)
-                
-                # LinkedIn time filters:
-                # r86400 = last 24 hours
-                # r604800 = last week
-                # r2592000 = last month
-                
-                if hours_ago <= 24:
-                    time_filter = 'r86400'  # Last 24 hours
-                elif hours_ago <= 168:  # 7 days
-                    time_filter = 'r604800'  # Last week
-                else:
-                    time_filter = 'r2592000'  # Last month
-                
-                search_url = f"https://www.linkedin.com/jobs/search/?keywords={role}&location=India&sortBy=DD&f_TPR={time_filter}"
-            else:
-                # No filter - get recent jobs
-                search_url = f"https://www.linkedin.com/jobs/search/?keywords={role}&location=India&sortBy=DD"
+            # Portal's own recency filter, as fine as it goes
+            search_url = SearchUrlBuilder.glassdoor(role, self.since_time)
             
             try:
                 self.driver.get(search_url)
-                time.sleep(5)
                 
-                # Close popup if present
+                # Newest first - stop scrolling/reading once cards predate the last run
+                cutoff = RecencyCutoff(self.since_time, self.POSTED_LOCATORS)
+                
+                card_locator, job_cards = self.waiter.wait_for_cards(self.CARD_LOCATORS, budget=5)
+                
+                # Close popup if present (cards are rendered, so it would be too)
                 try:
-                    close_btn = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'button[alt="Close"]')))
-                    close_btn.click()
-                    time.sleep(1)
+                    close_btns = self.driver.find_elements(By.CSS_SELECTOR, 'button[alt="Close"]')
+                    if close_btns:
+                        close_btns[0].click()
                 except:
                     pass
                 
-                # Scroll to load jobs
-                for _ in range(2):
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(2)
-                
-                # Find job cards
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, 'li[data-test="jobListing"]')
-                
-                if not job_cards:
-                    job_cards = self.driver.find_elements(By.CSS_SELECTOR, 'div.JobsList_jobListItem__JBBUV')
+                # Scroll until no more jobs load
+                if card_locator:
+                    job_cards = self.waiter.scroll_until_stable(card_locator, max_scrolls=2, stop=cutoff.last_card_is_past)
                 
                 print(f"   Found {len(job_cards)} job cards")
                 
-                for idx, card in enumerate(job_cards[:15], 1):
+                # Every card's fields in one round trip (the detail panel still needs a click per card)
+                cards = self.extractor.extract(job_cards[:15])
+                
+                for idx, (card, fields) in enumerate(zip(job_cards, cards), 1):
+                    if cutoff.skip(JobDateParser.latest_possible(fields['posted'])):
+                        if cutoff.done:
+                            print("   ⏹️  Reached jobs posted before the last run - stopping")
+                            break
+                        continue
+                    
                     try:
-                        job_data = self.extract_job_details(card, role)
+                        job_data = self.extract_job_details(card, fields, role)
                         
-                        if job_data and SalaryExtractor.meets_criteria(job_data['salary'], self.min_salary):
-                            all_jobs.append(job_data)
+                        if job_data and SalaryExtractor.meets_criteria(job_data['salary_value'], self.min_salary):
                             print(f"   ✅ {idx}. {job_data['title'][:35]} - {job_data['salary']}")
+                            yield job_data
                         
                     except Exception as e:
                         print(f"   ⚠️  Error on job {idx}: {str(e)[:60]}")
@@ -107,108 +129,66 @@ class GlassdoorScraper:
                 
             except Exception as e:
                 print(f"   ❌ Error: {str(e)[:100]}")
+                if is_driver_crash(e):
+                    self.crashed = True
+                    break
         
-        self.jobs_found = all_jobs
-        print(f"\n🎯 Total Glassdoor jobs: {len(all_jobs)}")
-        return all_jobs
     
-    def extract_job_details(self, card, search_role):
-        """Extract details from Glassdoor job card"""
+    def extract_job_details(self, card, fields, search_role):
+        """Build a Job from one Glassdoor card's fields (CARD_FIELDS) + its detail panel"""
         
-        # Click card to load details
-        try:
-            card.click()
-            time.sleep(2)
-        except:
-            pass
+        # Title - link text, else the first line of the card
+        title = fields['title'] or fields['text'].split('\n')[0]
+        url = fields['url']
         
-        # Title and URL
-        # FIXED: Better title extraction
-        title = None
-        url = None
-
-        try:
-            # Method 1: Direct link
-            title_elem = card.find_element(By.CSS_SELECTOR, 'a[data-test="job-link"]')
-            title = title_elem.text.strip()
-            url = title_elem.get_attribute('href')
-        except:
-            try:
-                # Method 2: Alternative selector
-                title_elem = card.find_element(By.CSS_SELECTOR, 'a.JobCard_jobTitle__GLqEV')
-                title = title_elem.text.strip()
-                url = title_elem.get_attribute('href')
-            except:
-                try:
-                    # Method 3: Get from card text
-                    card_text = card.text.strip().split('\n')
-                    if len(card_text) > 0:
-                        title = card_text[0]
-                except:
-                    pass
-
-        if not title or len(title) < 5:
+        if not title or len(title) < 5 or not url:
             return None
-
-        # Don't click card (causes issues), just use card data
-                
-        # Company
-        try:
-            company = card.find_element(By.CSS_SELECTOR, 'span[data-test="employer-name"]').text.strip()
-        except:
-            try:
-                company = card.find_element(By.CSS_SELECTOR, 'div.EmployerProfile_employerName__Xemli').text.strip()
-            except:
-                company = 'Unknown'
         
-        # Location
+        # Click card to load details
         try:
-            location = card.find_element(By.CSS_SELECTOR, 'span[data-test="emp-location"]').text.strip()
+            self.waiter.click_and_wait(card, self.DETAIL_LOCATOR)
         except:
-            location = 'India'
+            pass
         
         # Salary - try from card first, then from detail panel
-        salary = 'Not mentioned'
-        try:
-            salary_elem = card.find_element(By.CSS_SELECTOR, 'span[data-test="detailSalary"]')
-            salary = SalaryExtractor.extract(salary_elem.text)
-        except:
-            # Try from detail panel
+        salary_value = SalaryExtractor.parse(fields['salary'])
+        if salary_value is None:
             try:
                 detail_salary = self.driver.find_element(By.CSS_SELECTOR, 'span.SalaryEstimate_salaryEstimate__vZYCr')
-                salary = SalaryExtractor.extract(detail_salary.text)
+                salary_value = SalaryExtractor.parse(detail_salary.text)
             except:
                 pass
         
         # Description from detail panel
         description = ''
         try:
-            desc_elem = self.driver.find_element(By.CSS_SELECTOR, 'div.JobDetails_jobDescription__uW_fK')
+            desc_elem = self.driver.find_element(*self.DETAIL_LOCATOR)
             description = desc_elem.text.strip()
             
             # Extract salary from description if not found yet
-            if salary == 'Not mentioned':
-                salary = SalaryExtractor.extract(description)
+            if salary_value is None:
+                salary_value = SalaryExtractor.parse(description)
         except:
             pass
         
-        return {
-            'date_found': datetime.now().strftime('%Y-%m-%d'),
-            'time_found': datetime.now().strftime('%H:%M:%S'),
-            'company': company,
-            'title': title,
-            'salary': salary,
-            'location': location,
-            'portal': 'Glassdoor',
-            'url': f"https://www.glassdoor.co.in{url}" if not url.startswith('http') else url,
-            'description': description,
-            'search_role': search_role
-        }
+        return Job(
+            date_found=datetime.now().strftime('%Y-%m-%d'),
+            time_found=datetime.now().strftime('%H:%M:%S'),
+            company=fields['company'] or 'Unknown',
+            title=title,
+            salary=SalaryExtractor.describe(salary_value),
+            salary_value=salary_value,
+            location=fields['location'] or 'India',
+            portal='Glassdoor',
+            url=f"https://www.glassdoor.co.in{url}" if not url.startswith('http') else url,
+            description=description,
+            search_role=search_role
+        )
     
     def close(self):
-        """Close browser"""
-        self.driver.quit()
-        print("🔒 Glassdoor browser closed")
+        """Return browser to the pool"""
+        release_silent_driver(self.driver, crashed=self.crashed)
+        print("🔒 Glassdoor browser released")
 
 
 if __name__ == "__main__":
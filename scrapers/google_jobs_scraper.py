@@ -8,6 +8,8 @@ import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.salary_extractor import SalaryExtractor
+from utils.job import Job
+from utils.search_urls import SearchUrlBuilder
 from dotenv import load_dotenv
 
 load_dotenv('config/.env')
@@ -26,7 +28,14 @@ class GoogleJobsScraper:
     def search_jobs(self):
         """Search using direct Google search URLs"""
         
-        all_jobs = []
+        all_jobs = list(self.iter_jobs())
+        
+        self.jobs_found = all_jobs
+        print(f"\n🎯 Total Google Jobs: {len(all_jobs)}")
+        return all_jobs
+    
+    def iter_jobs(self):
+        """Yield Google search results one by one as they are found"""
         
         for role in self.job_roles:
             role = role.strip()
@@ -34,28 +43,8 @@ class GoogleJobsScraper:
             
             # Build Google search URL
             query = f"{role} job India site:linkedin.com OR site:naukri.com"
-            if self.since_time:
-            # Calculate hours since last run
-                from datetime import datetime
-                now = datetime.now()
-                hours_ago = int((now - self.since_time).total_seconds() / 3600)
-                
-                # LinkedIn time filters:
-                # r86400 = last 24 hours
-                # r604800 = last week
-                # r2592000 = last month
-                
-                if hours_ago <= 24:
-                    time_filter = 'r86400'  # Last 24 hours
-                elif hours_ago <= 168:  # 7 days
-                    time_filter = 'r604800'  # Last week
-                else:
-                    time_filter = 'r2592000'  # Last month
-                
-                search_url = f"https://www.linkedin.com/jobs/search/?keywords={role}&location=India&sortBy=DD&f_TPR={time_filter}"
-            else:
-                # No filter - get recent jobs
-                search_url = f"https://www.linkedin.com/jobs/search/?keywords={role}&location=India&sortBy=DD"
+            # Portal's own recency filter, as fine as it goes
+            search_url = SearchUrlBuilder.google(query, self.since_time)
             
             
             try:
@@ -82,20 +71,21 @@ class GoogleJobsScraper:
                                 href = href.split('/url?q=')[1].split('&')[0]
                             
                             if href.startswith('http'):
-                                job_data = {
-                                    'date_found': datetime.now().strftime('%d-%b-%Y'),
-                                    'time_found': datetime.now().strftime('%I:%M %p'),
-                                    'company': 'Unknown',
-                                    'title': f"{role} (via Google)",
-                                    'salary': 'Not mentioned',
-                                    'location': 'India',
-                                    'portal': 'Google Search',
-                                    'url': href,
-                                    'description': '',
-                                    'search_role': role
-                                }
+                                job_data = Job(
+                                    date_found=datetime.now().strftime('%d-%b-%Y'),
+                                    time_found=datetime.now().strftime('%I:%M %p'),
+                                    company='Unknown',
+                                    title=f"{role} (via Google)",
+                                    salary='Not mentioned',
+                                    salary_value=None,
+                                    location='India',
+                                    portal='Google Search',
+                                    url=href,
+                                    description='',
+                                    search_role=role
+                                )
                                 
-                                all_jobs.append(job_data)
+                                yield job_data
                                 job_count += 1
                                 
                                 if job_count >= 5:  # Limit to 5 per role
@@ -108,9 +98,6 @@ class GoogleJobsScraper:
             except Exception as e:
                 print(f"   ❌ Error: {str(e)[:80]}")
         
-        self.jobs_found = all_jobs
-        print(f"\n🎯 Total Google Jobs: {len(all_jobs)}")
-        return all_jobs
     
     def close(self):
         """No browser to close"""
@@ -3,12 +3,15 @@
 import feedparser
 import requests
 from bs4 import BeautifulSoup
-from datetime import datetime
+from datetime import datetime, timezone
 import os
 import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.salary_extractor import SalaryExtractor
+from utils.job import Job
+from utils.search_urls import SearchUrlBuilder
+from utils.page_waiter import RecencyCutoff
 from dotenv import load_dotenv
 
 load_dotenv('config/.env')
@@ -27,34 +30,21 @@ class IndeedScraper:
     def search_jobs(self):
         """Search using Indeed RSS feeds"""
         
-        all_jobs = []
+        all_jobs = list(self.iter_jobs())
+        
+        self.jobs_found = all_jobs
+        print(f"\n🎯 Total Indeed jobs: {len(all_jobs)}")
+        return all_jobs
+    
+    def iter_jobs(self):
+        """Yield Indeed jobs one by one as they are scraped"""
         
         for role in self.job_roles:
             role = role.strip()
             print(f"\n🔎 Searching Indeed RSS for: {role}")
             
-            if self.since_time:
-                # Calculate hours since last run
-                from datetime import datetime
-                now = datetime.now()
-                hours_ago = int((now - self.since_time).total_seconds() / 3600)
-                
-                # LinkedIn time filters:
-                # r86400 = last 24 hours
-                # r604800 = last week
-                # r2592000 = last month
-                
-                if hours_ago <= 24:
-                    time_filter = 'r86400'  # Last 24 hours
-                elif hours_ago <= 168:  # 7 days
-                    time_filter = 'r604800'  # Last week
-                else:
-                    time_filter = 'r2592000'  # Last month
-                
-                rss_url = f"https://www.linkedin.com/jobs/search/?keywords={role}&location=India&sortBy=DD&f_TPR={time_filter}"
-            else:
-                # No filter - get recent jobs
-                rss_url = f"https://www.linkedin.com/jobs/search/?keywords={role}&location=India&sortBy=DD"
+            # Portal's own recency filter, as fine as it goes
+            rss_url = SearchUrlBuilder.indeed(role, self.since_time)
             
             try:
                 # Parse RSS feed
@@ -62,19 +52,22 @@ class IndeedScraper:
                 
                 print(f"   Found {len(feed.entries)} jobs in RSS feed")
                 
-                if len(feed.entries) == 0:
-                    # Try alternative URL
-                    alt_url = f"https://www.indeed.co.in/rss?q={role.replace(' ', '+')}&l=&sort=date"
-                    feed = feedparser.parse(alt_url)
-                    print(f"   Trying alternative feed... Found {len(feed.entries)} jobs")
+                # Newest first - stop reading once entries predate the last run
+                cutoff = RecencyCutoff(self.since_time)
                 
                 for idx, entry in enumerate(feed.entries[:20], 1):
                     try:
                         job_data = self.extract_job_from_entry(entry, role)
                         
-                        if job_data and SalaryExtractor.meets_criteria(job_data['salary'], self.min_salary):
-                            all_jobs.append(job_data)
+                        if job_data and cutoff.skip(job_data.get('posted_at')):
+                            if cutoff.done:
+                                print("   ⏹️  Reached jobs posted before the last run - stopping")
+                                break
+                            continue
+                        
+                        if job_data and SalaryExtractor.meets_criteria(job_data['salary_value'], self.min_salary):
                             print(f"   ✅ {idx}. {job_data['title'][:40]} - {job_data['salary']}")
+                            yield job_data
                         
                     except Exception as e:
                         print(f"   ⚠️  Error on job {idx}: {str(e)[:60]}")
@@ -83,9 +76,6 @@ class IndeedScraper:
             except Exception as e:
                 print(f"   ❌ Error: {str(e)[:100]}")
         
-        self.jobs_found = all_jobs
-        print(f"\n🎯 Total Indeed jobs: {len(all_jobs)}")
-        return all_jobs
         
     def extract_job_from_entry(self, entry, search_role):
         """Extract job details from RSS entry"""
@@ -123,24 +113,30 @@ class IndeedScraper:
             pass
         
         # Extract salary
-        salary = SalaryExtractor.extract(description_text)
+        salary_value = SalaryExtractor.parse(description_text)
         
         # Published date
-        published = entry.published if hasattr(entry, 'published') else datetime.now().strftime('%Y-%m-%d')
-        
-        return {
-            'date_found': datetime.now().strftime('%Y-%m-%d'),
-            'time_found': datetime.now().strftime('%H:%M:%S'),
-            'company': company,
-            'title': title,
-            'salary': salary,
-            'location': location,
-            'portal': 'Indeed',
-            'url': url,
-            'description': description_text[:500],
-            'published': published,
-            'search_role': search_role
-        }
+        published = entry.get('published')
+        published_at = None
+        if entry.get('published_parsed'):
+            # feedparser gives UTC; since_time is local
+            published_at = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+        
+        return Job(
+            date_found=datetime.now().strftime('%Y-%m-%d'),
+            time_found=datetime.now().strftime('%H:%M:%S'),
+            company=company,
+            title=title,
+            salary=SalaryExtractor.describe(salary_value),
+            salary_value=salary_value,
+            location=location,
+            portal='Indeed',
+            url=url,
+            description=description_text[:500],
+            posted_at=published_at,
+            posted_raw=published,
+            search_role=search_role
+        )
     
     def close(self):
         """No browser to close"""
@@ -9,13 +9,44 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException,
 import time
 from datetime import datetime
 import os
+import sys
 from dotenv import load_dotenv
-import re
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.salary_extractor import SalaryExtractor
+from utils.job import Job
+from utils.silent_browser import lease_silent_driver, release_silent_driver, is_driver_crash
+from utils.search_urls import SearchUrlBuilder
+from utils.page_waiter import RecencyCutoff
+from utils.card_extractor import CardExtractor
+from utils.date_parser import JobDateParser
 
 # Load environment variables
 load_dotenv('config/.env')
 
 class LinkedInJobScraper:
+    # FIXED: Use different selectors that work better (first match wins)
+    CARD_LOCATORS = [
+        (By.CSS_SELECTOR, 'div.base-card'),
+        (By.CSS_SELECTOR, 'li.jobs-search-results__list-item'),
+    ]
+    
+    POSTED_LOCATORS = [
+        (By.CSS_SELECTOR, 'time'),  # "2 hours ago" (datetime attribute: date only)
+    ]
+    
+    # Read for every card in one execute_script call (CardExtractor), best selector first
+    CARD_FIELDS = {
+        'title': [('h3.base-search-card__title', 'text')],
+        'link_label': [('a.base-card__full-link', 'aria-label')],  # "Data Analyst at Acme"
+        'company': [('h4.base-search-card__subtitle', 'text'), ('a.hidden-nested-link', 'text')],
+        'location': [('span.job-search-card__location', 'text')],
+        'url': [('a.base-card__full-link', 'href')],
+        'posted': [('time', 'text'), ('time', 'datetime')],
+    }
+    
     def __init__(self,since_time=None):
         """Initialize LinkedIn scraper in SILENT mode"""
         
@@ -23,11 +54,14 @@ class LinkedInJobScraper:
         import sys
         import os
         sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        from utils.silent_browser import get_silent_driver
+        from utils.page_waiter import PageWaiter
         
-        # Use silent driver
-        self.driver = get_silent_driver()
+        # Lease a warm silent driver from the shared pool
+        self.driver = lease_silent_driver()
+        self.crashed = False  # Chrome died - don't hand it back to the pool
         self.wait = WebDriverWait(self.driver, 10)
+        self.waiter = PageWaiter(self.driver, self.wait, 'LinkedIn')
+        self.extractor = CardExtractor(self.driver, self.CARD_FIELDS)
         self.jobs_found = []
         
         # Load filters
@@ -54,61 +88,42 @@ class LinkedInJobScraper:
     def search_jobs(self):
         """Search for jobs on LinkedIn"""
         
-        all_jobs = []
+        all_jobs = list(self.iter_jobs())
+        
+        self.jobs_found = all_jobs
+        print(f"\n🎯 Total jobs found matching criteria: {len(all_jobs)}")
+        return all_jobs
+    
+    def iter_jobs(self):
+        """Yield LinkedIn jobs one by one as they are scraped"""
         
         for role in self.job_roles:
             role = role.strip()
             print(f"\n🔎 Searching LinkedIn for: {role}")
             
-            if self.since_time:
-                # Calculate hours since last run
-                from datetime import datetime
-                now = datetime.now()
-                hours_ago = int((now - self.since_time).total_seconds() / 3600)
-                
-                # LinkedIn time filters:
-                # r86400 = last 24 hours
-                # r604800 = last week
-                # r2592000 = last month
-                
-                if hours_ago <= 24:
-                    time_filter = 'r86400'  # Last 24 hours
-                elif hours_ago <= 168:  # 7 days
-                    time_filter = 'r604800'  # Last week
-                else:
-                    time_filter = 'r2592000'  # Last month
-                
-                search_url = f"https://www.linkedin.com/jobs/search/?keywords={role}&location=India&sortBy=DD&f_TPR={time_filter}"
-            else:
-                # No filter - get recent jobs
-                search_url = f"https://www.linkedin.com/jobs/search/?keywords={role}&location=India&sortBy=DD"
+            # Portal's own recency filter, as fine as it goes
+            search_url = SearchUrlBuilder.linkedin(role, self.since_time)
             
             try:
                 self.driver.get(search_url)
-                print("   ⏳ Loading page...")
-                time.sleep(5)  # Wait for page to fully load
+                
+                # Newest first - stop scrolling/reading once cards predate the last run
+                cutoff = RecencyCutoff(self.since_time, self.POSTED_LOCATORS)
+                
+                print("   ⏳ Waiting for job cards...")
+                card_locator, job_cards = self.waiter.wait_for_cards(self.CARD_LOCATORS, budget=5)
                 
                 # Handle "See more jobs" button if present
                 try:
                     see_more_btn = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label='See more jobs']")
                     see_more_btn.click()
-                    time.sleep(2)
                 except:
                     pass  # Button not present or already expanded
                 
-                # Scroll to load more jobs
-                print("   📜 Scrolling to load jobs...")
-                for i in range(3):
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(2)
-                    print(f"      Scroll {i+1}/3")
-                
-                # FIXED: Use different selectors that work better
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, 'div.base-card')
-                
-                if not job_cards:
-                    # Try alternative selector
-                    job_cards = self.driver.find_elements(By.CSS_SELECTOR, 'li.jobs-search-results__list-item')
+                # Scroll until no more cards load
+                if card_locator:
+                    print("   📜 Scrolling to load jobs...")
+                    job_cards = self.waiter.scroll_until_stable(card_locator, max_scrolls=3, stop=cutoff.last_card_is_past)
                 
                 print(f"   Found {len(job_cards)} job cards")
                 
@@ -117,16 +132,25 @@ class LinkedInJobScraper:
                     self.driver.save_screenshot('logs/linkedin_debug.png')
                     print("   📸 Screenshot saved to logs/linkedin_debug.png")
                 
-                for idx, card in enumerate(job_cards[:20], 1):  # Limit to 20 per role
+                # Every card's fields in one round trip (limit to 20 per role)
+                cards = self.extractor.extract(job_cards[:20])
+                
+                for idx, fields in enumerate(cards, 1):
+                    if cutoff.skip(JobDateParser.latest_possible(fields['posted'])):
+                        if cutoff.done:
+                            print("   ⏹️  Reached jobs posted before the last run - stopping")
+                            break
+                        continue
+                    
                     try:
                         # FIXED: Better element extraction with multiple fallbacks
-                        job_data = self.extract_job_details(card, idx, role)
+                        job_data = self.extract_job_details(fields, idx, role)
                         
                         if job_data:
                             # Filter by salary
-                            if self.meets_salary_criteria(job_data['salary']):
-                                all_jobs.append(job_data)
+                            if self.meets_salary_criteria(job_data['salary_value']):
                                 print(f"   ✅ Job {idx}: {job_data['title'][:50]} at {job_data['company'][:30]} - {job_data['salary']}")
+                                yield job_data
                             else:
                                 print(f"   ⏭️  Job {idx}: {job_data['title'][:50]} - Salary too low or not mentioned")
                         
@@ -136,199 +160,62 @@ class LinkedInJobScraper:
                 
             except Exception as e:
                 print(f"   ❌ Error searching for {role}: {str(e)[:150]}")
+                if is_driver_crash(e):
+                    self.crashed = True
+                    break
                 continue
         
-        self.jobs_found = all_jobs
-        print(f"\n🎯 Total jobs found matching criteria: {len(all_jobs)}")
-        return all_jobs
-    
-    def extract_job_details(self, card, idx, search_role):
-    
     
-        job_data = {
-            'date_found': datetime.now().strftime('%Y-%m-%d'),
-            'time_found': datetime.now().strftime('%H:%M:%S'),
-            'company': 'Unknown',
-            'title': 'Unknown',
-            'salary': 'Not mentioned',
-            'location': 'Unknown',
-            'portal': 'LinkedIn',
-            'url': '',
-            'description': '',
-            'search_role': search_role
-        }
+    def extract_job_details(self, fields, idx, search_role):
+        """Build a Job from one LinkedIn card's fields (CARD_FIELDS)"""
         
-        try:
-            # FIXED: Better title extraction with multiple selectors
-            title = None
-            try:
-                # Try method 1
-                title_elem = card.find_element(By.CSS_SELECTOR, 'h3.base-search-card__title')
-                title = title_elem.text.strip()
-            except:
-                try:
-                    # Try method 2
-                    title_elem = card.find_element(By.CSS_SELECTOR, 'a.base-card__full-link')
-                    title = title_elem.get_attribute('aria-label')
-                    if title and ' at ' in title:
-                        title = title.split(' at ')[0].strip()
-                except:
-                    try:
-                        # Try method 3 - get all text and take first line
-                        all_text = card.text.strip().split('\n')
-                        if len(all_text) > 0:
-                            title = all_text[0]
-                    except:
-                        pass
-            
-            if not title or len(title) < 5:
-                return None
-            
-            job_data['title'] = title
-            
-            # FIXED: Better company extraction
-            company = 'Unknown'
-            try:
-                company_elem = card.find_element(By.CSS_SELECTOR, 'h4.base-search-card__subtitle')
-                company = company_elem.text.strip()
-            except:
-                try:
-                    company_elem = card.find_element(By.CSS_SELECTOR, 'a.hidden-nested-link')
-                    company = company_elem.text.strip()
-                except:
-                    # Get from text - usually second line
-                    all_text = card.text.strip().split('\n')
-                    if len(all_text) > 1:
-                        company = all_text[1]
-            
-            job_data['company'] = company if company else 'Unknown'
-            
-            # Location
-            try:
-                location_elem = card.find_element(By.CSS_SELECTOR, 'span.job-search-card__location')
-                job_data['location'] = location_elem.text.strip()
-            except:
-                pass
-            
-            # URL - CRITICAL
-            try:
-                url_elem = card.find_element(By.CSS_SELECTOR, 'a.base-card__full-link')
-                url = url_elem.get_attribute('href')
-                if url and '?' in url:
-                    url = url.split('?')[0]
-                job_data['url'] = url
-            except:
-                pass
-            
-            # SKIP opening job page for now (too slow)
-            # Just use card data
-            
-            return job_data
-            
-        except Exception as e:
-            print(f"      ⚠️  Extraction error: {str(e)[:60]}")
-            return None
-        posted_text = 'Unknown'
-        try:
-            # LinkedIn shows posted date in various places
-            posted_elem = card.find_element(By.CSS_SELECTOR, 'time.job-search-card__listdate')
-            posted_text = posted_elem.get_attribute('datetime')  # ISO format
-            
-            if not posted_text:
-                # Try alternative: text format
-                posted_elem = card.find_element(By.CSS_SELECTOR, 'time')
-                posted_text = posted_elem.text  # "2 hours ago"
-        except:
-            # Try another selector
-            try:
-                posted_elem = card.find_element(By.XPATH, ".//time")
-                posted_text = posted_elem.text
-            except:
-                posted_text = 'Just posted'  # Default
-        
-        # Parse the posted date
-        from utils.date_parser import JobDateParser
-        parser = JobDateParser()
-        posted_dt = parser.parse_relative_date(posted_text)
-        date_str, time_str = parser.format_datetime(posted_dt)
+        lines = fields['text'].split('\n') if fields['text'] else []
         
-        return {
-            'date_found': date_str,  # Real posting date!
-            'time_found': time_str,  # Real posting time!
-            'company': company,
-            'title': title,
-            'salary': salary,
-            'location': location,
-            'portal': 'LinkedIn',
-            'url': url,
-            'description': description,
-            'search_role': search_role,
-            'posted_raw': posted_text  # Keep original for debugging
-        }
+        # Title: card heading, else the link label ("Title at Company"), else the first line
+        title = fields['title']
+        if not title and fields['link_label']:
+            title = fields['link_label'].split(' at ')[0].strip()
+        if not title and lines:
+            title = lines[0]
         
-    def extract_salary(self, text):
-        """Extract salary from job description"""
-        
-        if not text:
-            return "Not mentioned"
-        
-        # Pattern 1: "20-25 LPA" or "20-25 Lakhs"
-        pattern1 = r'(\d+)\s*-\s*(\d+)\s*(?:LPA|Lakhs|Lacs|L\.?P\.?A\.?)'
-        match1 = re.search(pattern1, text, re.IGNORECASE)
-        if match1:
-            min_sal = int(match1.group(1))
-            max_sal = int(match1.group(2))
-            return f"{min_sal}-{max_sal} LPA"
+        if not title or len(title) < 5:
+            return None
         
-        # Pattern 2: "₹20-25 Lakhs" or "INR 20-25 Lakhs"
-        pattern2 = r'(?:₹|INR|Rs\.?)\s*(\d+)\s*-\s*(\d+)\s*(?:Lakhs?|Lacs?|LPA)'
-        match2 = re.search(pattern2, text, re.IGNORECASE)
-        if match2:
-            min_sal = int(match2.group(1))
-            max_sal = int(match2.group(2))
-            return f"{min_sal}-{max_sal} LPA"
+        # Company: subtitle, else usually the second line
+        company = fields['company'] or (lines[1] if len(lines) > 1 else None)
         
-        # Pattern 3: "Up to 30 LPA"
-        pattern3 = r'(?:up to|upto)\s*(\d+)\s*(?:LPA|Lakhs|Lacs)'
-        match3 = re.search(pattern3, text, re.IGNORECASE)
-        if match3:
-            max_sal = int(match3.group(1))
-            return f"Up to {max_sal} LPA"
+        # URL - CRITICAL (tracking parameters dropped)
+        url = (fields['url'] or '').split('?')[0]
         
-        # Pattern 4: Just "25 LPA" or "25 Lakhs"
-        pattern4 = r'(?:^|\s)(\d+)\s*(?:LPA|Lakhs|Lacs)(?:\s|$)'
-        match4 = re.search(pattern4, text, re.IGNORECASE)
-        if match4:
-            salary = int(match4.group(1))
-            return f"{salary} LPA"
+        # SKIP opening job page for now (too slow) - just use card data
+        return Job(
+            date_found=datetime.now().strftime('%Y-%m-%d'),
+            time_found=datetime.now().strftime('%H:%M:%S'),
+            company=company or 'Unknown',
+            title=title,
+            salary='Not mentioned',
+            salary_value=None,
+            location=fields['location'] or 'Unknown',
+            portal='LinkedIn',
+            url=url,
+            description='',
+            search_role=search_role
+        )
         
-        # Pattern 5: "2000000-2500000" (in numbers)
-        pattern5 = r'(\d{7,8})\s*-\s*(\d{7,8})'
-        match5 = re.search(pattern5, text)
-        if match5:
-            min_sal = int(match5.group(1)) // 100000
-            max_sal = int(match5.group(2)) // 100000
-            return f"{min_sal}-{max_sal} LPA"
+    def extract_salary(self, text):
+        """Extract salary from job description (shared SalaryExtractor engine)"""
         
-        return "Not mentioned"
+        return SalaryExtractor.extract(text)
     
-    def meets_salary_criteria(self, salary_str):
-        """Check if salary meets minimum criteria"""
-        if salary_str == "Not mentioned":
-            return True  # Include for manual review (AI will analyze)
-        
-        numbers = re.findall(r'\d+', salary_str)
-        if numbers:
-            # Take the minimum salary mentioned
-            min_salary = int(numbers[0])
-            return min_salary >= self.min_salary
-        
-        return True  # If can't determine, include it
+    def meets_salary_criteria(self, salary):
+        """Check if salary (Salary, None or display text) meets minimum criteria"""
+        # Unknown salaries are included for manual review (AI will analyze)
+        return SalaryExtractor.meets_criteria(salary, self.min_salary)
     
     def close(self):
-        """Close the browser"""
-        self.driver.quit()
-        print("🔒 Browser closed")
+        """Return the browser to the pool"""
+        release_silent_driver(self.driver, crashed=self.crashed)
+        print("🔒 Browser released")
 
 
 # Run if executed directly (for testing)
@@ -14,21 +14,52 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.salary_extractor import SalaryExtractor
+from utils.job import Job
+from utils.silent_browser import lease_silent_driver, release_silent_driver, is_driver_crash
+from utils.search_urls import SearchUrlBuilder
+from utils.page_waiter import RecencyCutoff
+from utils.card_extractor import CardExtractor
+from utils.date_parser import JobDateParser
 from dotenv import load_dotenv
 
 load_dotenv('config/.env')
 
 class NaukriScraper:
+    CARD_LOCATORS = [
+        (By.CSS_SELECTOR, 'article.jobTuple'),
+        (By.CSS_SELECTOR, 'div.srp-jobtuple-wrapper'),
+    ]
+    
+    POSTED_LOCATORS = [
+        (By.CSS_SELECTOR, 'span.job-post-day'),
+        (By.CSS_SELECTOR, 'span.sim-posted span'),
+    ]
+    
+    # Read for every card in one execute_script call (CardExtractor)
+    CARD_FIELDS = {
+        'title': [('a.title', 'text')],
+        'url': [('a.title', 'href')],
+        'company': [('a.subTitle', 'text')],
+        'experience': [('span.expwdth', 'text')],
+        'salary': [('span.sal', 'text')],
+        'location': [('span.loc', 'text')],
+        'description': [('div.job-description', 'text')],
+        'posted': [('span.job-post-day', 'text'), ('span.sim-posted span', 'text')],
+    }
+    
     def __init__(self,since_time=None):
         """Initialize Naukri scraper in SILENT mode"""
         
         import sys
         import os
         sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        from utils.silent_browser import get_silent_driver
+        from utils.page_waiter import PageWaiter
         
-        self.driver = get_silent_driver()
+        self.driver = lease_silent_driver()
+        self.crashed = False  # Chrome died - don't hand it back to the pool
         self.wait = WebDriverWait(self.driver, 10)
+        self.waiter = PageWaiter(self.driver, self.wait, 'Naukri')
+        self.extractor = CardExtractor(self.driver, self.CARD_FIELDS)
         self.jobs_found = []
         
         self.job_roles = os.getenv('JOB_ROLES', 'Data Analyst').split(',')
@@ -40,59 +71,52 @@ class NaukriScraper:
     def search_jobs(self):
         """Search for jobs on Naukri"""
         
-        all_jobs = []
+        all_jobs = list(self.iter_jobs())
+        
+        self.jobs_found = all_jobs
+        print(f"\n🎯 Total Naukri jobs: {len(all_jobs)}")
+        return all_jobs
+    
+    def iter_jobs(self):
+        """Yield Naukri jobs one by one as they are scraped"""
         
         for role in self.job_roles:
             role = role.strip()
             print(f"\n🔎 Searching Naukri for: {role}")
             
-            if self.since_time:
-                # Calculate hours since last run
-                from datetime import datetime
-                now = datetime.now()
-                hours_ago = int((now - self.since_time).total_seconds() / 3600)
-                
-                # LinkedIn time filters:
-                # r86400 = last 24 hours
-                # r604800 = last week
-                # r2592000 = last month
-                
-                if hours_ago <= 24:
-                    time_filter = 'r86400'  # Last 24 hours
-                elif hours_ago <= 168:  # 7 days
-                    time_filter = 'r604800'  # Last week
-                else:
-                    time_filter = 'r2592000'  # Last month
-                
-                search_url = f"https://www.linkedin.com/jobs/search/?keywords={role}&location=India&sortBy=DD&f_TPR={time_filter}"
-            else:
-                # No filter - get recent jobs
-                search_url = f"https://www.linkedin.com/jobs/search/?keywords={role}&location=India&sortBy=DD"
+            # Portal's own recency filter, as fine as it goes
+            search_url = SearchUrlBuilder.naukri(role, self.since_time)
             
             try:
                 self.driver.get(search_url)
-                time.sleep(4)
                 
-                # Scroll to load more jobs
-                for _ in range(3):
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(2)
+                # Results aren't sorted by date - skip cards that predate the
+                # last run, but keep reading (a newer card can come after them)
+                cutoff = RecencyCutoff(self.since_time, self.POSTED_LOCATORS, newest_first=False)
                 
-                # Find job cards
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, 'article.jobTuple')
-                if not job_cards:
-                    job_cards = self.driver.find_elements(By.CSS_SELECTOR, 'div.srp-jobtuple-wrapper')
-
+                # Wait for job cards, then scroll until no more load
+                card_locator, job_cards = self.waiter.wait_for_cards(self.CARD_LOCATORS, budget=4)
+                if card_locator:
+                    job_cards = self.waiter.scroll_until_stable(card_locator, max_scrolls=3, stop=cutoff.last_card_is_past)
                 
                 print(f"   Found {len(job_cards)} job cards")
                 
-                for idx, card in enumerate(job_cards[:20], 1):
+                # Every card's fields in one round trip
+                cards = self.extractor.extract(job_cards[:20])
+                
+                for idx, fields in enumerate(cards, 1):
+                    if cutoff.skip(JobDateParser.latest_possible(fields['posted'])):
+                        if cutoff.done:
+                            print("   ⏹️  Reached jobs posted before the last run - stopping")
+                            break
+                        continue
+                    
                     try:
-                        job_data = self.extract_job_details(card, role)
+                        job_data = self.extract_job_details(fields, role)
                         
-                        if job_data and SalaryExtractor.meets_criteria(job_data['salary'], self.min_salary):
-                            all_jobs.append(job_data)
+                        if job_data and SalaryExtractor.meets_criteria(job_data['salary_value'], self.min_salary):
                             print(f"   ✅ {idx}. {job_data['title'][:40]} - {job_data['company'][:25]} - {job_data['salary']}")
+                            yield job_data
                         else:
                             print(f"   ⏭️  {idx}. Salary below threshold or invalid")
                         
@@ -102,87 +126,46 @@ class NaukriScraper:
                 
             except Exception as e:
                 print(f"   ❌ Error searching: {str(e)[:100]}")
+                if is_driver_crash(e):
+                    self.crashed = True
+                    break
         
-        self.jobs_found = all_jobs
-        print(f"\n🎯 Total Naukri jobs: {len(all_jobs)}")
-        return all_jobs
     
-    def extract_job_details(self, card, search_role):
-        """Extract details from Naukri job card"""
+    def extract_job_details(self, fields, search_role):
+        """Build a Job from one Naukri card's fields (CARD_FIELDS)"""
         
-        # Title
-        try:
-            title_elem = card.find_element(By.CSS_SELECTOR, 'a.title')
-            title = title_elem.text.strip()
-            url = title_elem.get_attribute('href')
-        except:
+        title = fields['title']
+        if not title:
             return None
         
-        # Company
-        try:
-            company = card.find_element(By.CSS_SELECTOR, 'a.subTitle').text.strip()
-        except:
-            company = 'Unknown'
-        
-        # Experience
-        try:
-            experience = card.find_element(By.CSS_SELECTOR, 'span.expwdth').text.strip()
-        except:
-            experience = 'Not mentioned'
+        salary_value = SalaryExtractor.parse(fields['salary'])
         
-        # Salary
-        try:
-            salary_elem = card.find_element(By.CSS_SELECTOR, 'span.sal')
-            salary_text = salary_elem.text.strip()
-            salary = SalaryExtractor.extract(salary_text)
-        except:
-            salary = 'Not mentioned'
-        
-        # Location
-        try:
-            location = card.find_element(By.CSS_SELECTOR, 'span.loc').text.strip()
-        except:
-            location = 'India'
-        
-        # Job description (brief)
-        try:
-            desc = card.find_element(By.CSS_SELECTOR, 'div.job-description').text.strip()
-        except:
-            desc = ''
-        
-        # Posted date
-        try:
-            posted_elem = card.find_element(By.CSS_SELECTOR, 'span.sim-posted span')
-            posted_text = posted_elem.text.strip()  # "Posted today", "Posted 2 days ago"
-        except:
-            posted_text = 'Posted today'
-
-        # Parse it
-        from utils.date_parser import JobDateParser
-        parser = JobDateParser()
-        posted_dt = parser.parse_relative_date(posted_text)
-        date_str, time_str = parser.format_datetime(posted_dt)
-
+        # Posted date - "Posted today", "Posted 2 days ago"
+        posted_text = fields['posted'] or 'Posted today'
+        posted_dt = JobDateParser.parse_relative_date(posted_text)
+        date_str, time_str = JobDateParser.format_datetime(posted_dt)
         
-        return {
-            'date_found': date_str,
-            'time_found': time_str,
-            'company': company,
-            'title': title,
-            'salary': salary,
-            'location': location,
-            'portal': 'Naukri',
-            'url': url,
-            'description': desc,
-            'experience': experience,
-            'posted': posted_elem,
-            'search_role': search_role
-        }
+        return Job(
+            date_found=date_str,
+            time_found=time_str,
+            company=fields['company'] or 'Unknown',
+            title=title,
+            salary=SalaryExtractor.describe(salary_value),
+            salary_value=salary_value,
+            location=fields['location'] or 'India',
+            portal='Naukri',
+            url=fields['url'],
+            description=fields['description'] or '',
+            experience=fields['experience'] or 'Not mentioned',
+            posted_at=posted_dt,
+            posted_raw=posted_text,
+            search_role=search_role
+        )
     
     def close(self):
-        """Close browser"""
-        self.driver.quit()
-        print("🔒 Naukri browser closed")
+        """Return browser to the pool"""
+        release_silent_driver(self.driver, crashed=self.crashed)
+        print("🔒 Naukri browser released")
 
 
 if __name__ == "__main__":
@@ -193,7 +176,7 @@ if __name__ == "__main__":
     for idx, job in enumerate(jobs, 1):
         print(f"\n{idx}. {job['title']}")
         print(f"   {job['company']} | {job['salary']}")
-        print(f"   {job['location']} | Posted: {job.get('posted', 'N/A')}")
+        print(f"   {job['location']} | Posted: {job.get('posted_raw', 'N/A')}")
         print(f"   {job['url'][:80]}...")
     
     scraper.close()
\ No newline at end of file
@@ -0,0 +1,130 @@
+# sheets_integration/row_cleanup.py - Delete many sheet rows in as few operations as possible
+
+import os
+
+
+def contiguous_ranges(row_numbers):
+    """
+    Merge row numbers into runs: [2, 3, 4, 9, 11, 12] -> [(2, 4), (9, 9), (11, 12)]
+    (1-based, inclusive, ascending)
+    """
+
+    ranges = []
+
+    for row in sorted(set(row_numbers)):
+        if ranges and row == ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], row)
+        else:
+            ranges.append((row, row))
+
+    return ranges
+
+
+class RowCleanup:
+    """
+    Removes rows from the jobs tab
+
+    'ranges' mode (default): checked rows are merged into contiguous runs
+    and each run is one deleteDimension, bottom run first so earlier
+    indices stay valid - a week of ticking rows one after another becomes
+    a handful of range deletes instead of hundreds of single-row shifts.
+
+    'compact' mode (SHEET_CLEANUP_MODE=compact): the surviving rows are
+    written back in one values.update and the leftover tail is cut with a
+    single deleteDimension - two calls however scattered the rows are.
+    It rewrites A:R from the snapshot, so edits made after the snapshot
+    was read, and anything outside A:R, are not carried along.
+    """
+
+    def __init__(self, sheet, spreadsheet_id, sheet_id, sheet_name='Sheet1', column_count=18):
+        self.sheet = sheet
+        self.spreadsheet_id = spreadsheet_id
+        self.sheet_id = sheet_id
+        self.sheet_name = sheet_name
+        self.column_count = column_count
+
+    def delete_rows(self, row_numbers, snapshot=None, compact=None):
+        """
+        Delete sheet rows (1-based, header = 1)
+
+        Args:
+            snapshot (SheetSnapshot): Current contents - required for compact mode
+            compact (bool): None = SHEET_CLEANUP_MODE from .env
+
+        Returns: number of rows deleted
+        """
+
+        if not row_numbers:
+            return 0
+
+        if compact is None:
+            compact = os.getenv('SHEET_CLEANUP_MODE', 'ranges').lower() == 'compact'
+
+        if compact and snapshot is not None:
+            self._compact(row_numbers, snapshot)
+        else:
+            self._delete_ranges(row_numbers)
+
+        if snapshot is not None:
+            snapshot.rows_deleted(row_numbers)
+
+        return len(set(row_numbers))
+
+    def _range_request(self, first_row, last_row):
+        return {
+            'deleteDimension': {
+                'range': {
+                    'sheetId': self.sheet_id,
+                    'dimension': 'ROWS',
+                    'startIndex': first_row - 1,  # 0-indexed
+                    'endIndex': last_row
+                }
+            }
+        }
+
+    def _delete_ranges(self, row_numbers):
+        ranges = contiguous_ranges(row_numbers)
+
+        # Bottom to top - deleting a run doesn't move the runs above it
+        requests = [self._range_request(first, last) for first, last in reversed(ranges)]
+
+        self.sheet.batchUpdate(
+            spreadsheetId=self.spreadsheet_id,
+            body={'requests': requests}
+        ).execute()
+
+        print(f"   🧹 {len(set(row_numbers))} rows removed in {len(ranges)} range deletes")
+
+    def _compact(self, row_numbers, snapshot):
+        doomed = set(row_numbers)
+        survivors = [
+            (row + [''] * self.column_count)[:self.column_count]  # Pad so old trailing cells are overwritten
+            for row_number, row in enumerate(snapshot.rows, start=2)
+            if row_number not in doomed
+        ]
+        last_row = len(snapshot.rows) + 1
+
+        if survivors:
+            self.sheet.values().update(
+                spreadsheetId=self.spreadsheet_id,
+                range=f'{self.sheet_name}!A2:R{len(survivors) + 1}',
+                valueInputOption='USER_ENTERED',
+                body={'values': survivors}
+            ).execute()
+
+        self.sheet.batchUpdate(
+            spreadsheetId=self.spreadsheet_id,
+            body={'requests': [self._range_request(len(survivors) + 2, last_row)]}
+        ).execute()
+
+        print(f"   🧹 {len(doomed)} rows removed by rewriting {len(survivors)} surviving rows")
+
+
+# Test
+if __name__ == "__main__":
+    checked = [2, 3, 4, 9, 11, 12, 40, 41, 42, 43]
+    ranges = contiguous_ranges(checked)
+
+    print(f"Checked rows: {checked}")
+    print(f"Ranges:       {ranges}")
+    print(f"Requests:     {len(ranges)} deleteDimension instead of {len(checked)}")
@@ -0,0 +1,187 @@
+# sheets_integration/sheet_archiver.py - Move old / finished rows off the live sheet
+
+import os
+from datetime import datetime, timedelta
+from googleapiclient.errors import HttpError
+from sheets_integration.sheet_snapshot import SheetSnapshot
+
+
+class SheetArchiver:
+    """
+    Keeps the jobs tab down to the active working set
+
+    Rows found more than ARCHIVE_AFTER_DAYS ago, or whose Status is in
+    ARCHIVE_STATUSES (Applied / Rejected), are copied to the local job store
+    (logs/job_store.db, 'archive' table) and - with ARCHIVE_TARGET=tabs, the
+    default - to monthly "Archive YYYY-MM" tabs, then removed from the jobs
+    tab with the same range deletes as the checkbox cleanup. Stats, URL
+    dedup and cleanup then only read the active rows; archived URLs stay in
+    history so they are never re-added.
+
+    Rows are only deleted after every copy succeeded - a failed run leaves
+    them in place and the next run tries again. Both copies are idempotent:
+    the store is keyed by URL, and rows whose URL is already in their
+    month's tab are not appended again.
+    """
+
+    TAB_PREFIX = 'Archive '
+
+    def __init__(self, updater, job_store):
+        self.updater = updater
+        self.job_store = job_store
+
+        self.after_days = int(os.getenv('ARCHIVE_AFTER_DAYS', '30'))  # 0 = status only
+        self.statuses = tuple(
+            status.strip() for status in os.getenv('ARCHIVE_STATUSES', 'Applied,Rejected').split(',')
+            if status.strip()
+        )
+        self.to_tabs = os.getenv('ARCHIVE_TARGET', 'tabs').lower() == 'tabs'
+
+    def archive(self):
+        """Archive due rows; returns how many left the live sheet"""
+
+        snapshot = self.updater.snapshot()
+        date_formats = [fmt for fmt, _, _ in self.updater.DATE_FORMATS]
+
+        before = (datetime.now() - timedelta(days=self.after_days)).date() if self.after_days > 0 else None
+        row_numbers = snapshot.stale_rows(before, self.statuses, date_formats)
+
+        if not row_numbers:
+            print("   No rows due for archiving")
+            return 0
+
+        # (month, row) for each stale row - month from Date Found, else today
+        this_month = datetime.now().strftime('%Y-%m')
+        entries = []
+        for row_number in row_numbers:
+            row = snapshot.rows[row_number - 2]
+            found = snapshot.date_found(row, date_formats)
+            entries.append((found.strftime('%Y-%m') if found else this_month, row))
+
+        print(f"   📦 Archiving {len(entries)} rows (older than {self.after_days} days or {'/'.join(self.statuses)})")
+
+        self.job_store.archive_rows(entries)
+
+        if self.to_tabs:
+            self.append_to_tabs(entries, snapshot.header)
+
+        deleted = self.updater.delete_rows(row_numbers)
+        print(f"   ✅ {deleted} rows archived, {len(snapshot.rows)} active rows left")
+        return deleted
+
+    # ── Monthly tabs ────────────────────────────────
+
+    def append_to_tabs(self, entries, header):
+        """Append rows to their month's tab - one batchUpdate for all months"""
+
+        by_month = {}
+        for month, row in entries:
+            by_month.setdefault(month, []).append(row)
+
+        for attempt in range(2):
+            try:
+                tab_ids, created = self.tab_ids([self.TAB_PREFIX + month for month in by_month])
+                archived = self.tab_urls([title for title in tab_ids
+                                          if title[len(self.TAB_PREFIX):] in by_month and title not in created])
+
+                requests = []
+                for month, rows in sorted(by_month.items()):
+                    title = self.TAB_PREFIX + month
+
+                    # Already copied by a run whose row delete then failed
+                    rows = [row for row in rows if SheetSnapshot._cell(row, SheetSnapshot.URL) not in archived.get(title, ())]
+                    if not rows:
+                        continue
+
+                    cells = [self.updater.row_cells(self.live_row(row)) for row in rows]
+
+                    if title in created and header:
+                        cells.insert(0, [{'userEnteredValue': {'stringValue': str(text)}} for text in header])
+
+                    requests.append({
+                        'appendCells': {
+                            'sheetId': tab_ids[title],
+                            'rows': [{'values': row_cells} for row_cells in cells],
+                            'fields': 'userEnteredValue,userEnteredFormat.numberFormat,dataValidation'
+                        }
+                    })
+
+                if requests:
+                    self.updater.sheet.batchUpdate(
+                        spreadsheetId=self.updater.spreadsheet_id,
+                        body={'requests': requests}
+                    ).execute()
+                return
+
+            except HttpError as e:
+                if attempt == 0 and e.resp.status == 400 and self.updater.state.get('archive_tabs'):
+                    # A cached tab was deleted by hand - look them up again
+                    self.updater.state.update(archive_tabs={})
+                    continue
+                raise
+
+    def tab_ids(self, titles):
+        """
+        sheetId per archive tab title, creating missing tabs
+        (cached in logs/sheet_state.json next to the jobs tab id)
+
+        Returns: ({title: sheetId}, titles created now)
+        """
+
+        known = dict(self.updater.state.get('archive_tabs', {}))
+        created = set()
+
+        if any(title not in known for title in titles):
+            metadata = self.updater.sheet.get(
+                spreadsheetId=self.updater.spreadsheet_id,
+                fields='sheets.properties(sheetId,title)'
+            ).execute()
+
+            for tab in metadata.get('sheets', []):
+                properties = tab['properties']
+                if properties.get('title', '').startswith(self.TAB_PREFIX):
+                    known[properties['title']] = properties['sheetId']
+
+        missing = [title for title in titles if title not in known]
+
+        if missing:
+            result = self.updater.sheet.batchUpdate(
+                spreadsheetId=self.updater.spreadsheet_id,
+                body={'requests': [{'addSheet': {'properties': {'title': title}}} for title in missing]}
+            ).execute()
+
+            for reply in result.get('replies', []):
+                properties = reply['addSheet']['properties']
+                known[properties['title']] = properties['sheetId']
+                created.add(properties['title'])
+
+            print(f"   🗂️  Created archive tabs: {', '.join(missing)}")
+
+        if known != self.updater.state.get('archive_tabs', {}):
+            self.updater.state.update(archive_tabs=known)
+
+        return known, created
+
+    def tab_urls(self, titles):
+        """{title: job URLs already in that archive tab} - one batchGet"""
+
+        if not titles:
+            return {}
+
+        column = chr(ord('A') + SheetSnapshot.URL)
+        result = self.updater.sheet.values().batchGet(
+            spreadsheetId=self.updater.spreadsheet_id,
+            ranges=[f"'{title}'!{column}:{column}" for title in titles]
+        ).execute()
+
+        return {
+            title: {str(row[0]).strip() for row in value_range.get('values', []) if row}
+            for title, value_range in zip(titles, result.get('valueRanges', []))
+        }
+
+    def live_row(self, row):
+        """Snapshot row (all text) -> the values append_rows would write"""
+
+        row = (list(row) + [''] * self.updater.COLUMN_COUNT)[:self.updater.COLUMN_COUNT]
+        row[0] = str(row[0]).upper() in SheetSnapshot.CHECKED_VALUES
+        return row
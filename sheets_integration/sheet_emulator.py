@@ -0,0 +1,410 @@
+# sheets_integration/sheet_emulator.py - In-memory stand-in for the Google Sheets API
+
+import re
+import json
+import time
+import random
+from collections import Counter, deque
+from datetime import datetime, timedelta
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+
+class SheetEmulator:
+    """
+    The part of the Sheets v4 client this project uses, kept in memory
+
+    Pass it where the real service would go -
+    GoogleSheetsUpdater(service=SheetEmulator()) - and the write, dedup,
+    cleanup and archive paths run offline, against as many rows as you
+    like (see benchmarks/sheet_sync_bench.py).
+
+    Supported: spreadsheets().get, spreadsheets().batchUpdate (appendCells,
+    deleteDimension, addSheet, deleteSheet; formatting requests are
+    accepted and ignored) and spreadsheets().values() get / batchGet /
+    append / update / clear. Cells are stored as the text the API would
+    return (FORMATTED_VALUE), so typed dates written by appendCells read
+    back as '15-Oct-2026' just like the real sheet.
+
+    Every execute() can be made to behave like the network:
+        latency / jitter   - seconds slept per call (+ random extra)
+        quota_per_minute   - calls allowed in any 60 s window, then 429
+                             RESOURCE_EXHAUSTED (the API's default is 60
+                             per user per minute)
+        error_rate         - share of calls failing with 503 UNAVAILABLE
+    Errors are googleapiclient HttpErrors, as the real client raises.
+    """
+
+    # Formatting requests the real API would apply - nothing to store here
+    FORMAT_REQUESTS = {
+        'repeatCell', 'updateSheetProperties', 'setDataValidation', 'updateDimensionProperties',
+        'autoResizeDimensions', 'updateBorders', 'addConditionalFormatRule', 'mergeCells'
+    }
+
+    # numberFormat pattern -> how the value is displayed
+    DISPLAY_FORMATS = {
+        'dd-mmm-yyyy': '%d-%b-%Y',
+        'yyyy-mm-dd': '%Y-%m-%d',
+        'hh:mm AM/PM': '%I:%M %p',
+        'hh:mm:ss': '%H:%M:%S'
+    }
+
+    RANGE_PATTERN = re.compile(r"^(?:'?(?P<title>[^!]+?)'?!)?(?P<c1>[A-Z]*)(?P<r1>\d*)(?::(?P<c2>[A-Z]*)(?P<r2>\d*))?$")
+
+    def __init__(self, spreadsheet_id='emulator', tabs=('Sheet1',), latency=0.0, jitter=0.0,
+                 quota_per_minute=None, error_rate=0.0, seed=0):
+        self.spreadsheet_id = spreadsheet_id
+        self.latency = latency
+        self.jitter = jitter
+        self.quota_per_minute = quota_per_minute
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+
+        # title -> {'sheetId': int, 'rows': [[cell text, ...], ...]}
+        self.tabs = {}
+        for title in tabs:
+            self._add_tab(title)
+
+        self.calls = Counter()    # Successful calls per method
+        self.errors = Counter()   # Simulated failures per HTTP status
+        self._recent = deque()    # Call times inside the quota window
+
+    # ── Client surface ──────────────────────────────
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return _Values(self)
+
+    def get(self, spreadsheetId, fields=None, ranges=None, includeGridData=False):
+        return _Request(self, 'get', spreadsheetId, lambda: {
+            'spreadsheetId': self.spreadsheet_id,
+            'sheets': [{'properties': self._properties(title)} for title in self.tabs]
+        })
+
+    def batchUpdate(self, spreadsheetId, body):
+        return _Request(self, 'batchUpdate', spreadsheetId, lambda: self._batch_update(body.get('requests', [])))
+
+    # ── Direct access (no latency, not counted) ─────
+
+    def load(self, values, title='Sheet1'):
+        """Replace a tab's contents, e.g. to seed 100k rows for a benchmark"""
+
+        if title not in self.tabs:
+            self._add_tab(title)
+        self.tabs[title]['rows'] = [[self._user_entered(value) for value in row] for row in values]
+
+    def rows(self, title='Sheet1'):
+        return self.tabs[title]['rows']
+
+    # ── Network behaviour ───────────────────────────
+
+    def _execute(self, method, spreadsheet_id, action):
+        if self.latency or self.jitter:
+            time.sleep(self.latency + self.random.uniform(0, self.jitter))
+
+        if spreadsheet_id != self.spreadsheet_id:
+            raise self._error(404, 'NOT_FOUND', 'Requested entity was not found.')
+
+        if self.quota_per_minute:
+            now = time.monotonic()
+            while self._recent and now - self._recent[0] >= 60:
+                self._recent.popleft()
+
+            if len(self._recent) >= self.quota_per_minute:
+                raise self._error(429, 'RESOURCE_EXHAUSTED',
+                                  "Quota exceeded for quota metric 'Requests' and limit 'Requests per minute per user'")
+            self._recent.append(now)
+
+        if self.error_rate and self.random.random() < self.error_rate:
+            raise self._error(503, 'UNAVAILABLE', 'The service is currently unavailable.')
+
+        result = action()
+        self.calls[method] += 1
+        return result
+
+    def _error(self, status, reason, message):
+        self.errors[status] += 1
+
+        resp = httplib2.Response({'status': status, 'reason': reason})
+        content = json.dumps({'error': {'code': status, 'message': message, 'status': reason}}).encode('utf-8')
+        return HttpError(resp, content)
+
+    # ── Tabs ────────────────────────────────────────
+
+    def _add_tab(self, title, sheet_id=None):
+        if sheet_id is None:
+            sheet_id = max((tab['sheetId'] for tab in self.tabs.values()), default=-1) + 1
+        self.tabs[title] = {'sheetId': sheet_id, 'rows': []}
+        return self._properties(title)
+
+    def _properties(self, title):
+        tab = self.tabs[title]
+        return {
+            'sheetId': tab['sheetId'],
+            'title': title,
+            'index': list(self.tabs).index(title),
+            'gridProperties': {'rowCount': max(1000, len(tab['rows'])), 'columnCount': 26}
+        }
+
+    def _tab_by_id(self, sheet_id, request_name):
+        for title, tab in self.tabs.items():
+            if tab['sheetId'] == sheet_id:
+                return title, tab
+        raise self._error(400, 'INVALID_ARGUMENT', f'Invalid {request_name}: No grid with id: {sheet_id}')
+
+    # ── batchUpdate ─────────────────────────────────
+
+    def _batch_update(self, requests):
+        # Check everything first - the real API applies all requests or none
+        titles = {title: tab['sheetId'] for title, tab in self.tabs.items()}
+        for idx, request in enumerate(requests):
+            kind = next(iter(request), None)
+            body = request.get(kind, {})
+            name = f'requests[{idx}].{kind}'
+
+            if kind == 'addSheet':
+                title = body.get('properties', {}).get('title', f'Sheet{len(titles) + 1}')
+                if title in titles:
+                    raise self._error(400, 'INVALID_ARGUMENT',
+                                      f'Invalid {name}: A sheet with the name "{title}" already exists.')
+                titles[title] = None
+            elif kind in ('appendCells', 'deleteSheet'):
+                if body.get('sheetId') not in titles.values():
+                    self._tab_by_id(body.get('sheetId'), name)
+            elif kind == 'deleteDimension':
+                grid = body.get('range', {})
+                if grid.get('sheetId') not in titles.values():
+                    self._tab_by_id(grid.get('sheetId'), name)
+                if grid.get('startIndex', 0) >= grid.get('endIndex', 0):
+                    raise self._error(400, 'INVALID_ARGUMENT', f'Invalid {name}: endIndex must be after startIndex')
+            elif kind not in self.FORMAT_REQUESTS:
+                raise self._error(400, 'INVALID_ARGUMENT', f'Invalid {name}: unsupported by the emulator')
+
+        return {'spreadsheetId': self.spreadsheet_id, 'replies': [self._apply(request, idx) for idx, request in enumerate(requests)]}
+
+    def _apply(self, request, idx):
+        kind = next(iter(request))
+        body = request[kind]
+        name = f'requests[{idx}].{kind}'
+
+        if kind == 'appendCells':
+            _, tab = self._tab_by_id(body.get('sheetId'), name)
+            self._trim(tab['rows'])
+            tab['rows'].extend([self._cell_text(cell) for cell in row.get('values', [])] for row in body.get('rows', []))
+            return {}
+
+        if kind == 'deleteDimension':
+            grid = body['range']
+            _, tab = self._tab_by_id(grid.get('sheetId'), name)
+            start, end = grid.get('startIndex', 0), grid.get('endIndex')
+
+            if grid.get('dimension') == 'COLUMNS':
+                for row in tab['rows']:
+                    del row[start:end]
+            else:
+                del tab['rows'][start:end]
+            return {}
+
+        if kind == 'addSheet':
+            properties = body.get('properties', {})
+            title = properties.get('title', f'Sheet{len(self.tabs) + 1}')
+            return {'addSheet': {'properties': self._add_tab(title, properties.get('sheetId'))}}
+
+        if kind == 'deleteSheet':
+            title, _ = self._tab_by_id(body.get('sheetId'), name)
+            del self.tabs[title]
+            return {}
+
+        return {}
+
+    def _cell_text(self, cell):
+        """CellData -> the text values.get would return"""
+
+        value = cell.get('userEnteredValue', {})
+
+        if 'boolValue' in value:
+            return 'TRUE' if value['boolValue'] else 'FALSE'
+
+        if 'numberValue' in value:
+            number = value['numberValue']
+            pattern = cell.get('userEnteredFormat', {}).get('numberFormat', {}).get('pattern')
+
+            if pattern in self.DISPLAY_FORMATS:
+                # Sheets serial: days since 1899-12-30, time as the fraction
+                moment = datetime(1899, 12, 30) + timedelta(days=number)
+                return moment.strftime(self.DISPLAY_FORMATS[pattern])
+            return self._user_entered(number)
+
+        return str(value.get('stringValue', value.get('formulaValue', '')))
+
+    @staticmethod
+    def _user_entered(value):
+        if value is True or value is False:
+            return 'TRUE' if value else 'FALSE'
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return '' if value is None else str(value)
+
+    @staticmethod
+    def _trim(rows):
+        """Drop trailing empty rows (the API appends after the last row with data)"""
+
+        while rows and not any(rows[-1]):
+            rows.pop()
+
+    # ── values() ────────────────────────────────────
+
+    def _parse_range(self, a1):
+        """'Sheet1!A2:R10' -> (title, first row, last row, first col, last col) - 0-based, None = open"""
+
+        match = self.RANGE_PATTERN.match(a1.strip())
+        if not match:
+            raise self._error(400, 'INVALID_ARGUMENT', f'Unable to parse range: {a1}')
+
+        title = match.group('title') or next(iter(self.tabs))
+        if title not in self.tabs:
+            raise self._error(400, 'INVALID_ARGUMENT', f'Unable to parse range: {a1}')
+
+        def column(letters):
+            index = 0
+            for letter in letters:
+                index = index * 26 + ord(letter) - ord('A') + 1
+            return index - 1 if letters else None
+
+        c1, r1, c2, r2 = match.group('c1'), match.group('r1'), match.group('c2'), match.group('r2')
+        first_row = int(r1) - 1 if r1 else 0
+        first_col = column(c1) or 0
+
+        if match.group(0).count(':'):
+            last_row = int(r2) - 1 if r2 else None
+            last_col = column(c2)
+        else:
+            # Single cell ('A1') or whole tab ('Sheet1')
+            last_row = first_row if r1 else None
+            last_col = first_col if c1 else None
+
+        return title, first_row, last_row, first_col, last_col
+
+    def _read(self, a1):
+        title, first_row, last_row, first_col, last_col = self._parse_range(a1)
+        rows = self.tabs[title]['rows']
+
+        end_row = len(rows) if last_row is None else last_row + 1
+        end_col = None if last_col is None else last_col + 1
+
+        values = []
+        for row in rows[first_row:end_row]:
+            cells = row[first_col:end_col]
+            while cells and cells[-1] == '':
+                cells = cells[:-1]
+            values.append(cells)
+
+        self._trim(values)
+
+        result = {'range': a1, 'majorDimension': 'ROWS'}
+        if values:
+            result['values'] = values
+        return result
+
+    def _write(self, title, first_row, first_col, values):
+        rows = self.tabs[title]['rows']
+
+        while len(rows) < first_row + len(values):
+            rows.append([])
+
+        for offset, new_cells in enumerate(values):
+            row = rows[first_row + offset]
+            if len(row) < first_col + len(new_cells):
+                row.extend([''] * (first_col + len(new_cells) - len(row)))
+            row[first_col:first_col + len(new_cells)] = [self._user_entered(value) for value in new_cells]
+
+        return {'updatedRows': len(values), 'updatedCells': sum(len(row) for row in values)}
+
+    def _update(self, a1, body):
+        title, first_row, _, first_col, _ = self._parse_range(a1)
+        result = self._write(title, first_row, first_col, body.get('values', []))
+        return {'spreadsheetId': self.spreadsheet_id, 'updatedRange': a1, **result}
+
+    def _append(self, a1, body):
+        title, _, _, first_col, _ = self._parse_range(a1)
+        self._trim(self.tabs[title]['rows'])
+
+        result = self._write(title, len(self.tabs[title]['rows']), first_col, body.get('values', []))
+        return {'spreadsheetId': self.spreadsheet_id, 'tableRange': a1, 'updates': {'updatedRange': a1, **result}}
+
+    def _clear(self, a1):
+        title, first_row, last_row, first_col, last_col = self._parse_range(a1)
+        rows = self.tabs[title]['rows']
+        end_row = len(rows) if last_row is None else min(last_row + 1, len(rows))
+
+        for row in rows[first_row:end_row]:
+            end_col = len(row) if last_col is None else min(last_col + 1, len(row))
+            row[first_col:end_col] = [''] * max(0, end_col - first_col)
+
+        self._trim(rows)
+        return {'spreadsheetId': self.spreadsheet_id, 'clearedRange': a1}
+
+
+class _Request:
+    """What the client's methods return - nothing happens until execute()"""
+
+    def __init__(self, emulator, method, spreadsheet_id, action):
+        self.emulator = emulator
+        self.method = method
+        self.spreadsheet_id = spreadsheet_id
+        self.action = action
+
+    def execute(self, num_retries=0):
+        return self.emulator._execute(self.method, self.spreadsheet_id, self.action)
+
+
+class _Values:
+    """spreadsheets().values()"""
+
+    def __init__(self, emulator):
+        self.emulator = emulator
+
+    def get(self, spreadsheetId, range, valueRenderOption=None, majorDimension=None):
+        return _Request(self.emulator, 'values.get', spreadsheetId, lambda: self.emulator._read(range))
+
+    def batchGet(self, spreadsheetId, ranges, valueRenderOption=None, majorDimension=None):
+        return _Request(self.emulator, 'values.batchGet', spreadsheetId, lambda: {
+            'spreadsheetId': self.emulator.spreadsheet_id,
+            'valueRanges': [self.emulator._read(a1) for a1 in ranges]
+        })
+
+    def append(self, spreadsheetId, range, body, valueInputOption='USER_ENTERED', insertDataOption=None):
+        return _Request(self.emulator, 'values.append', spreadsheetId, lambda: self.emulator._append(range, body))
+
+    def update(self, spreadsheetId, range, body, valueInputOption='USER_ENTERED'):
+        return _Request(self.emulator, 'values.update', spreadsheetId, lambda: self.emulator._update(range, body))
+
+    def clear(self, spreadsheetId, range, body=None):
+        return _Request(self.emulator, 'values.clear', spreadsheetId, lambda: self.emulator._clear(range))
+
+
+# Test
+if __name__ == "__main__":
+    emulator = SheetEmulator(quota_per_minute=5)
+    sheet = emulator.spreadsheets()
+
+    sheet.values().append(spreadsheetId='emulator', range='Sheet1!A:C',
+                          body={'values': [['Title', 'Company', 'Score'], ['Data Analyst', 'Amazon', 85.0]]}).execute()
+    sheet.batchUpdate(spreadsheetId='emulator', body={'requests': [{'appendCells': {
+        'sheetId': 0,
+        'rows': [{'values': [{'userEnteredValue': {'stringValue': 'BI Analyst'}},
+                             {'userEnteredValue': {'stringValue': 'Swiggy'}},
+                             {'userEnteredValue': {'numberValue': 46310},
+                              'userEnteredFormat': {'numberFormat': {'type': 'DATE', 'pattern': 'dd-mmm-yyyy'}}}]}]
+    }}]}).execute()
+
+    print(sheet.values().get(spreadsheetId='emulator', range='Sheet1!A:C').execute()['values'])
+
+    try:
+        for _ in range(5):
+            sheet.get(spreadsheetId='emulator').execute()
+    except HttpError as e:
+        print(f"Quota: HTTP {e.resp.status} after {sum(emulator.calls.values())} calls")
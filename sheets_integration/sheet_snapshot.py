@@ -0,0 +1,132 @@
+# sheets_integration/sheet_snapshot.py - One read of the sheet per run, queried in memory
+
+from datetime import datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(text, date_formats):
+    """strptime is slow and a sheet has only a few distinct dates - parse each once"""
+
+    for fmt in date_formats:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+class SheetSnapshot:
+    """
+    The jobs tab (A:R) as it was read once at the start of a run
+
+    Cleanup, dedup and stats all work off this copy instead of re-reading
+    the sheet. The run's own writes are mirrored into it (rows appended,
+    rows deleted), so it stays accurate without another read; edits made
+    in the browser meanwhile are picked up by the next run.
+    """
+
+    # Column positions (A = 0)
+    CHECKBOX = 0
+    DATE_FOUND = 1
+    URL = 8
+    ATS_SCORE = 9
+    STATUS = 15
+    PRIORITY = 17
+
+    CHECKED_VALUES = ('TRUE', 'YES', '1')
+
+    def __init__(self, values):
+        """
+        Args:
+            values (list): Rows as returned by values.get / batchGet (header first)
+        """
+
+        self.header = values[0] if values else []
+        self.rows = [list(row) for row in values[1:]]
+
+    @classmethod
+    def load(cls, sheet, spreadsheet_id, sheet_name='Sheet1'):
+        """Read the whole tab with one batchGet"""
+
+        result = sheet.values().batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=[f'{sheet_name}!A:R']
+        ).execute()
+
+        value_ranges = result.get('valueRanges', [])
+        values = value_ranges[0].get('values', []) if value_ranges else []
+
+        return cls(values)
+
+    @staticmethod
+    def _cell(row, column):
+        return str(row[column]).strip() if len(row) > column else ''
+
+    # ── Queries ─────────────────────────────────────
+
+    def urls(self):
+        """Job URLs in the sheet"""
+
+        urls = set()
+        for row in self.rows:
+            url = self._cell(row, self.URL)
+            if url and url != 'Job URL':  # Skip a stray header
+                urls.add(url)
+        return urls
+
+    def checked_rows(self):
+        """Sheet row numbers (1-based, header = 1) whose checkbox is ticked"""
+
+        return [
+            idx for idx, row in enumerate(self.rows, start=2)
+            if self._cell(row, self.CHECKBOX).upper() in self.CHECKED_VALUES
+        ]
+
+    def stale_rows(self, before, statuses=(), date_formats=()):
+        """
+        Row numbers due for archiving: found before `before` (a date), or
+        with a Status in `statuses`. Dates that match none of date_formats
+        (strptime patterns) never count as old.
+        """
+
+        stale = []
+
+        for idx, row in enumerate(self.rows, start=2):
+            if self._cell(row, self.STATUS) in statuses:
+                stale.append(idx)
+                continue
+
+            found = self.date_found(row, date_formats)
+            if before and found and found < before:
+                stale.append(idx)
+
+        return stale
+
+    @classmethod
+    def date_found(cls, row, date_formats):
+        """Column B as a date, or None"""
+
+        return _parse_date(cls._cell(row, cls.DATE_FOUND), tuple(date_formats))
+
+    def stats(self):
+        return {
+            'total_jobs': len(self.rows),
+            'pending_analysis': sum(1 for row in self.rows if self._cell(row, self.ATS_SCORE) == 'Pending'),
+            'high_priority': sum(1 for row in self.rows if 'HIGH' in self._cell(row, self.PRIORITY)),
+            'applied': sum(1 for row in self.rows if self._cell(row, self.STATUS) == 'Applied')
+        }
+
+    # ── This run's writes ───────────────────────────
+
+    def rows_appended(self, rows):
+        """Mirror rows appended at the bottom of the sheet"""
+
+        for row in rows:
+            self.rows.append(['TRUE' if value is True else 'FALSE' if value is False else str(value) for value in row])
+
+    def rows_deleted(self, row_numbers):
+        """Mirror deleted sheet rows (1-based numbers as in checked_rows)"""
+
+        doomed = {row_number - 2 for row_number in row_numbers}
+        self.rows = [row for idx, row in enumerate(self.rows) if idx not in doomed]
@@ -0,0 +1,52 @@
+# sheets_integration/sheet_state.py - Cached sheet metadata (logs/sheet_state.json)
+
+import os
+import json
+
+
+class SheetState:
+    """
+    Per-spreadsheet facts that don't change between runs
+
+    Holds the tab's numeric sheetId and which version of the one-time
+    formatting (header style, frozen row, column widths) has been applied,
+    so writers skip the spreadsheets.get and the full-sheet format pass.
+    """
+
+    def __init__(self, spreadsheet_id, path='logs/sheet_state.json'):
+        self.spreadsheet_id = spreadsheet_id
+        self.path = path
+        self.all_states = {}
+
+        # Ensure logs directory exists
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.all_states = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.all_states = {}
+
+    @property
+    def state(self):
+        return self.all_states.setdefault(self.spreadsheet_id, {})
+
+    def get(self, key, default=None):
+        return self.state.get(key, default)
+
+    def update(self, **values):
+        self.state.update(values)
+        self.save()
+
+    def forget(self):
+        """Drop everything cached (e.g. the tab was deleted and recreated)"""
+
+        self.all_states.pop(self.spreadsheet_id, None)
+        self.save()
+
+    def save(self):
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.all_states, f, indent=2)
+        except Exception as e:
+            print(f"⚠️  Error saving sheet state: {e}")
@@ -1,6 +1,7 @@
 # sheets_integration/sheets_updater.py - FIXED VERSION
 
 import os
+import re
 import sys
 from datetime import datetime
 from google.oauth2.service_account import Credentials
@@ -8,6 +9,11 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.salary_extractor import SalaryExtractor
+from sheets_integration.sheet_state import SheetState
+from sheets_integration.sheet_snapshot import SheetSnapshot
+from sheets_integration.row_cleanup import RowCleanup
+from sheets_integration.sheet_archiver import SheetArchiver
 from dotenv import load_dotenv
 
 load_dotenv('config/.env')
@@ -15,10 +21,28 @@ load_dotenv('config/.env')
 class GoogleSheetsUpdater:
     """Update Google Sheets with job data"""
     
-    def __init__(self):
-        """Initialize Google Sheets API"""
+    SHEET_NAME = 'Sheet1'
+    COLUMN_COUNT = 18  # A:R
+    
+    # Bump when format_requests() changes - the new formatting is applied once
+    FORMAT_VERSION = 1
+    
+    # How USER_ENTERED would read the date/time columns -> Sheets number format
+    DATE_FORMATS = [('%d-%b-%Y', 'DATE', 'dd-mmm-yyyy'), ('%Y-%m-%d', 'DATE', 'yyyy-mm-dd')]
+    TIME_FORMATS = [('%I:%M %p', 'TIME', 'hh:mm AM/PM'), ('%H:%M:%S', 'TIME', 'hh:mm:ss')]
+    
+    def __init__(self, service=None, spreadsheet_id=None):
+        """
+        Initialize Google Sheets API
+        
+        Args:
+            service: Sheets client to use instead of connecting with
+                     config/google_credentials.json - e.g. a SheetEmulator
+                     for offline runs and benchmarks
+            spreadsheet_id (str): Defaults to GOOGLE_SHEET_ID from .env
+        """
         
-        self.spreadsheet_id = os.getenv('GOOGLE_SHEET_ID')
+        self.spreadsheet_id = spreadsheet_id or os.getenv('GOOGLE_SHEET_ID')
         
         if not self.spreadsheet_id:
             raise ValueError("GOOGLE_SHEET_ID not found in .env file")
@@ -26,18 +50,27 @@ class GoogleSheetsUpdater:
         # Set up credentials
         creds_path = 'config/google_credentials.json'
         
-        if not os.path.exists(creds_path):
+        if service is None and not os.path.exists(creds_path):
             raise FileNotFoundError(f"Google credentials not found at: {creds_path}")
         
         SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
         
         try:
-            creds = Credentials.from_service_account_file(creds_path, scopes=SCOPES)
-            self.service = build('sheets', 'v4', credentials=creds)
+            if service is None:
+                creds = Credentials.from_service_account_file(creds_path, scopes=SCOPES)
+                service = build('sheets', 'v4', credentials=creds)
+            
+            self.service = service
             self.sheet = self.service.spreadsheets()
             
             print("✅ Google Sheets API connected")
             
+            # Sheet id + formatting state, cached across runs
+            self.state = SheetState(self.spreadsheet_id)
+            
+            # Sheet contents, read once per run on first use
+            self._snapshot = None
+            
         except Exception as e:
             raise ConnectionError(f"Failed to connect to Google Sheets: {str(e)}")
     
@@ -53,65 +86,147 @@ class GoogleSheetsUpdater:
             print("⚠️  No jobs to add")
             return False
         
-        # ✅ FIXED: Prepare all rows FIRST
-        rows = []
-        
-        for job in jobs_list:
-            row = [
-                False,  # Checkbox (column A)
-                job.get('date_found', datetime.now().strftime('%d-%b-%Y')),  # Use job's date
-                job.get('time_found', datetime.now().strftime('%I:%M %p')),  # Use job's time
-                job.get('company', 'Unknown'),
-                job.get('title', 'Unknown'),
-                job.get('salary', 'Not mentioned'),
-                job.get('location', 'Unknown'),
-                job.get('portal', 'Unknown'),
-                job.get('url', ''),
-                
-                # AI Analysis fields
-                str(job.get('ats_score', 'Pending')),
-                str(job.get('selection_chances', 'Pending')),
-                str(job.get('skills_match_percentage', 'Pending')),
-                
-                # Missing skills - handle list
-                ', '.join(job.get('missing_skills', [])) if isinstance(job.get('missing_skills'), list) else str(job.get('missing_skills', 'Pending')),
+        rows = [self.job_row(job) for job in jobs_list]
+        
+        for attempt in range(2):
+            try:
+                self.append_rows(rows)
+                print(f"✅ Successfully added {len(rows)} jobs to Google Sheets")
+                return True
                 
-                str(job.get('resume_changes', 'Pending')),
-                str(job.get('project_emphasis', 'Pending')),
+            except HttpError as e:
+                if attempt == 0 and e.resp.status == 400 and self.state.get('sheet_id') is not None:
+                    # Cached sheet id is stale (tab recreated?) - look it up again
+                    self.state.forget()
+                    continue
                 
-                'New',  # Status
-                '',     # Notes
-                self.calculate_priority(job)
-            ]
-            
-            rows.append(row)
+                print(f"❌ Error updating sheet: {str(e)}")
+                return False
+    
+    def job_row(self, job):
+        """One sheet row (A:R) for a job"""
+        
+        return [
+            False,  # Checkbox (column A)
+            job.get('date_found', datetime.now().strftime('%d-%b-%Y')),  # Use job's date
+            job.get('time_found', datetime.now().strftime('%I:%M %p')),  # Use job's time
+            job.get('company', 'Unknown'),
+            job.get('title', 'Unknown'),
+            job.get('salary', 'Not mentioned'),
+            job.get('location', 'Unknown'),
+            job.get('portal', 'Unknown'),
+            job.get('url', ''),
+            
+            # AI Analysis fields
+            str(job.get('ats_score', 'Pending')),
+            str(job.get('selection_chances', 'Pending')),
+            str(job.get('skills_match_percentage', 'Pending')),
+            
+            # Missing skills - handle list
+            ', '.join(job.get('missing_skills', [])) if isinstance(job.get('missing_skills'), list) else str(job.get('missing_skills', 'Pending')),
+            
+            str(job.get('resume_changes', 'Pending')),
+            str(job.get('project_emphasis', 'Pending')),
+            
+            'New',  # Status
+            '',     # Notes
+            self.calculate_priority(job)
+        ]
+    
+    def append_rows(self, rows):
+        """
+        Append rows with one batchUpdate
         
-        # ✅ FIXED: Now body is defined
-        body = {'values': rows}
+        appendCells writes the values and the new rows' checkbox validation
+        together; the one-time sheet formatting rides along in the same
+        request the first time (or when FORMAT_VERSION changes).
+        """
         
-        try:
-            # Batch append
-            result = self.sheet.values().append(
-                spreadsheetId=self.spreadsheet_id,
-                range='Sheet1!A:R',
-                valueInputOption='USER_ENTERED',
-                insertDataOption='INSERT_ROWS',
-                body=body
-            ).execute()
-            
-            updates = result.get('updates', {})
-            rows_added = updates.get('updatedRows', 0)
-            
-            print(f"✅ Successfully added {rows_added} jobs to Google Sheets")
-            
-            # Apply formatting
-            self.format_sheet()
+        sheet_id = self.get_sheet_id()
+        
+        requests = [{
+            'appendCells': {
+                'sheetId': sheet_id,
+                'rows': [{'values': self.row_cells(row)} for row in rows],
+                'fields': 'userEnteredValue,userEnteredFormat.numberFormat,dataValidation'
+            }
+        }]
+        
+        needs_format = self.state.get('format_version') != self.FORMAT_VERSION
+        if needs_format:
+            requests += self.format_requests(sheet_id)
+        
+        self.sheet.batchUpdate(
+            spreadsheetId=self.spreadsheet_id,
+            body={'requests': requests}
+        ).execute()
+        
+        if self._snapshot is not None:
+            self._snapshot.rows_appended(rows)
+        
+        if needs_format:
+            self.state.update(format_version=self.FORMAT_VERSION)
+            print("✅ Sheet formatting applied")
+    
+    def row_cells(self, row):
+        """CellData for one row - typed the way USER_ENTERED would read it"""
+        
+        cells = [
+            # Checkbox, validation set per row instead of re-applied to the whole column
+            {'userEnteredValue': {'boolValue': bool(row[0])}, 'dataValidation': {'condition': {'type': 'BOOLEAN'}}},
+            self._typed_cell(row[1], self.DATE_FORMATS),
+            self._typed_cell(row[2], self.TIME_FORMATS)
+        ]
+        
+        for value in row[3:]:
+            text = str(value)
+            if re.fullmatch(r'-?\d+(?:\.\d+)?', text):
+                cells.append({'userEnteredValue': {'numberValue': float(text)}})
+            else:
+                cells.append({'userEnteredValue': {'stringValue': text}})
+        
+        return cells
+    
+    @staticmethod
+    def _typed_cell(text, formats):
+        """Date/time text -> serial number + matching number format (else plain text)"""
+        
+        for fmt, kind, pattern in formats:
+            try:
+                value = datetime.strptime(str(text), fmt)
+            except ValueError:
+                continue
             
-            return True
+            # Sheets serial: days since 1899-12-30, time as the fraction
+            if kind == 'DATE':
+                serial = (value - datetime(1899, 12, 30)).days
+            else:
+                serial = (value.hour * 3600 + value.minute * 60 + value.second) / 86400
             
-        except HttpError as e:
-            print(f"❌ Error updating sheet: {str(e)}")
-            return False
+            return {
+                'userEnteredValue': {'numberValue': serial},
+                'userEnteredFormat': {'numberFormat': {'type': kind, 'pattern': pattern}}
+            }
+        
+        return {'userEnteredValue': {'stringValue': str(text)}}
+    
+    def get_sheet_id(self):
+        """Numeric id of the jobs tab (cached in logs/sheet_state.json)"""
+        
+        sheet_id = self.state.get('sheet_id')
+        if sheet_id is not None:
+            return sheet_id
+        
+        sheet_metadata = self.sheet.get(
+            spreadsheetId=self.spreadsheet_id,
+            fields='sheets.properties(sheetId,title)'
+        ).execute()
+        
+        tabs = [tab['properties'] for tab in sheet_metadata['sheets']]
+        tab = next((t for t in tabs if t.get('title') == self.SHEET_NAME), tabs[0])
+        
+        self.state.update(sheet_id=tab['sheetId'])
+        return tab['sheetId']
     
     def calculate_priority(self, job):
         """Calculate job priority"""
@@ -126,18 +241,15 @@ class GoogleSheetsUpdater:
             priority_score += 3
         
         # Factor 2: Salary
-        salary = job.get('salary', 'Not mentioned')
-        if salary != 'Not mentioned':
+        salary = SalaryExtractor.value_of(job)
+        if salary is not None:
             priority_score += 2
             
-            import re
-            numbers = re.findall(r'\d+', salary)
-            if numbers:
-                min_sal = int(numbers[0])
-                if min_sal >= 30:
-                    priority_score += 2
-                elif min_sal >= 25:
-                    priority_score += 1
+            min_sal = salary.floor_lpa
+            if min_sal >= 30:
+                priority_score += 2
+            elif min_sal >= 25:
+                priority_score += 1
         
         # Factor 3: ATS score
         ats_score = job.get('ats_score', 0)
@@ -164,155 +276,122 @@ class GoogleSheetsUpdater:
         else:
             return '🟢 LOW'
     
-    def format_sheet(self):
-        """Apply formatting to the sheet"""
+    def format_requests(self, sheet_id):
+        """One-time sheet formatting: header style, frozen row, checkboxes, column widths"""
         
-        try:
-            # Get sheet ID
-            sheet_metadata = self.sheet.get(spreadsheetId=self.spreadsheet_id).execute()
-            sheet_id = sheet_metadata['sheets'][0]['properties']['sheetId']
-            
-            requests = [
-                # Freeze header row
-                {
-                    'updateSheetProperties': {
-                        'properties': {
-                            'sheetId': sheet_id,
-                            'gridProperties': {
-                                'frozenRowCount': 1
-                            }
-                        },
-                        'fields': 'gridProperties.frozenRowCount'
-                    }
-                },
-                
-                # Bold header row with blue background
-                {
-                    'repeatCell': {
-                        'range': {
-                            'sheetId': sheet_id,
-                            'startRowIndex': 0,
-                            'endRowIndex': 1
-                        },
-                        'cell': {
-                            'userEnteredFormat': {
-                                'backgroundColor': {
-                                    'red': 0.2,
-                                    'green': 0.4,
-                                    'blue': 0.8
+        return [
+            # Freeze header row
+            {
+                'updateSheetProperties': {
+                    'properties': {
+                        'sheetId': sheet_id,
+                        'gridProperties': {
+                            'frozenRowCount': 1
+                        }
+                    },
+                    'fields': 'gridProperties.frozenRowCount'
+                }
+            },
+            
+            # Bold header row with blue background
+            {
+                'repeatCell': {
+                    'range': {
+                        'sheetId': sheet_id,
+                        'startRowIndex': 0,
+                        'endRowIndex': 1
+                    },
+                    'cell': {
+                        'userEnteredFormat': {
+                            'backgroundColor': {
+                                'red': 0.2,
+                                'green': 0.4,
+                                'blue': 0.8
+                            },
+                            'textFormat': {
+                                'foregroundColor': {
+                                    'red': 1.0,
+                                    'green': 1.0,
+                                    'blue': 1.0
                                 },
-                                'textFormat': {
-                                    'foregroundColor': {
-                                        'red': 1.0,
-                                        'green': 1.0,
-                                        'blue': 1.0
-                                    },
-                                    'bold': True
-                                }
+                                'bold': True
                             }
-                        },
-                        'fields': 'userEnteredFormat(backgroundColor,textFormat)'
-                    }
-                },
-                
-                # Add checkbox validation to column A (starting from row 2)
-                {
-                    'repeatCell': {
-                        'range': {
-                            'sheetId': sheet_id,
-                            'startColumnIndex': 0,
-                            'endColumnIndex': 1,
-                            'startRowIndex': 1
-                        },
-                        'cell': {
-                            'dataValidation': {
-                                'condition': {
-                                    'type': 'BOOLEAN'
-                                }
-                            }
-                        },
-                        'fields': 'dataValidation'
-                    }
-                },
-                
-                # Auto-resize all columns
-                {
-                    'autoResizeDimensions': {
-                        'dimensions': {
-                            'sheetId': sheet_id,
-                            'dimension': 'COLUMNS',
-                            'startIndex': 0,
-                            'endIndex': 18
                         }
-                    }
+                    },
+                    'fields': 'userEnteredFormat(backgroundColor,textFormat)'
                 }
-            ]
+            },
             
-            body = {'requests': requests}
+            # Add checkbox validation to column A (starting from row 2)
+            {
+                'repeatCell': {
+                    'range': {
+                        'sheetId': sheet_id,
+                        'startColumnIndex': 0,
+                        'endColumnIndex': 1,
+                        'startRowIndex': 1
+                    },
+                    'cell': {
+                        'dataValidation': {
+                            'condition': {
+                                'type': 'BOOLEAN'
+                            }
+                        }
+                    },
+                    'fields': 'dataValidation'
+                }
+            },
             
+            # Auto-resize all columns
+            {
+                'autoResizeDimensions': {
+                    'dimensions': {
+                        'sheetId': sheet_id,
+                        'dimension': 'COLUMNS',
+                        'startIndex': 0,
+                        'endIndex': self.COLUMN_COUNT
+                    }
+                }
+            }
+        ]
+    
+    def format_sheet(self):
+        """Re-apply the full sheet formatting now (normally done once by append_rows)"""
+        
+        try:
             self.sheet.batchUpdate(
                 spreadsheetId=self.spreadsheet_id,
-                body=body
+                body={'requests': self.format_requests(self.get_sheet_id())}
             ).execute()
             
+            self.state.update(format_version=self.FORMAT_VERSION)
             print("✅ Sheet formatting applied")
             
         except Exception as e:
             print(f"⚠️  Formatting error (non-critical): {str(e)[:60]}")
     
+    def snapshot(self, refresh=False):
+        """This run's copy of the sheet (SheetSnapshot) - one batchGet, then in memory"""
+        
+        if self._snapshot is None or refresh:
+            self._snapshot = SheetSnapshot.load(self.sheet, self.spreadsheet_id, self.SHEET_NAME)
+        return self._snapshot
+    
     def get_sheet_stats(self):
         """Get statistics about the sheet"""
         
         try:
-            result = self.sheet.values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range='Sheet1!A:R'
-            ).execute()
-            
-            values = result.get('values', [])
-            
-            if not values or len(values) <= 1:
-                return {
-                    'total_jobs': 0,
-                    'pending_analysis': 0,
-                    'high_priority': 0,
-                    'applied': 0
-                }
-            
-            total = len(values) - 1
-            
-            pending = sum(1 for row in values[1:] if len(row) > 9 and row[9] == 'Pending')
-            high_priority = sum(1 for row in values[1:] if len(row) > 17 and 'HIGH' in str(row[17]))
-            applied = sum(1 for row in values[1:] if len(row) > 15 and row[15] == 'Applied')
-            
-            return {
-                'total_jobs': total,
-                'pending_analysis': pending,
-                'high_priority': high_priority,
-                'applied': applied
-            }
+            return self.snapshot().stats()
             
         except Exception as e:
             print(f"❌ Error getting stats: {str(e)}")
             return {}
+    
     def get_existing_job_urls(self):
         """Get all job URLs already in sheet"""
         
         try:
-            result = self.sheet.values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range='Sheet1!I:I'  # Column I = Job URL
-            ).execute()
-            
-            values = result.get('values', [])
-            
-            # Extract URLs (skip header)
-            existing_urls = set()
-            for row in values[1:]:
-                if row and len(row) > 0:
-                    url = row[0].strip()
-                    if url and url != 'Job URL':  # Skip header
-                        existing_urls.add(url)
+            existing_urls = self.snapshot().urls()
             
             print(f"📊 Found {len(existing_urls)} existing jobs in sheet")
             return existing_urls
@@ -335,7 +414,7 @@ class GoogleSheetsUpdater:
             skipped = 0
             
             for job in jobs_list:
-                job_url = job.get('url', '').strip()
+                job_url = (job.get('url') or '').strip()
                 
                 if job_url and job_url not in existing_urls:
                     new_jobs.append(job)
@@ -346,66 +425,53 @@ class GoogleSheetsUpdater:
             
             return new_jobs
 
-    def delete_checked_jobs(self):
-            """Delete jobs marked as applied (checkbox = TRUE)"""
+    def delete_rows(self, row_numbers, compact=None):
+            """Delete sheet rows (1-based) with the fewest operations - see RowCleanup"""
+            
+            cleanup = RowCleanup(self.sheet, self.spreadsheet_id, self.get_sheet_id(),
+                                 self.SHEET_NAME, self.COLUMN_COUNT)
+            return cleanup.delete_rows(row_numbers, snapshot=self.snapshot(), compact=compact)
+    
+    def delete_checked_jobs(self, compact=None):
+            """Delete jobs marked as applied (checkbox = TRUE); returns how many"""
             
             print("\n🗑️  Checking for completed jobs...")
             
             try:
-                # Get all data including checkboxes
-                result = self.sheet.values().get(
-                    spreadsheetId=self.spreadsheet_id,
-                    range='Sheet1!A:R'
-                ).execute()
-                
-                values = result.get('values', [])
+                snapshot = self.snapshot()
                 
-                if not values or len(values) <= 1:
+                if not snapshot.rows:
                     print("   No jobs to clean up")
-                    return
+                    return 0
                 
-                # Find checked rows (from bottom to top to preserve indices)
-                rows_to_delete = []
-                
-                for idx, row in enumerate(values[1:], start=2):  # Start from row 2
-                    if len(row) > 0 and str(row[0]).upper() in ['TRUE', 'YES', '1']:
-                        rows_to_delete.append(idx)
+                rows_to_delete = snapshot.checked_rows()
                 
                 if not rows_to_delete:
                     print("   No checked jobs to delete")
-                    return
+                    return 0
                 
                 print(f"   Found {len(rows_to_delete)} checked jobs")
                 
-                # Get sheet ID
-                sheet_metadata = self.sheet.get(spreadsheetId=self.spreadsheet_id).execute()
-                sheet_id = sheet_metadata['sheets'][0]['properties']['sheetId']
-                
-                # Delete rows in reverse order (bottom to top)
-                requests = []
-                for row_num in sorted(rows_to_delete, reverse=True):
-                    requests.append({
-                        'deleteDimension': {
-                            'range': {
-                                'sheetId': sheet_id,
-                                'dimension': 'ROWS',
-                                'startIndex': row_num - 1,
-                                'endIndex': row_num
-                            }
-                        }
-                    })
-                
-                # Execute batch delete
-                body = {'requests': requests}
-                self.sheet.batchUpdate(
-                    spreadsheetId=self.spreadsheet_id,
-                    body=body
-                ).execute()
+                deleted = self.delete_rows(rows_to_delete, compact=compact)
                 
-                print(f"   ✅ Deleted {len(rows_to_delete)} checked jobs")
+                print(f"   ✅ Deleted {deleted} checked jobs")
+                return deleted
                 
             except Exception as e:
                 print(f"   ⚠️  Cleanup error: {e}")
+                return 0
+    
+    def archive_old_jobs(self, job_store):
+            """Move old / Applied / Rejected rows to the archive - see SheetArchiver"""
+            
+            print("\n📦 Checking for rows to archive...")
+            
+            try:
+                return SheetArchiver(self, job_store).archive()
+                
+            except Exception as e:
+                print(f"   ⚠️  Archive error: {e}")
+                return 0
 
 
 # Test
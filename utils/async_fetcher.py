@@ -0,0 +1,127 @@
+# utils/async_fetcher.py - Concurrent, per-host polite HTTP for career APIs
+
+import os
+import time
+import asyncio
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class AsyncFetcher:
+    """
+    Fetch many career-API URLs at once with asyncio
+
+    Requests go through one pooled requests.Session (keep-alive connections
+    are reused across companies and roles), run in worker threads via
+    asyncio.to_thread. Limits are per host: at most per_host requests in
+    flight and host_delay seconds between request starts to the same host,
+    so one slow or strict host is throttled without holding up the others.
+    """
+
+    def __init__(self, max_concurrency=None, per_host=None, host_delay=None, timeout=10):
+        """
+        Args:
+            max_concurrency (int): Requests in flight overall (FETCH_MAX_CONCURRENCY)
+            per_host (int): Requests in flight per host (FETCH_PER_HOST)
+            host_delay (float): Seconds between requests to one host (FETCH_HOST_DELAY)
+            timeout (float): Per-request timeout
+        """
+
+        self.max_concurrency = int(max_concurrency if max_concurrency is not None else os.getenv('FETCH_MAX_CONCURRENCY', '16'))
+        self.per_host = int(per_host if per_host is not None else os.getenv('FETCH_PER_HOST', '2'))
+        self.host_delay = float(host_delay if host_delay is not None else os.getenv('FETCH_HOST_DELAY', '1.0'))
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_concurrency, pool_maxsize=self.max_concurrency)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+        # host -> monotonic time the next request may start (kept across fetch_all calls)
+        self._next_start = {}
+
+    async def _polite_turn(self, host, lock):
+        """Wait until host_delay has passed since the last request to this host started"""
+
+        async with lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self.host_delay
+
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def _fetch(self, request, limit, host_limits, host_locks):
+        if isinstance(request, str):
+            request = {'url': request}
+
+        host = urlparse(request['url']).netloc
+        host_limit = host_limits.setdefault(host, asyncio.Semaphore(self.per_host))
+        host_lock = host_locks.setdefault(host, asyncio.Lock())
+
+        async with host_limit:
+            await self._polite_turn(host, host_lock)
+
+            async with limit:
+                return await asyncio.to_thread(
+                    self.session.request,
+                    request.get('method', 'GET'),
+                    request['url'],
+                    json=request.get('json'),
+                    headers=request.get('headers'),
+                    timeout=self.timeout
+                )
+
+    async def _fetch_all(self, requests_list):
+        limit = asyncio.Semaphore(self.max_concurrency)
+        host_limits = {}
+        host_locks = {}
+
+        return await asyncio.gather(
+            *(self._fetch(request, limit, host_limits, host_locks) for request in requests_list),
+            return_exceptions=True
+        )
+
+    def fetch_all(self, requests_list):
+        """
+        Fetch every request concurrently
+
+        Args:
+            requests_list (list): URLs, or dicts with url / method / json / headers
+
+        Returns: list in the same order - a Response, or the exception raised
+        """
+
+        if not requests_list:
+            return []
+
+        return asyncio.run(self._fetch_all(requests_list))
+
+    def close(self):
+        self.session.close()
+
+
+# Test
+if __name__ == "__main__":
+    urls = [
+        'https://httpbin.org/delay/1',
+        'https://httpbin.org/delay/1',
+        'https://httpbin.org/delay/1',
+        'https://example.com/',
+        'https://example.org/',
+    ]
+
+    fetcher = AsyncFetcher(per_host=2, host_delay=0.5)
+
+    start = time.monotonic()
+    results = fetcher.fetch_all(urls)
+
+    for url, result in zip(urls, results):
+        status = result.status_code if isinstance(result, requests.Response) else f"error: {str(result)[:40]}"
+        print(f"{url:35} {status}")
+
+    print(f"\n{len(urls)} requests in {time.monotonic() - start:.1f}s")
+    fetcher.close()
@@ -0,0 +1,97 @@
+# utils/card_extractor.py - Read every job card's fields in one WebDriver round trip
+
+from selenium.common.exceptions import WebDriverException
+
+
+class CardExtractor:
+    """
+    Pulls the fields of a page's job cards with one execute_script call
+
+    Each field is a list of (css selector, what to read) fallbacks, tried in
+    order inside the card - the first non-empty value wins. What to read is
+    'text' (innerText, like WebElement.text), 'href' (absolute URL, like
+    get_attribute('href')) or any attribute name. A selector of None reads
+    the card itself. Every card also gets 'text': its full text, for the
+    "first line is the title" style fallbacks.
+
+    The per-element path (find_element per field per card - several
+    chromedriver calls each) is kept as a fallback if the script fails, and
+    for benchmarks/card_extraction_bench.py.
+    """
+
+    SCRIPT = """
+        const cards = arguments[0], fields = arguments[1];
+
+        const read = (el, what) => {
+            if (what === 'text') return el.innerText;
+            if (what === 'href') return el.href || el.getAttribute('href');
+            return el.getAttribute(what);
+        };
+
+        return cards.map(card => {
+            const out = {text: (card.innerText || '').trim()};
+
+            for (const [name, candidates] of Object.entries(fields)) {
+                out[name] = null;
+
+                for (const [selector, what] of candidates) {
+                    const el = selector ? card.querySelector(selector) : card;
+                    const value = el ? read(el, what) : null;
+
+                    if (value && value.trim()) {
+                        out[name] = value.trim();
+                        break;
+                    }
+                }
+            }
+            return out;
+        });
+    """
+
+    def __init__(self, driver, fields):
+        """
+        Args:
+            driver: WebDriver the scraper uses
+            fields (dict): name -> [(css selector, 'text' / 'href' / attribute), ...]
+        """
+
+        self.driver = driver
+        self.fields = {name: [list(candidate) for candidate in candidates] for name, candidates in fields.items()}
+
+    def extract(self, cards):
+        """Field dicts for cards (same order), in one round trip"""
+
+        if not cards:
+            return []
+
+        try:
+            return self.driver.execute_script(self.SCRIPT, list(cards), self.fields)
+        except WebDriverException as e:
+            print(f"   ⚠️  Batch extraction failed ({str(e)[:60]}) - reading cards one by one")
+            return [self.extract_one(card) for card in cards]
+
+    def extract_one(self, card):
+        """Same fields through per-element WebDriver calls (the slow path)"""
+
+        from selenium.webdriver.common.by import By
+
+        try:
+            out = {'text': card.text.strip()}
+        except WebDriverException:
+            out = {'text': ''}
+
+        for name, candidates in self.fields.items():
+            out[name] = None
+
+            for selector, what in candidates:
+                try:
+                    el = card.find_element(By.CSS_SELECTOR, selector) if selector else card
+                    value = el.text if what == 'text' else el.get_attribute(what)
+                except WebDriverException:
+                    continue
+
+                if value and value.strip():
+                    out[name] = value.strip()
+                    break
+
+        return out
@@ -3,9 +3,84 @@
 from datetime import datetime, timedelta
 import re
 
+# "2 hours ago", "Posted 3 Days Ago", "30+ days" and the compact "24h" / "2d" / "1w" / "3mo"
+AGE_PATTERN = re.compile(r'(\d+)\s*\+?\s*(minutes?|mins?|months?|mo|m|hours?|hrs?|h|days?|d|weeks?|w)\b')
+
+AGE_UNITS = {
+    'min': timedelta(minutes=1),
+    'm': timedelta(minutes=1),
+    'mo': timedelta(days=30),
+    'h': timedelta(hours=1),
+    'd': timedelta(days=1),
+    'w': timedelta(weeks=1)
+}
+
 class JobDateParser:
     """Parse job posting dates from various formats"""
     
+    @staticmethod
+    def parse_age(text):
+        """
+        Age in a posting's text as a timedelta, or None
+        
+        "2 hours ago" → 2h, "24h" → 24h, "2d" → 2 days, "30d+" → 30 days
+        """
+        
+        match = AGE_PATTERN.search(text.lower()) if text else None
+        if not match:
+            return None
+        
+        amount, unit = match.groups()
+        if unit.startswith('mo'):
+            key = 'mo'
+        elif unit.startswith('m'):
+            key = 'm'
+        else:
+            key = unit[0]
+        
+        return int(amount) * AGE_UNITS[key]
+    
+    @staticmethod
+    def latest_possible(text):
+        """
+        Latest moment a posting with this date text can have gone up
+        
+        Portals round ages both ways - Glassdoor shows "24h" for anything
+        from the last day, others "1 day ago" for 24-47 hours - so an age
+        is only trusted to the day: up to a day old → now, "3 days ago" →
+        now - 2 days, "30d+" → now - 29 days. "today" → now, a plain date
+        → the end of that day. None = can't tell.
+        """
+        
+        if not text:
+            return None
+        
+        text = text.lower().strip()
+        now = datetime.now()
+        
+        try:
+            posted = datetime.fromisoformat(text.replace('z', '+00:00'))
+            if posted.tzinfo:
+                posted = posted.astimezone().replace(tzinfo=None)
+            return posted + timedelta(days=1) if len(text) <= 10 else posted
+        except ValueError:
+            pass
+        
+        age = JobDateParser.parse_age(text)
+        if age is not None:
+            return now - max(age - timedelta(days=1), timedelta(0))
+        
+        if any(word in text for word in ['just', 'today', 'recent', 'few hours', 'now']):
+            return now
+        
+        if 'yesterday' in text:
+            return now.replace(hour=0, minute=0, second=0, microsecond=0)
+        
+        if 'month' in text:
+            return now - timedelta(days=30)
+        
+        return None
+    
     @staticmethod
     def parse_relative_date(text):
         """
@@ -24,29 +99,10 @@ class JobDateParser:
         text = text.lower().strip()
         now = datetime.now()
         
-        # Pattern 1: "X hours ago"
-        hours_match = re.search(r'(\d+)\s*hour', text)
-        if hours_match:
-            hours = int(hours_match.group(1))
-            return now - timedelta(hours=hours)
-        
-        # Pattern 2: "X minutes ago"
-        mins_match = re.search(r'(\d+)\s*min', text)
-        if mins_match:
-            mins = int(mins_match.group(1))
-            return now - timedelta(minutes=mins)
-        
-        # Pattern 3: "X days ago"
-        days_match = re.search(r'(\d+)\s*day', text)
-        if days_match:
-            days = int(days_match.group(1))
-            return now - timedelta(days=days)
-        
-        # Pattern 4: "X weeks ago"
-        weeks_match = re.search(r'(\d+)\s*week', text)
-        if weeks_match:
-            weeks = int(weeks_match.group(1))
-            return now - timedelta(weeks=weeks)
+        # Patterns 1-4: "X minutes/hours/days/weeks ago", "24h", "2d"
+        age = JobDateParser.parse_age(text)
+        if age is not None:
+            return now - age
         
         # Pattern 5: "Just posted" or "Posted today"
         if any(word in text for word in ['just', 'today', 'recent']):
@@ -86,7 +142,10 @@ if __name__ == "__main__":
         "Just posted",
         "Posted today",
         "3 weeks ago",
-        "30+ days ago"
+        "30+ days ago",
+        "24h",
+        "2d",
+        "30d+"
     ]
     
     print("="*70)
@@ -97,5 +156,7 @@ if __name__ == "__main__":
         dt = parser.parse_relative_date(test)
         date_str, time_str = parser.format_datetime(dt)
         
+        latest = parser.latest_possible(test)
+        
         print(f"\n'{test}'")
-        print(f"  → {date_str} at {time_str}")
\ No newline at end of file
+        print(f"  → {date_str} at {time_str} (no later than {latest.strftime('%d-%b %I:%M %p')})")
\ No newline at end of file
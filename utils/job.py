@@ -0,0 +1,134 @@
+# utils/job.py - Job record shared by scrapers, filter, analyzer and sheets writer
+
+import os
+import sys
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.salary_extractor import Salary
+
+
+class Job:
+    """
+    One job posting with a fixed set of fields (__slots__, no per-job __dict__)
+
+    Reads like the dicts it replaces - job['title'], job.get('salary', ...),
+    'ats_score' in job - so existing code keeps working. A field that was
+    never set behaves like a missing key. Only schema fields can be stored,
+    so scraper internals (Selenium elements etc.) can't ride along.
+    """
+
+    # Scraped
+    SCRAPED_FIELDS = (
+        'date_found', 'time_found', 'company', 'title', 'salary', 'salary_value',
+        'salary_estimated', 'location', 'portal', 'url', 'description',
+        'experience', 'search_role', 'posted_at', 'posted_raw'
+    )
+
+    # Filled in by ResumeAnalyzer
+    ANALYSIS_FIELDS = (
+        'ats_score', 'selection_chances', 'skills_match_percentage',
+        'missing_skills', 'resume_changes', 'project_emphasis', 'analysis_time'
+    )
+
+    FIELDS = SCRAPED_FIELDS + ANALYSIS_FIELDS
+
+    __slots__ = FIELDS
+
+    def __init__(self, **fields):
+        for key, value in fields.items():
+            self[key] = value
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        if key not in self.FIELDS:
+            raise KeyError(f"Job has no field '{key}'")
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.FIELDS and hasattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in self.FIELDS else default
+
+    def keys(self):
+        return [key for key in self.FIELDS if hasattr(self, key)]
+
+    def update(self, fields):
+        """Set several fields at once - keys outside the schema are ignored"""
+        for key, value in fields.items():
+            if key in self.FIELDS:
+                setattr(self, key, value)
+
+    def to_dict(self):
+        """Plain JSON-ready dict of the fields that are set"""
+
+        data = {key: getattr(self, key) for key in self.keys()}
+
+        if isinstance(data.get('salary_value'), Salary):
+            data['salary_value'] = data['salary_value']._asdict()
+        if isinstance(data.get('posted_at'), datetime):
+            data['posted_at'] = data['posted_at'].isoformat()
+
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """Job from a dict (e.g. a saved run); unknown keys are dropped"""
+
+        job = cls()
+        job.update(data)
+
+        salary = job.get('salary_value')
+        if isinstance(salary, dict):
+            job.salary_value = Salary(**salary)
+        elif isinstance(salary, (list, tuple)) and not isinstance(salary, Salary):
+            job.salary_value = Salary(*salary)
+
+        if isinstance(job.get('posted_at'), str):
+            try:
+                job.posted_at = datetime.fromisoformat(job.posted_at)
+            except ValueError:
+                del job.posted_at
+
+        return job
+
+    def __repr__(self):
+        return f"Job({self.get('title', '?')!r} at {self.get('company', '?')!r}, {self.get('portal', '?')})"
+
+
+# Test
+if __name__ == "__main__":
+    import json
+
+    job = Job(
+        title='Data Analyst',
+        company='Amazon',
+        salary='20-25 LPA',
+        salary_value=Salary.stated(20, 25),
+        portal='Naukri',
+        posted_at=datetime.now()
+    )
+
+    print(job)
+    print(f"job['title']: {job['title']} | salary: {job.get('salary')} | ats: {job.get('ats_score', 'Pending')}")
+    print(f"'ats_score' in job: {'ats_score' in job}")
+
+    job.update({'ats_score': 82, 'selection_chances': 'High', 'job_number': 1})
+    print(f"After analysis: ats={job['ats_score']} ('job_number' dropped)")
+
+    try:
+        job['posted'] = object()
+    except KeyError as e:
+        print(f"Rejected: {e}")
+
+    restored = Job.from_dict(json.loads(json.dumps(job.to_dict())))
+    print(f"Round trip: {restored.to_dict() == job.to_dict()} ({restored.salary_value!r})")
+
+    as_dict = job.to_dict()
+    print(f"Size: Job {sys.getsizeof(job)} bytes vs dict {sys.getsizeof(as_dict)} bytes")
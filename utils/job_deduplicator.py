@@ -1,78 +1,268 @@
 # utils/job_deduplicator.py
 
+from collections import Counter
 from difflib import SequenceMatcher
 import hashlib
+import string
+
+# Histogram slot per signature character (digits, a-z, anything else shares the last slot)
+_CHAR_SLOTS = {c: i for i, c in enumerate(string.digits + string.ascii_lowercase)}
+_OTHER_SLOT = len(_CHAR_SLOTS)
+
+
+class SignatureIndex:
+    """
+    Near-duplicate index over title+company signatures (n-gram blocking)
+
+    SequenceMatcher ratio > t means the two signatures are fewer than
+    (1-t)*(len_a+len_b) single-character insertions/deletions apart, so a
+    signature of length L can only match something at most D = max_edits(L)
+    edits away. Each signature is cut into 2D+2 segments and filed under
+    (length, segment no., segment text) blocks. One edit breaks at most one
+    segment, so of any k segments a real near-duplicate still lines up in
+    at least k-D.
+
+    A lookup walks only blocks holding at most BLOCK_CAP signatures and
+    keeps signatures hitting k-D of the k segments it walked. Segments
+    like "dataanalyst" or "technologies", shared by every same-length
+    signature, are never walked - their blocks grow with the index, the
+    company text's don't - so a lookup costs the same at 500 jobs or 50k.
+
+    Exact (same answers as comparing against everything seen) whenever at
+    least D+1 of the segments are below the cap. Otherwise a near-duplicate
+    sharing nothing but such common segments can be missed.
+    """
+
+    BLOCK_CAP = 32  # Bigger blocks are never walked
+
+    def __init__(self, threshold=0.95):
+        self.threshold = threshold
+        self.signatures = set()   # Exact signatures (fast path)
+        self.blocks = {}          # (length, segment_no, text) -> [signature, ...]
+        self.lengths = set()      # Signature lengths seen so far
+        self.char_counts = {}     # signature -> character histogram
+
+    def max_edits(self, length):
+        """Most insertions/deletions a >threshold match of this length can differ by"""
+
+        # edits < (1-t) * (L + L')  and  L' <= L + edits
+        slack = 1 - self.threshold
+        return int(2 * slack * length / self.threshold)
+
+    def _segments(self, length):
+        """(start, size) of the 2*max_edits(length)+2 segments of a signature"""
+
+        parts = 2 * self.max_edits(length) + 2
+        size, longer = divmod(length, parts)
+        segments = []
+        start = 0
+        for i in range(parts):
+            seg_size = size + (1 if i >= parts - longer else 0)
+            segments.append((start, seg_size))
+            start += seg_size
+        return segments
+
+    @staticmethod
+    def _histogram(signature):
+        counts = [0] * (_OTHER_SLOT + 1)
+        for c in signature:
+            counts[_CHAR_SLOTS.get(c, _OTHER_SLOT)] += 1
+        return tuple(counts)
+
+    def candidates(self, signature):
+        """Signatures sharing enough aligned segments to possibly be a match"""
+
+        found = set()
+        query_len = len(signature)
+        reach = self.max_edits(query_len) + 1
+
+        for length in range(max(0, query_len - reach), query_len + reach + 1):
+            if length not in self.lengths:
+                continue
+
+            edits = self.max_edits(length)
+            delta = query_len - length
+            if abs(delta) > edits:
+                continue
+
+            # A surviving segment moves by `shift`; edits before and after it add up
+            shifts = [
+                shift for shift in range(-edits, edits + 1)
+                if abs(shift) + abs(delta - shift) <= edits
+            ]
+
+            # Look up every segment's blocks, then only walk the small ones:
+            # at most D segments are broken, so a real match hits k-D of k
+            probes = []
+            for i, (start, size) in enumerate(self._segments(length)):
+                blocks = []
+                for shift in shifts:
+                    pos = start + shift
+                    if 0 <= pos and pos + size <= query_len:
+                        block = self.blocks.get((length, i, signature[pos:pos + size]))
+                        if block:
+                            blocks.append(block)
+                probes.append((sum(len(block) for block in blocks), blocks))
+
+            walked = [blocks for size, blocks in probes if size <= self.BLOCK_CAP]
+            needed = max(1, len(walked) - edits)
+
+            hits = Counter()
+            for blocks in walked:
+                hits.update(set().union(*blocks))
+
+            found.update(seen for seen, count in hits.items() if count >= needed)
+
+        return found
+
+    def find_similar(self, signature, similarity):
+        """Return True if an indexed signature is more similar than threshold"""
+
+        if signature in self.signatures:
+            return True
+
+        counts = self._histogram(signature)
+
+        for seen in self.candidates(signature):
+            total = len(signature) + len(seen)
+
+            # Cheap upper bounds first: ratio <= 2*min(len)/total, and
+            # ratio <= 2*shared characters/total (same bound as quick_ratio)
+            if 2 * min(len(signature), len(seen)) <= self.threshold * total:
+                continue
+            shared = sum(map(min, counts, self.char_counts[seen]))
+            if 2 * shared <= self.threshold * total:
+                continue
+
+            if similarity(signature, seen) > self.threshold:
+                return True
+
+        return False
+
+    def add(self, signature):
+        if signature in self.signatures:
+            return
+
+        self.signatures.add(signature)
+        self.lengths.add(len(signature))
+        self.char_counts[signature] = self._histogram(signature)
+
+        for i, (start, size) in enumerate(self._segments(len(signature))):
+            key = (len(signature), i, signature[start:start + size])
+            self.blocks.setdefault(key, []).append(signature)
+
+    def __len__(self):
+        return len(self.signatures)
+
 
 class JobDeduplicator:
     """Detect and remove duplicate jobs from different sources"""
-    
+
+    SIMILARITY_THRESHOLD = 0.95  # STRICTER: 0.95 instead of 0.85
+
     def __init__(self):
-        self.seen_jobs = set()  # Store hashes of seen jobs
-    
+        self.seen_urls = set()             # md5 of every job URL seen
+        self.signature_index = SignatureIndex(self.SIMILARITY_THRESHOLD)
+
+    @staticmethod
+    def make_signature(job):
+        """
+        Normalized title+company signature, or None if the title is too generic
+        """
+
+        title = (job.get('title') or '').lower().strip()
+        company = (job.get('company') or '').lower().strip()
+
+        # Skip if title is too generic
+        if not title or len(title) < 5 or title == 'unknown':
+            return None
+
+        signature = f"{title}_{company}"
+        return ''.join(c for c in signature if c.isalnum())
+
     def is_duplicate(self, job):
         """
         Check if job is duplicate based on:
         1. Exact URL match
-        2. Very similar title + company (>90% match)
+        2. Very similar title + company (>95% match)
         """
-        
+
         # Method 1: Exact URL match
         if job.get('url') and job['url'].strip():
             url_hash = hashlib.md5(job['url'].encode()).hexdigest()
-            if url_hash in self.seen_jobs:
+            if url_hash in self.seen_urls:
                 return True
-            self.seen_jobs.add(url_hash)
-        
-        # Method 2: Title + Company match (stricter threshold)
-        title = job.get('title', '').lower().strip()
-        company = job.get('company', '').lower().strip()
-        
-        # Skip if title is too generic
-        if not title or len(title) < 5 or title == 'unknown':
+            self.seen_urls.add(url_hash)
+
+        # Method 2: Title + Company match (only same-block candidates are compared)
+        signature_clean = self.make_signature(job)
+
+        if signature_clean is None:
             return False
-        
-        # Create signature
-        signature = f"{title}_{company}"
-        signature_clean = ''.join(c for c in signature if c.isalnum())
-        
-        # Check against all seen (STRICTER: 0.95 instead of 0.85)
-        for seen_sig in list(self.seen_jobs):
-            if isinstance(seen_sig, str) and len(seen_sig) > 10:  # It's a signature, not hash
-                similarity = self.similarity(signature_clean, seen_sig)
-                if similarity > 0.95:  # CHANGED from 0.85 to 0.95
-                    return True
-        
+
+        if self.signature_index.find_similar(signature_clean, self.similarity):
+            return True
+
         # Not duplicate - add to seen
-        self.seen_jobs.add(signature_clean)
-        
+        self.signature_index.add(signature_clean)
+
         return False
-        
+
     def similarity(self, str1, str2):
         """Calculate similarity ratio between two strings"""
         return SequenceMatcher(None, str1, str2).ratio()
-    
+
     def deduplicate_list(self, jobs):
         """Remove duplicates from a list of jobs"""
         unique_jobs = []
-        
+
         for job in jobs:
             if not self.is_duplicate(job):
                 unique_jobs.append(job)
-        
+
         return unique_jobs
 
 
 # Test
 if __name__ == "__main__":
+    import random
+    import time
+
     jobs = [
         {'title': 'Data Analyst', 'company': 'Amazon', 'url': 'http://example.com/1'},
         {'title': 'Data Analyst', 'company': 'Amazon', 'url': 'http://example.com/1'},  # Duplicate URL
         {'title': 'Data Analyst at Amazon', 'company': 'Amazon Inc', 'url': 'http://example.com/2'},  # Similar
         {'title': 'Senior Data Analyst', 'company': 'Google', 'url': 'http://example.com/3'},  # Unique
     ]
-    
+
     deduplicator = JobDeduplicator()
     unique = deduplicator.deduplicate_list(jobs)
-    
+
     print(f"Original: {len(jobs)} jobs")
-    print(f"After deduplication: {len(unique)} jobs")
\ No newline at end of file
+    print(f"After deduplication: {len(unique)} jobs")
+
+    # Scale check: a lookup only walks small blocks, so time grows linearly
+    rng = random.Random(0)
+    roles = ['Data Analyst', 'Business Analyst', 'Junior Data Analyst', 'Product Analyst',
+             'Data Scientist', 'Analytics Associate', 'Risk Analyst', 'Financial Analyst']
+    suffixes = ['', '', ' - Remote', ' (Bangalore)', ' I']
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    companies = [
+        ''.join(rng.choice(letters) for _ in range(rng.randint(5, 10))).title()
+        + rng.choice(['', ' Pvt Ltd', ' Technologies', ' Analytics'])
+        for _ in range(5000)
+    ]
+
+    for n in (5000, 10000, 20000, 50000):
+        many = [
+            {
+                'title': rng.choice(roles) + rng.choice(suffixes),
+                'company': rng.choice(companies),
+                'url': f"http://example.com/{rng.randrange(n * 2)}"
+            }
+            for _ in range(n)
+        ]
+
+        start = time.perf_counter()
+        unique = JobDeduplicator().deduplicate_list(many)
+        print(f"{n} jobs -> {len(unique)} unique in {time.perf_counter() - start:.2f}s")
@@ -52,9 +52,9 @@ class JobFilter:
         Check if job is suitable for fresher/0-2 years experience
         """
         
-        title = job_data.get('title', '').lower()
-        description = job_data.get('description', '').lower()
-        company = job_data.get('company', '').lower()
+        title = (job_data.get('title') or '').lower()
+        description = (job_data.get('description') or '').lower()
+        company = (job_data.get('company') or '').lower()
         
         # Red flags in title (REJECT)
         reject_keywords = [
@@ -141,44 +141,112 @@ class JobFilter:
         
         # Default: Unknown company, assume average
         return None
+    # Companies estimate_fresher_salary is trusted for (no AI check)
+    KNOWN_COMPANIES = [
+        'amazon', 'google', 'microsoft', 'meta', 'flipkart', 'swiggy',
+        'zomato', 'paytm', 'phonepe', 'razorpay', 'cred', 'uber',
+        'tcs', 'infosys', 'wipro', 'hcl', 'cognizant', 'accenture'
+    ]
+    
+    # One verifier (Groq client) and salary store per process, created on first use
+    _verifier = None
+    _salary_store = None
+    
+    @staticmethod
+    def is_known_company(company):
+        return any(known in company.lower() for known in JobFilter.KNOWN_COMPANIES)
+    
+    @staticmethod
+    def _get_verifier():
+        if JobFilter._verifier is None:
+            from utils.salary_verifier import SalaryVerifier
+            JobFilter._verifier = SalaryVerifier()
+        return JobFilter._verifier
+    
+    @staticmethod
+    def _get_salary_store():
+        if JobFilter._salary_store is None:
+            from utils.salary_store import CompanySalaryStore
+            JobFilter._salary_store = CompanySalaryStore()
+        return JobFilter._salary_store
+    
+    @staticmethod
+    def _estimate_from_result(result):
+        """Verifier result -> estimated min LPA, or None to reject"""
+        
+        if result.get('pays_above_threshold') and result.get('confidence') in ['High', 'Medium']:
+            try:
+                return int(float(result.get('estimated_min_lpa') or 0))
+            except (TypeError, ValueError):
+                return None
+        
+        return None
+    
+    @staticmethod
+    def prefetch_company_salaries(companies, role="Data Analyst", min_lpa=15):
+        """
+        Verify every unknown company of this run in one batched AI pass
+        
+        Answers go into the salary store, so the per-job
+        verify_unknown_company_salary calls that follow are local lookups.
+        Returns: number of companies sent to the AI
+        """
+        
+        try:
+            store = JobFilter._get_salary_store()
+            
+            # Unknown, not yet stored - and each normalized company only once
+            unknown = {}
+            for company in companies:
+                if not company or JobFilter.is_known_company(company):
+                    continue
+                if store.get(company, role, min_lpa) is None:
+                    unknown.setdefault(store.normalize_company(company), company)
+            
+            if not unknown:
+                return 0
+            
+            results = JobFilter._get_verifier().check_companies(list(unknown.values()), role, min_lpa)
+            
+            for company, result in results.items():
+                store.put(company, result, role, min_lpa)
+            
+            return len(unknown)
+            
+        except Exception as e:
+            print(f"   ⚠️  Batch salary verification skipped: {str(e)[:60]}")
+            return 0
+    
     @staticmethod
     def verify_unknown_company_salary(company, role="Data Analyst", min_lpa=15):
         """
         For unknown startups, verify salary using AI
+        (answers are remembered in the company salary store)
         """
         
-        # Check if company is in known list
-        known_companies = [
-            'amazon', 'google', 'microsoft', 'meta', 'flipkart', 'swiggy',
-            'zomato', 'paytm', 'phonepe', 'razorpay', 'cred', 'uber',
-            'tcs', 'infosys', 'wipro', 'hcl', 'cognizant', 'accenture'
-        ]
-        
-        is_known = any(known in company.lower() for known in known_companies)
-        
-        if is_known:
+        if JobFilter.is_known_company(company):
             # Use static estimate
             return JobFilter.estimate_fresher_salary(company, role)
-        else:
-            # Unknown company - verify using AI
-            try:
-                from utils.salary_verifier import SalaryVerifier
-                verifier = SalaryVerifier()
-                
-                pays_above, salary_range, confidence = verifier.check_company_salary(company, role, min_lpa)
-                
-                if pays_above and confidence in ['High', 'Medium']:
-                    # Extract min salary
-                    import re
-                    numbers = re.findall(r'\d+', salary_range)
-                    if numbers:
-                        return int(numbers[0])
-                
-                return None  # Reject
-                
-            except Exception as e:
-                print(f"   ⚠️  AI verification failed, defaulting to INCLUDE")
-                return min_lpa  # When in doubt, include
+        
+        # Unknown company - stored answer first, then verify using AI
+        try:
+            store = JobFilter._get_salary_store()
+            cached = store.get(company, role, min_lpa)
+            
+            if cached is not None:
+                return JobFilter._estimate_from_result(cached)
+            
+            result = JobFilter._get_verifier().check_companies([company], role, min_lpa).get(company)
+            
+            if result is None:
+                return None  # No usable answer - reject (not stored, retried next run)
+            
+            store.put(company, result, role, min_lpa)
+            return JobFilter._estimate_from_result(result)
+            
+        except Exception as e:
+            print(f"   ⚠️  AI verification failed, defaulting to INCLUDE")
+            return min_lpa  # When in doubt, include
 
 
 # Test
@@ -0,0 +1,298 @@
+# utils/job_store.py - Local history of every job seen (SQLite)
+
+import os
+import sys
+import json
+import sqlite3
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.job_deduplicator import JobDeduplicator
+
+
+class JobStore:
+    """
+    Cross-run job history used for deduplication
+
+    Every job that made it to the sheet is recorded with its URL, normalized
+    title+company signature, first-seen time and AI analysis. Checking a new
+    scrape against history is then an indexed local lookup instead of
+    downloading the sheet's URL column every run. The sheet is only read
+    again for an occasional reconcile (rows added by hand, other machines).
+    """
+
+    def __init__(self, db_path='logs/job_store.db'):
+        self.db_path = db_path
+
+        # Ensure logs directory exists
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                url TEXT PRIMARY KEY,
+                signature TEXT,
+                title TEXT,
+                company TEXT,
+                portal TEXT,
+                first_seen TEXT NOT NULL,
+                analysis TEXT
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_signature ON jobs (signature)")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS archive (
+                url TEXT PRIMARY KEY,
+                month TEXT,
+                status TEXT,
+                date_found TEXT,
+                company TEXT,
+                title TEXT,
+                row TEXT NOT NULL,
+                archived_at TEXT NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_archive_month ON archive (month)")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+        """)
+        self.conn.commit()
+
+    # ── Lookups ─────────────────────────────────────
+
+    def has_url(self, url):
+        row = self.conn.execute("SELECT 1 FROM jobs WHERE url = ?", (url,)).fetchone()
+        return row is not None
+
+    def has_signature(self, signature, days=None):
+        """True if the same title+company was first seen in the last SIGNATURE_DEDUP_DAYS"""
+
+        if days is None:
+            days = int(os.getenv('SIGNATURE_DEDUP_DAYS', '30'))
+        if days <= 0:
+            return False
+
+        since = (datetime.now() - timedelta(days=days)).isoformat()
+        row = self.conn.execute(
+            "SELECT 1 FROM jobs WHERE signature = ? AND first_seen >= ? LIMIT 1", (signature, since)
+        ).fetchone()
+        return row is not None
+
+    def is_known(self, job):
+        """
+        True if this job's URL was seen before, or the same title+company
+        recently (a re-post months later, or another "Data Analyst" at an
+        unnamed company, is a new job)
+        """
+
+        url = (job.get('url') or '').strip()
+        if url and self.has_url(url):
+            return True
+
+        company = (job.get('company') or '').strip().lower()
+        if company in ('', 'unknown', 'n/a', 'not mentioned'):
+            return False
+
+        signature = JobDeduplicator.make_signature(job)
+        return bool(signature) and self.has_signature(signature)
+
+    def filter_new_jobs(self, jobs_list):
+        """Remove jobs already in history (same contract as the sheet filter)"""
+
+        new_jobs = []
+        skipped = 0
+
+        for job in jobs_list:
+            job_url = (job.get('url') or '').strip()
+
+            if job_url and not self.is_known(job):
+                new_jobs.append(job)
+            else:
+                skipped += 1
+
+        print(f"✅ Filtered: {len(new_jobs)} new jobs (skipped {skipped} duplicates)")
+
+        return new_jobs
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    # ── Writes ──────────────────────────────────────
+
+    def add_jobs(self, jobs_list):
+        """Record jobs (and their analysis, if any) - first_seen is kept on re-add"""
+
+        now = datetime.now().isoformat()
+        rows = []
+
+        for job in jobs_list:
+            url = (job.get('url') or '').strip()
+            if not url:
+                continue
+
+            rows.append((
+                url,
+                JobDeduplicator.make_signature(job),
+                job.get('title'),
+                job.get('company'),
+                job.get('portal'),
+                now,
+                self._analysis_json(job)
+            ))
+
+        with self.conn:
+            self.conn.executemany("""
+                INSERT INTO jobs (url, signature, title, company, portal, first_seen, analysis)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    analysis = COALESCE(excluded.analysis, jobs.analysis)
+            """, rows)
+
+        return len(rows)
+
+    @staticmethod
+    def _analysis_json(job):
+        """AI analysis fields as JSON, or None if the job wasn't analyzed"""
+
+        if 'ats_score' not in job:
+            return None
+
+        fields = ['ats_score', 'selection_chances', 'skills_match_percentage',
+                  'missing_skills', 'resume_changes', 'project_emphasis']
+        return json.dumps({field: job.get(field) for field in fields})
+
+    def get_analysis(self, url):
+        row = self.conn.execute("SELECT analysis FROM jobs WHERE url = ?", (url,)).fetchone()
+        return json.loads(row[0]) if row and row[0] else None
+
+    # ── Archive (rows moved off the live sheet) ─────
+
+    def archive_rows(self, entries):
+        """
+        Keep sheet rows that were moved off the live sheet
+
+        Args:
+            entries (list): (month 'YYYY-MM', row A:R as text) pairs
+
+        The URLs also go into history, so archived jobs are still deduped.
+        Returns how many rows were stored.
+        """
+
+        now = datetime.now().isoformat()
+        archived = []
+
+        for month, row in entries:
+            row = (list(row) + [''] * 18)[:18]
+            url = str(row[8]).strip()
+            if not url:
+                continue
+            archived.append((url, month, row[15], row[1], row[3], row[4], json.dumps(row), now))
+
+        with self.conn:
+            self.conn.executemany("""
+                INSERT OR REPLACE INTO archive (url, month, status, date_found, company, title, row, archived_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, archived)
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO jobs (url, company, title, first_seen) VALUES (?, ?, ?, ?)",
+                [(url, company, title, now) for url, _, _, _, company, title, _, _ in archived]
+            )
+
+        return len(archived)
+
+    def archived(self, month=None, status=None):
+        """Archived sheet rows (A:R lists), optionally for one month / status"""
+
+        query = "SELECT row FROM archive WHERE 1 = 1"
+        params = []
+
+        if month:
+            query += " AND month = ?"
+            params.append(month)
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+
+        return [json.loads(row) for (row,) in self.conn.execute(query + " ORDER BY month, date_found", params)]
+
+    def archive_count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM archive").fetchone()[0]
+
+    # ── Sheet reconcile ─────────────────────────────
+
+    def last_reconcile(self):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'last_reconcile'").fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def needs_reconcile(self, max_age_hours=None):
+        """True if the sheet hasn't been merged in for SHEET_RECONCILE_HOURS"""
+
+        if max_age_hours is None:
+            max_age_hours = float(os.getenv('SHEET_RECONCILE_HOURS', '24'))
+
+        last = self.last_reconcile()
+        return last is None or datetime.now() - last >= timedelta(hours=max_age_hours)
+
+    def reconcile(self, sheet_urls):
+        """Merge URLs found in the sheet into history; returns how many were new"""
+
+        now = datetime.now().isoformat()
+        before = self.count()
+
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO jobs (url, first_seen) VALUES (?, ?)",
+                [(url.strip(), now) for url in sheet_urls if url and url.strip()]
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('last_reconcile', ?)", (now,)
+            )
+
+        return self.count() - before
+
+    def reconcile_with_sheet(self, updater, force=False):
+        """Pull the sheet's URL column into history if it's due (one network read)"""
+
+        if not force and not self.needs_reconcile():
+            return None
+
+        added = self.reconcile(updater.get_existing_job_urls())
+        print(f"🔄 Reconciled with sheet: {added} URLs added to local history")
+        return added
+
+    def close(self):
+        self.conn.close()
+
+
+# Test
+if __name__ == "__main__":
+    import tempfile
+
+    store = JobStore(os.path.join(tempfile.mkdtemp(), 'job_store.db'))
+
+    jobs = [
+        {'title': 'Data Analyst', 'company': 'Amazon', 'url': 'http://example.com/1', 'portal': 'LinkedIn'},
+        {'title': 'Senior Data Analyst', 'company': 'Google', 'url': 'http://example.com/2', 'ats_score': 82},
+        {'title': 'Data Analyst', 'company': 'Unknown', 'url': 'http://example.com/6'},
+    ]
+    store.add_jobs(jobs)
+    store.reconcile(['http://example.com/3'])
+
+    scraped = [
+        {'title': 'Data Analyst', 'company': 'Amazon', 'url': 'http://example.com/1?ref=feed'},  # Same job, new URL
+        {'title': 'BI Analyst', 'company': 'Swiggy', 'url': 'http://example.com/3'},             # Already in sheet
+        {'title': 'Product Analyst', 'company': 'Zomato', 'url': 'http://example.com/4'},        # New
+        {'title': 'Data Analyst', 'company': 'Unknown', 'url': 'http://example.com/5'},          # New (no company)
+    ]
+
+    print(f"History: {store.count()} jobs")
+    print(f"New: {[job['url'] for job in store.filter_new_jobs(scraped)]}")
+
+    # A re-post after the signature window is a new job
+    store.conn.execute("UPDATE jobs SET first_seen = ?", ((datetime.now() - timedelta(days=90)).isoformat(),))
+    print(f"Re-posted months later: {[job['url'] for job in store.filter_new_jobs(scraped[:1])]}")
+    print(f"Analysis: {store.get_analysis('http://example.com/2')}")
+    print(f"Needs reconcile: {store.needs_reconcile()}")
@@ -0,0 +1,204 @@
+# utils/page_waiter.py - Readiness-driven waits for Selenium scrapers
+
+import os
+import sys
+import threading
+import time
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.date_parser import JobDateParser
+
+
+class PageWaiter:
+    """
+    Wait for job cards to appear / stop growing instead of sleeping blindly
+
+    Every wait is measured against the fixed sleep it replaces, and the
+    difference is tallied per portal so the run summary can show how much
+    idle time was saved.
+    """
+
+    # portal -> seconds saved vs the old fixed sleeps (process-wide)
+    _saved = {}
+    _lock = threading.Lock()
+
+    def __init__(self, driver, wait, portal, settle_timeout=2.0, poll_frequency=0.25):
+        """
+        Args:
+            driver: WebDriver the scraper uses
+            wait (WebDriverWait): The scraper's existing wait (used for first paint)
+            portal (str): Name used for the savings report
+            settle_timeout (float): How long to wait for new cards after a scroll
+        """
+
+        self.driver = driver
+        self.wait = wait
+        self.portal = portal
+        self.settle_timeout = settle_timeout
+        self.poll_frequency = poll_frequency
+
+    def wait_for_cards(self, locators, budget=5):
+        """
+        Wait until any of the card locators matches
+
+        Args:
+            locators (list): (By, selector) tuples, tried in order
+            budget (float): Fixed sleep this wait replaces
+
+        Returns: (locator, cards) - locator is None if nothing showed up
+        """
+
+        start = time.monotonic()
+
+        def first_match(driver):
+            for locator in locators:
+                cards = driver.find_elements(*locator)
+                if cards:
+                    return locator, cards
+            return False
+
+        try:
+            found = self.wait.until(first_match)
+        except TimeoutException:
+            found = (None, [])
+
+        self._record(budget, time.monotonic() - start)
+        return found
+
+    def scroll_until_stable(self, locator, max_scrolls=3, budget_per_scroll=2, stop=None):
+        """
+        Scroll to the bottom until the card count stops increasing
+
+        Args:
+            stop (callable): stop(cards) -> True ends scrolling early
+                             (e.g. the last card is older than the last run)
+
+        Returns: final list of cards matching locator
+        """
+
+        start = time.monotonic()
+        cards = self.driver.find_elements(*locator)
+
+        for _ in range(max_scrolls):
+            if stop and cards and stop(cards):
+                break  # Everything further down is older
+
+            previous = len(cards)
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+
+            try:
+                WebDriverWait(self.driver, self.settle_timeout, poll_frequency=self.poll_frequency).until(
+                    lambda d: len(d.find_elements(*locator)) > previous
+                )
+            except TimeoutException:
+                break  # No growth - everything is loaded
+
+            cards = self.driver.find_elements(*locator)
+
+        self._record(budget_per_scroll * max_scrolls, time.monotonic() - start)
+        return cards
+
+    def click_and_wait(self, element, locator, budget=2):
+        """Click an element and wait for the panel at locator to (re)render"""
+
+        start = time.monotonic()
+        previous = self.driver.find_elements(*locator)
+
+        element.click()
+
+        try:
+            waiter = WebDriverWait(self.driver, self.settle_timeout, poll_frequency=self.poll_frequency)
+            if previous:
+                waiter.until(EC.staleness_of(previous[0]))
+            waiter.until(EC.presence_of_element_located(locator))
+        except TimeoutException:
+            pass
+
+        self._record(budget, time.monotonic() - start)
+
+    def _record(self, budget, elapsed):
+        with PageWaiter._lock:
+            PageWaiter._saved[self.portal] = PageWaiter._saved.get(self.portal, 0) + (budget - elapsed)
+
+    @staticmethod
+    def saved_seconds():
+        """Seconds saved per portal so far (negative = slower than fixed sleeps)"""
+
+        with PageWaiter._lock:
+            return dict(PageWaiter._saved)
+
+
+class RecencyCutoff:
+    """
+    Tells a newest-first card list when it has gone past since_time
+
+    A card is "past" when even the latest moment its date text allows
+    (JobDateParser.latest_possible: "3 days ago" -> 2 days ago, "24h" or
+    "today" -> now) is before since_time.
+    Cards without a readable date never count as past. Portals pin a few
+    promoted postings at the top, so the list is only considered done after
+    `patience` past cards in a row.
+
+    For lists not sorted by date (newest_first=False) past cards are still
+    skipped, but the list is never done early - a newer card can follow.
+    """
+
+    def __init__(self, since_time, posted_locators=(), patience=3, newest_first=True):
+        """
+        Args:
+            since_time (datetime): Last successful run (None = no cutoff)
+            posted_locators (list): (By, selector) tuples for a card's date element
+            patience (int): Consecutive past cards before the list is done
+            newest_first (bool): The portal sorts the list by date
+        """
+
+        self.since_time = since_time
+        self.posted_locators = posted_locators
+        self.patience = patience
+        self.newest_first = newest_first
+        self.past_streak = 0
+        self.skipped = 0
+
+    def latest_posted(self, card):
+        """Latest possible posting time from a card's date element (None = unknown)"""
+
+        for locator in self.posted_locators:
+            try:
+                elem = card.find_element(*locator)
+                text = elem.text.strip() or elem.get_attribute('datetime')
+            except Exception:
+                continue
+
+            if text:
+                return JobDateParser.latest_possible(text)
+
+        return None
+
+    def is_past(self, posted):
+        return bool(self.since_time and posted and posted < self.since_time)
+
+    def card_is_past(self, card):
+        return self.is_past(self.latest_posted(card))
+
+    def last_card_is_past(self, cards):
+        """stop= hook for PageWaiter.scroll_until_stable"""
+        return self.newest_first and self.card_is_past(cards[-1])
+
+    def skip(self, posted):
+        """True if this posting is older than since_time (and counts towards done)"""
+
+        if self.is_past(posted):
+            self.past_streak += 1
+            self.skipped += 1
+            return True
+
+        self.past_streak = 0
+        return False
+
+    @property
+    def done(self):
+        return self.newest_first and self.past_streak >= self.patience
@@ -0,0 +1,70 @@
+# utils/rate_limiter.py - Thread-safe token bucket for API rate limits
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at rate_per_minute
+
+    acquire() blocks until enough tokens are available, so any number of
+    worker threads can share one bucket and together stay under the limit.
+    """
+
+    def __init__(self, rate_per_minute, capacity=None):
+        """
+        Args:
+            rate_per_minute (float): Tokens added per minute (e.g. Groq RPM or TPM)
+            capacity (float): Burst size - defaults to one minute's worth
+        """
+
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, amount=1):
+        """Block until `amount` tokens are available, then take them"""
+
+        amount = min(amount, self.capacity)  # Never wait for more than the bucket holds
+
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                wait = (amount - self.tokens) / self.rate
+
+            time.sleep(wait)
+
+    def adjust(self, amount):
+        """Correct an earlier estimate (positive = used more than acquired)"""
+
+        with self.lock:
+            self._refill()
+            self.tokens -= amount
+
+    def drain(self):
+        """Empty the bucket - e.g. after the API says we're over the limit"""
+
+        with self.lock:
+            self._refill()
+            self.tokens = min(self.tokens, 0)
+
+
+# Test
+if __name__ == "__main__":
+    bucket = TokenBucket(rate_per_minute=120, capacity=2)  # 2 per second, burst of 2
+
+    start = time.monotonic()
+    for i in range(6):
+        bucket.acquire()
+        print(f"Token {i + 1} at {time.monotonic() - start:.2f}s")
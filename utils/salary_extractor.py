@@ -1,78 +1,188 @@
 # utils/salary_extractor.py
 
 import re
+from collections import namedtuple
+
+NOT_MENTIONED = "Not mentioned"
+
+USD_TO_INR = 83  # Used to express $ salaries in LPA
+
+
+class Salary(namedtuple('Salary', ['min_lpa', 'max_lpa', 'currency', 'estimated', 'note'])):
+    """
+    Numeric salary carried on a job (job['salary_value'])
+
+    min_lpa / max_lpa - yearly amount in lakhs of INR (min_lpa is None
+                        for "Up to X"); $ salaries are converted
+    currency          - currency it was stated in ('INR' or 'USD')
+    estimated         - True for company estimates, False if the posting said so
+    note              - extra label for estimates, e.g. "AI-verified"
+    """
+
+    @classmethod
+    def stated(cls, min_lpa, max_lpa, currency='INR'):
+        return cls(min_lpa, max_lpa, currency, False, None)
+
+    @classmethod
+    def estimate(cls, lpa, note=None):
+        return cls(lpa, lpa, 'INR', True, note)
+
+    @property
+    def floor_lpa(self):
+        """Number compared against thresholds - the minimum, or the cap for 'Up to X'"""
+        return self.min_lpa if self.min_lpa is not None else self.max_lpa
+
+    def __str__(self):
+        if self.estimated:
+            text = f"Est. {_format_lpa(self.floor_lpa)} LPA"
+            return f"{text} ({self.note})" if self.note else text
+
+        if self.min_lpa is None:
+            return f"Up to {_format_lpa(self.max_lpa)} LPA"
+
+        if self.min_lpa == self.max_lpa:
+            return f"{_format_lpa(self.min_lpa)} LPA"
+
+        return f"{_format_lpa(self.min_lpa)}-{_format_lpa(self.max_lpa)} LPA"
+
+
+def _format_lpa(value):
+    """20.0 -> '20', 66.4 -> '66.4'"""
+    value = round(value, 1)
+    return str(int(value)) if value == int(value) else str(value)
+
+
+# All salary formats in ONE precompiled alternation, highest priority first.
+# Wrapped in a lookahead so a single finditer() pass reports, at every
+# position, the best format starting there - overlapping candidates
+# included - which keeps the old "first pattern that matches anywhere wins"
+# behaviour without running seven separate searches.
+_SALARY_FORMATS = [
+    # Pattern 1: "20-25 LPA" or "20-25 Lakhs"
+    ('range_lpa', r'(?P<range_lpa_min>\d+)\s*-\s*(?P<range_lpa_max>\d+)\s*(?:LPA|Lakhs?|Lacs?|L\.?P\.?A\.?)'),
+
+    # Pattern 2: "₹20-25 Lakhs" or "INR 20-25 Lakhs"
+    ('inr_range', r'(?:₹|INR|Rs\.?)\s*(?P<inr_range_min>\d+)\s*-\s*(?P<inr_range_max>\d+)\s*(?:Lakhs?|Lacs?|LPA)'),
+
+    # Pattern 3: "Up to 30 LPA"
+    ('up_to', r'(?:up to|upto|max)\s*(?P<up_to_max>\d+)\s*(?:LPA|Lakhs?|Lacs?)'),
+
+    # Pattern 4: Just "25 LPA" or "25 Lakhs"
+    ('single_lpa', r'(?:^|\s)(?P<single_lpa_value>\d+)\s*(?:LPA|Lakhs?|Lacs?)(?:\s|$)'),
+
+    # Pattern 5: "2000000-2500000" (in raw numbers)
+    ('raw_range', r'(?:₹|INR|Rs\.?)?\s*(?P<raw_range_min>\d{7,8})\s*-\s*(?P<raw_range_max>\d{7,8})'),
+
+    # Pattern 6: "20L-25L" or "20L - 25L"
+    ('short_l', r'(?P<short_l_min>\d+)\s*L\s*-\s*(?P<short_l_max>\d+)\s*L'),
+
+    # Pattern 7: "$80K-$100K"
+    ('usd_range', r'\$\s*(?P<usd_range_min>\d+)K?\s*-\s*\$?\s*(?P<usd_range_max>\d+)K?'),
+]
+
+# Cheap guard first: every format starts with a digit, a currency/keyword or
+# whitespace before a digit, so other positions are skipped without trying
+# all seven alternatives there.
+_SALARY_START = r'(?=[\d₹$]|inr|rs|up|max|\s+\d)'
+
+SALARY_PATTERN = re.compile(
+    _SALARY_START + '(?=' + '|'.join(f'(?P<{name}>{pattern})' for name, pattern in _SALARY_FORMATS) + ')',
+    re.IGNORECASE
+)
+
+_PRIORITY = {name: rank for rank, (name, _) in enumerate(_SALARY_FORMATS)}
+
 
 class SalaryExtractor:
     """Extract salary from job descriptions with multiple patterns"""
     
     @staticmethod
-    def extract(text):
+    def parse(text):
         """
-        Extract salary from text
-        Returns: "20-25 LPA" or "Not mentioned"
+        Find the salary in text in a single scan
+        Returns: Salary or None
         """
         
         if not text:
-            return "Not mentioned"
+            return None
         
         # Clean text
         text = text.replace(',', '')  # Remove commas from numbers
         
-        patterns = [
-            # Pattern 1: "20-25 LPA" or "20-25 Lakhs"
-            (r'(\d+)\s*-\s*(\d+)\s*(?:LPA|Lakhs?|Lacs?|L\.?P\.?A\.?)', 
-             lambda m: f"{m.group(1)}-{m.group(2)} LPA"),
-            
-            # Pattern 2: "₹20-25 Lakhs" or "INR 20-25 Lakhs"
-            (r'(?:₹|INR|Rs\.?)\s*(\d+)\s*-\s*(\d+)\s*(?:Lakhs?|Lacs?|LPA)', 
-             lambda m: f"{m.group(1)}-{m.group(2)} LPA"),
-            
-            # Pattern 3: "Up to 30 LPA"
-            (r'(?:up to|upto|max)\s*(\d+)\s*(?:LPA|Lakhs?|Lacs?)', 
-             lambda m: f"Up to {m.group(1)} LPA"),
-            
-            # Pattern 4: Just "25 LPA" or "25 Lakhs"
-            (r'(?:^|\s)(\d+)\s*(?:LPA|Lakhs?|Lacs?)(?:\s|$)', 
-             lambda m: f"{m.group(1)} LPA"),
-            
-            # Pattern 5: "2000000-2500000" (in raw numbers)
-            (r'(?:₹|INR|Rs\.?)?\s*(\d{7,8})\s*-\s*(\d{7,8})', 
-             lambda m: f"{int(m.group(1))//100000}-{int(m.group(2))//100000} LPA"),
-            
-            # Pattern 6: "20L-25L" or "20L - 25L"
-            (r'(\d+)\s*L\s*-\s*(\d+)\s*L', 
-             lambda m: f"{m.group(1)}-{m.group(2)} LPA"),
-            
-            # Pattern 7: "$80K-$100K" (convert to INR)
-            (r'\$\s*(\d+)K?\s*-\s*\$?\s*(\d+)K?', 
-             lambda m: f"{int(m.group(1))*0.8}-{int(m.group(2))*0.8} LPA"),  # $1 ≈ 83 INR, $100K ≈ 8.3L
-        ]
-        
-        for pattern, formatter in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    return formatter(match)
-                except:
-                    continue
-        
-        return "Not mentioned"
+        best = None
+        best_rank = len(_SALARY_FORMATS)
+        
+        for match in SALARY_PATTERN.finditer(text):
+            rank = _PRIORITY[match.lastgroup]
+            if rank < best_rank:
+                best, best_rank = match, rank
+                if rank == 0:
+                    break  # Nothing outranks pattern 1
+        
+        if best is None:
+            return None
+        
+        return SalaryExtractor._to_salary(best.lastgroup, best)
     
     @staticmethod
-    def get_min_salary(salary_str):
-        """Extract minimum salary as integer"""
-        if salary_str == "Not mentioned":
-            return 0
-        
-        numbers = re.findall(r'\d+', salary_str)
-        if numbers:
-            return int(numbers[0])
-        return 0
+    def _to_salary(kind, match):
+        group = lambda suffix: int(match.group(f'{kind}_{suffix}'))
+        
+        if kind in ('range_lpa', 'inr_range', 'short_l'):
+            return Salary.stated(group('min'), group('max'))
+        
+        if kind == 'up_to':
+            return Salary.stated(None, group('max'))
+        
+        if kind == 'single_lpa':
+            return Salary.stated(group('value'), group('value'))
+        
+        if kind == 'raw_range':
+            return Salary.stated(group('min') / 100000, group('max') / 100000)
+        
+        # usd_range - $K per year -> LPA ($100K ≈ 83 LPA)
+        lakhs_per_k = USD_TO_INR * 1000 / 100000
+        return Salary.stated(round(group('min') * lakhs_per_k, 2), round(group('max') * lakhs_per_k, 2), currency='USD')
     
     @staticmethod
-    def meets_criteria(salary_str, min_lpa):
-        """Check if salary meets minimum criteria"""
-        min_sal = SalaryExtractor.get_min_salary(salary_str)
+    def extract(text):
+        """
+        Extract salary from text
+        Returns: "20-25 LPA" or "Not mentioned"
+        """
+        
+        return SalaryExtractor.describe(SalaryExtractor.parse(text))
+    
+    @staticmethod
+    def describe(salary):
+        """Display text for a Salary (or None)"""
+        return str(salary) if salary else NOT_MENTIONED
+    
+    @staticmethod
+    def value_of(job):
+        """
+        The job's Salary - job['salary_value'], or parsed from the display
+        text for jobs built without one (older saved runs, tests)
+        """
+        
+        salary = job.get('salary_value')
+        if salary is None and job.get('salary', NOT_MENTIONED) != NOT_MENTIONED:
+            salary = SalaryExtractor.parse(job['salary'])
+        return salary
+    
+    @staticmethod
+    def get_min_salary(salary):
+        """Minimum salary in LPA (0 if unknown) - takes a Salary or display text"""
+        
+        if isinstance(salary, str):
+            salary = SalaryExtractor.parse(salary) if salary != NOT_MENTIONED else None
+        
+        return salary.floor_lpa if salary else 0
+    
+    @staticmethod
+    def meets_criteria(salary, min_lpa):
+        """Check if salary (Salary, None or display text) meets minimum criteria"""
+        min_sal = SalaryExtractor.get_min_salary(salary)
         
         if min_sal == 0:
             return True  # Include for AI analysis
@@ -90,7 +200,9 @@ if __name__ == "__main__":
         "$80K-$100K annually",
         "25L - 30L CTC"
     ]
-    
+
     for case in test_cases:
         result = SalaryExtractor.extract(case)
-        print(f"'{case}' → {result}")
\ No newline at end of file
+        print(f"'{case}' → {result}  {SalaryExtractor.parse(case)!r}")
+
+    print(f"Estimate: {Salary.estimate(18, note='AI-verified')}")
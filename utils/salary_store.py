@@ -0,0 +1,133 @@
+# utils/salary_store.py - Persistent company -> fresher salary estimates (SQLite)
+
+import os
+import re
+import sqlite3
+from datetime import datetime, timedelta
+
+
+class CompanySalaryStore:
+    """
+    Remembers AI salary verifications per company
+
+    Keyed by normalized company name + role + LPA threshold, so "Zepto",
+    "Zepto Pvt. Ltd." and "ZEPTO" share one answer. Each entry keeps the
+    model's confidence and expires after SALARY_STORE_TTL_DAYS (Low
+    confidence answers after at most a week) so estimates get refreshed.
+    """
+
+    # Legal / filler suffixes that don't change which company it is
+    COMPANY_SUFFIXES = {
+        'pvt', 'private', 'ltd', 'limited', 'inc', 'llp', 'llc',
+        'corp', 'corporation', 'co', 'company', 'india', 'the'
+    }
+
+    LOW_CONFIDENCE_MAX_DAYS = 7
+
+    def __init__(self, db_path='logs/company_salaries.db', ttl_days=None):
+        self.db_path = db_path
+        self.ttl_days = float(ttl_days if ttl_days is not None else os.getenv('SALARY_STORE_TTL_DAYS', '30'))
+
+        # Ensure logs directory exists
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS company_salaries (
+                company_key TEXT NOT NULL,
+                role_key TEXT NOT NULL,
+                min_lpa REAL NOT NULL,
+                company TEXT,
+                pays_above INTEGER NOT NULL,
+                estimated_min_lpa REAL,
+                estimated_max_lpa REAL,
+                confidence TEXT,
+                reasoning TEXT,
+                checked_at TEXT NOT NULL,
+                expires_at TEXT NOT NULL,
+                PRIMARY KEY (company_key, role_key, min_lpa)
+            )
+        """)
+        self.conn.commit()
+
+    @classmethod
+    def normalize_company(cls, company):
+        words = re.sub(r'[^a-z0-9 ]', ' ', (company or '').lower()).split()
+        core = [word for word in words if word not in cls.COMPANY_SUFFIXES]
+        return ' '.join(core or words)
+
+    @staticmethod
+    def normalize_role(role):
+        return ' '.join((role or '').lower().split())
+
+    def _key(self, company, role, min_lpa):
+        return self.normalize_company(company), self.normalize_role(role), float(min_lpa)
+
+    def get(self, company, role="Data Analyst", min_lpa=15):
+        """Unexpired estimate dict for this company/role/threshold, or None"""
+
+        row = self.conn.execute("""
+            SELECT pays_above, estimated_min_lpa, estimated_max_lpa, confidence, reasoning, expires_at
+            FROM company_salaries
+            WHERE company_key = ? AND role_key = ? AND min_lpa = ?
+        """, self._key(company, role, min_lpa)).fetchone()
+
+        if row is None or datetime.fromisoformat(row[5]) < datetime.now():
+            return None
+
+        return {
+            'pays_above_threshold': bool(row[0]),
+            'estimated_min_lpa': row[1],
+            'estimated_max_lpa': row[2],
+            'confidence': row[3],
+            'reasoning': row[4]
+        }
+
+    def put(self, company, result, role="Data Analyst", min_lpa=15):
+        """Store a verifier result (dict in the verifier's JSON shape)"""
+
+        confidence = result.get('confidence', 'Low')
+        ttl_days = self.ttl_days if confidence in ['High', 'Medium'] else min(self.ttl_days, self.LOW_CONFIDENCE_MAX_DAYS)
+
+        now = datetime.now()
+        company_key, role_key, threshold = self._key(company, role, min_lpa)
+
+        with self.conn:
+            self.conn.execute("""
+                INSERT OR REPLACE INTO company_salaries
+                (company_key, role_key, min_lpa, company, pays_above, estimated_min_lpa,
+                 estimated_max_lpa, confidence, reasoning, checked_at, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                company_key, role_key, threshold, company,
+                int(bool(result.get('pays_above_threshold', False))),
+                result.get('estimated_min_lpa'),
+                result.get('estimated_max_lpa'),
+                confidence,
+                result.get('reasoning'),
+                now.isoformat(),
+                (now + timedelta(days=ttl_days)).isoformat()
+            ))
+
+    def close(self):
+        self.conn.close()
+
+
+# Test
+if __name__ == "__main__":
+    import tempfile
+
+    store = CompanySalaryStore(os.path.join(tempfile.mkdtemp(), 'company_salaries.db'))
+
+    print(f"Normalized: {store.normalize_company('Zepto Pvt. Ltd.')!r} / {store.normalize_company('ZEPTO')!r}")
+
+    store.put('Zepto Pvt. Ltd.', {
+        'pays_above_threshold': True,
+        'estimated_min_lpa': 16,
+        'estimated_max_lpa': 22,
+        'confidence': 'Medium',
+        'reasoning': 'Well-funded quick commerce startup'
+    })
+
+    print(f"Lookup 'ZEPTO': {store.get('ZEPTO')}")
+    print(f"Lookup other threshold: {store.get('Zepto', min_lpa=20)}")
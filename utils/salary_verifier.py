@@ -74,6 +74,80 @@ Respond ONLY in JSON:
         except Exception as e:
             print(f"⚠️ Failed ({str(e)[:40]})")
             return True, f"Est. {min_lpa}+ LPA", "Low"
+    
+    def check_companies(self, company_names, role="Data Analyst", min_lpa=15, per_request=20):
+        """
+        Verify many companies with one request per `per_request` companies
+        
+        Returns: {company_name: result dict (same keys as the single check)}
+        for every company the model answered - failed ones are left out so
+        callers can fall back to check_company_salary.
+        """
+        
+        results = {}
+        company_names = list(dict.fromkeys(company_names))  # Unique, keep order
+        
+        for start in range(0, len(company_names), per_request):
+            chunk = company_names[start:start + per_request]
+            print(f"🔍 Checking {len(chunk)} companies ({role}) in one request...", end=' ')
+            
+            try:
+                companies_text = '\n'.join(f"- {name}" for name in chunk)
+                
+                prompt = f"""For each company below: does it in India pay ABOVE {min_lpa} LPA to freshers (0-2 years) for {role}?
+
+{companies_text}
+
+Respond ONLY with a JSON array, one object per company, using the company name exactly as given:
+[
+  {{
+    "company": "Company Name",
+    "pays_above_threshold": true,
+    "estimated_min_lpa": 18,
+    "estimated_max_lpa": 25,
+    "confidence": "High",
+    "reasoning": "brief explanation"
+  }}
+]"""
+
+                response = self.client.chat.completions.create(
+                    model=self.MODEL,
+                    messages=[
+                        {"role": "system", "content": "You are a salary research expert. Respond only in JSON."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=120 * len(chunk),
+                    temperature=0.3
+                )
+                
+                result_text = response.choices[0].message.content.strip()
+                
+                # Extract JSON
+                if '```json' in result_text:
+                    result_text = result_text.split('```json')[1].split('```')[0]
+                elif '```' in result_text:
+                    result_text = result_text.split('```')[1].split('```')[0]
+                
+                entries = json.loads(result_text.strip())
+                
+                # Match answers back to the names we asked about (case-insensitive)
+                by_name = {name.lower().strip(): name for name in chunk}
+                answered = 0
+                
+                for entry in entries if isinstance(entries, list) else []:
+                    if not isinstance(entry, dict):
+                        continue
+                    name = by_name.get(str(entry.get('company', '')).lower().strip())
+                    if name and 'pays_above_threshold' in entry:
+                        results[name] = entry
+                        answered += 1
+                
+                print(f"✅ {answered}/{len(chunk)} answered")
+                
+            except Exception as e:
+                print(f"⚠️ Failed ({str(e)[:40]})")
+        
+        return results
 
 
 if __name__ == "__main__":
@@ -0,0 +1,130 @@
+# utils/search_urls.py - Per-portal search URLs with each portal's own recency filter
+
+import os
+import math
+from datetime import datetime, timedelta
+from urllib.parse import quote_plus
+
+
+class SearchUrlBuilder:
+    """
+    Builds the search URL for one portal and role
+
+    since_time is mapped to the finest recency filter the portal offers:
+    LinkedIn takes any number of seconds, Google any number of hours, the
+    rest only fixed day buckets (the smallest bucket that still covers the
+    window is used). SEARCH_OVERLAP_MINUTES is added to the window so
+    postings indexed late by the portal aren't missed - the deduplicator
+    drops the overlap. Naukri and Foundit results stay in relevance order,
+    so their scrapers can't stop at the first old card.
+    """
+
+    # Day buckets each portal's filter accepts
+    NAUKRI_DAYS = (1, 3, 7, 15, 30)
+    GLASSDOOR_DAYS = (1, 3, 7, 14, 30)
+    FOUNDIT_DAYS = (1, 3, 7, 15, 30)
+    INDEED_DAYS = (1, 3, 7, 14)
+
+    @staticmethod
+    def window(since_time):
+        """Time to search back (None = no filter, e.g. first run)"""
+
+        if not since_time:
+            return None
+
+        overlap = timedelta(minutes=float(os.getenv('SEARCH_OVERLAP_MINUTES', '10')))
+        return max(datetime.now() - since_time, timedelta(0)) + overlap
+
+    @staticmethod
+    def _days_bucket(window, buckets):
+        """Smallest bucket covering the window (None = wider than the widest bucket)"""
+
+        days = window.total_seconds() / 86400
+        for bucket in buckets:
+            if days <= bucket:
+                return bucket
+        return None
+
+    @staticmethod
+    def linkedin(role, since_time=None):
+        # f_TPR=r<seconds>: any window, e.g. r2400 = last 40 minutes
+        url = f"https://www.linkedin.com/jobs/search/?keywords={quote_plus(role)}&location=India&sortBy=DD"
+
+        window = SearchUrlBuilder.window(since_time)
+        if window:
+            url += f"&f_TPR=r{math.ceil(window.total_seconds())}"
+
+        return url
+
+    @staticmethod
+    def naukri(role, since_time=None):
+        slug = '-'.join(role.lower().split())
+        url = f"https://www.naukri.com/{slug}-jobs-in-india?k={quote_plus(role)}&l=india"
+
+        window = SearchUrlBuilder.window(since_time)
+        days = SearchUrlBuilder._days_bucket(window, SearchUrlBuilder.NAUKRI_DAYS) if window else None
+        if days:
+            url += f"&jobAge={days}"
+
+        return url
+
+    @staticmethod
+    def glassdoor(role, since_time=None):
+        url = f"https://www.glassdoor.co.in/Job/jobs.htm?sc.keyword={quote_plus(role)}&locKeyword=India&sortBy=date_desc"
+
+        window = SearchUrlBuilder.window(since_time)
+        days = SearchUrlBuilder._days_bucket(window, SearchUrlBuilder.GLASSDOOR_DAYS) if window else None
+        if days:
+            url += f"&fromAge={days}"
+
+        return url
+
+    @staticmethod
+    def foundit(role, since_time=None):
+        url = f"https://www.foundit.in/srp/results?query={quote_plus(role)}&locations=India"
+
+        window = SearchUrlBuilder.window(since_time)
+        days = SearchUrlBuilder._days_bucket(window, SearchUrlBuilder.FOUNDIT_DAYS) if window else None
+        if days:
+            url += f"&jobFreshness={days}"
+
+        return url
+
+    @staticmethod
+    def indeed(role, since_time=None):
+        # RSS feed, newest first
+        url = f"https://www.indeed.co.in/rss?q={quote_plus(role)}&l=India&sort=date"
+
+        window = SearchUrlBuilder.window(since_time)
+        days = SearchUrlBuilder._days_bucket(window, SearchUrlBuilder.INDEED_DAYS) if window else None
+        if days:
+            url += f"&fromage={days}"
+
+        return url
+
+    @staticmethod
+    def google(query, since_time=None):
+        # tbs=qdr:h<N>: results from the last N hours
+        url = f"https://www.google.com/search?q={quote_plus(query)}"
+
+        window = SearchUrlBuilder.window(since_time)
+        if window:
+            url += f"&tbs=qdr:h{math.ceil(window.total_seconds() / 3600)}"
+
+        return url
+
+
+# Test
+if __name__ == "__main__":
+    role = os.getenv('JOB_ROLES', 'Data Analyst').split(',')[0].strip()
+
+    for label, since_time in [('First run', None),
+                              ('30 min ago', datetime.now() - timedelta(minutes=30)),
+                              ('2 days ago', datetime.now() - timedelta(days=2))]:
+        print(f"\n{label}:")
+        print(f"   LinkedIn:  {SearchUrlBuilder.linkedin(role, since_time)}")
+        print(f"   Naukri:    {SearchUrlBuilder.naukri(role, since_time)}")
+        print(f"   Glassdoor: {SearchUrlBuilder.glassdoor(role, since_time)}")
+        print(f"   Foundit:   {SearchUrlBuilder.foundit(role, since_time)}")
+        print(f"   Indeed:    {SearchUrlBuilder.indeed(role, since_time)}")
+        print(f"   Google:    {SearchUrlBuilder.google(f'{role} job India', since_time)}")
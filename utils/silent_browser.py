@@ -3,7 +3,11 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import WebDriverException, InvalidSessionIdException, NoSuchWindowException
+from urllib3.exceptions import HTTPError as DriverConnectionError
+import atexit
 import os
+import threading
 
 def get_silent_driver():
     """
@@ -54,4 +58,181 @@ def get_silent_driver():
     
     driver = webdriver.Chrome(options=chrome_options, service=service)
     
-    return driver
\ No newline at end of file
+    return driver
+
+
+class PooledDriver:
+    """
+    A warm Chrome session leased from DriverPool
+    
+    Behaves like the underlying WebDriver (attribute access is delegated)
+    but counts page loads so the pool can recycle long-lived sessions.
+    """
+    
+    def __init__(self, driver):
+        self._driver = driver
+        self.pages_loaded = 0
+        self.leases = 0
+    
+    def get(self, url):
+        self.pages_loaded += 1
+        return self._driver.get(url)
+    
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+
+class DriverPool:
+    """Lease warm headless Chrome sessions instead of cold-starting one per scraper"""
+    
+    def __init__(self, max_size=3, max_pages=40, factory=get_silent_driver):
+        """
+        Args:
+            max_size (int): Max Chrome sessions alive at once (leased + idle)
+            max_pages (int): Recycle a session after this many page loads
+            factory (callable): Creates a new raw WebDriver
+        """
+        
+        self.max_size = max(1, max_size)
+        self.max_pages = max_pages
+        self.factory = factory
+        
+        self._idle = []
+        self._size = 0
+        self._cond = threading.Condition()
+        
+        self.created = 0
+        self.reused = 0
+    
+    def lease(self):
+        """Get a warm session, starting Chrome only if none is idle"""
+        
+        with self._cond:
+            while not self._idle and self._size >= self.max_size:
+                self._cond.wait()  # Every session is leased - wait for one back
+            
+            if self._idle:
+                pooled = self._idle.pop()
+                self.reused += 1
+                pooled.leases += 1
+                return pooled
+            
+            self._size += 1
+        
+        try:
+            pooled = PooledDriver(self.factory())
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        
+        self.created += 1
+        pooled.leases += 1
+        return pooled
+    
+    def release(self, pooled, crashed=False):
+        """Return a session; it is reset for the next lease or recycled"""
+        
+        if crashed or pooled.pages_loaded >= self.max_pages or not self._reset(pooled):
+            self._discard(pooled)
+            return
+        
+        with self._cond:
+            self._idle.append(pooled)
+            self._cond.notify()
+    
+    def _reset(self, pooled):
+        """Wipe cookies, storage and extra tabs. Returns False if Chrome is dead."""
+        
+        driver = pooled._driver
+        
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except Exception:
+                pass  # about:blank / opaque origins have no storage
+            
+            try:
+                driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            except Exception:
+                driver.delete_all_cookies()
+            
+            driver.get('about:blank')
+            return True
+            
+        except Exception:
+            return False
+    
+    def _discard(self, pooled):
+        """Quit a session and free its slot"""
+        
+        try:
+            pooled._driver.quit()
+        except Exception:
+            pass
+        
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+    
+    def shutdown(self):
+        """Quit every idle session (leased ones are quit on release)"""
+        
+        with self._cond:
+            idle, self._idle = self._idle, []
+        
+        for pooled in idle:
+            self._discard(pooled)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_driver_pool():
+    """Process-wide driver pool, sized from BROWSER_POOL_SIZE / BROWSER_MAX_PAGES"""
+    
+    global _pool
+    
+    with _pool_lock:
+        if _pool is None:
+            max_size = int(os.getenv('BROWSER_POOL_SIZE', os.getenv('MAX_SCRAPER_WORKERS', 3)))
+            max_pages = int(os.getenv('BROWSER_MAX_PAGES', 40))
+            _pool = DriverPool(max_size=max_size, max_pages=max_pages)
+            atexit.register(_pool.shutdown)
+    
+    return _pool
+
+
+def lease_silent_driver():
+    """Lease a silent Chrome driver from the shared pool"""
+    return get_driver_pool().lease()
+
+
+def is_driver_crash(error):
+    """True if a scraper error means the Chrome session itself is gone"""
+    
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException,
+                          DriverConnectionError, ConnectionError)):
+        return True  # Session killed, or chromedriver no longer answering
+    
+    message = str(error).lower()
+    return isinstance(error, WebDriverException) and any(
+        sign in message for sign in ('chrome not reachable', 'disconnected', 'session deleted', 'tab crashed')
+    )
+
+
+def release_silent_driver(driver, crashed=False):
+    """Give a leased driver back to the pool (plain drivers are just quit)"""
+    
+    if isinstance(driver, PooledDriver):
+        get_driver_pool().release(driver, crashed=crashed)
+    else:
+        driver.quit()